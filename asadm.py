@@ -106,9 +106,11 @@ from lib.base_controller import ShellException
 from lib.live_cluster.live_cluster_root_controller import LiveClusterRootController
 from lib.live_cluster.client import info
 from lib.live_cluster.client.assocket import ASSocket
+from lib.live_cluster.client.cluster import Cluster
+from lib.live_cluster.client.socket_pool import SocketPool
 from lib.live_cluster.client.ssl_context import SSLContext
 from lib.log_analyzer.log_analyzer_root_controller import LogAnalyzerRootController
-from lib.utils import common, util, conf
+from lib.utils import common, util, conf, thread_pool
 from lib.utils.constants import ADMIN_HOME, AdminMode, AuthMode
 from lib.view import terminal, view
 
@@ -679,6 +681,18 @@ def main():
 
     cli_args, seeds = conf.loadconfig(cli_args, logger)
 
+    SocketPool.max_size = cli_args.pool_max_size
+    SocketPool.min_size = cli_args.pool_min_size
+    SocketPool.idle_timeout = cli_args.pool_idle_timeout
+    SocketPool.max_lifetime = cli_args.pool_max_lifetime
+    Cluster.use_async_info = cli_args.async_info
+    Cluster.background_refresh_interval = cli_args.refresh_interval
+
+    try:
+        thread_pool.set_max_workers(cli_args.thread_pool_size)
+    except ValueError as e:
+        logger.critical(str(e))
+
     if cli_args.services_alumni and cli_args.services_alternate:
         logger.critical(
             "Aerospike does not support alternate address for alumni services. Please enable only one of services_alumni or services_alternate."
@@ -0,0 +1,176 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import tempfile
+
+from lib.utils import constants
+
+CACHE_DIR = constants.ADMIN_HOME + "collectinfo_cache/"
+CACHE_MAX_ENTRIES = 32
+CACHE_FILE_EXTENSION = ".pickle"
+
+# Change it whenever the layout of the parsed collectinfo map changes, so
+# development builds which all share one version string do not load stale
+# entries.
+CACHE_FORMAT_VERSION = 4
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class CollectinfoCache(object):
+    """
+    On disk cache of parsed collectinfo maps. Entries are keyed by the
+    names and contents of the input files and the asadm version, so
+    reopening the same bundle skips parsing. At most max_entries entries
+    are kept, the least recently used ones are removed first.
+
+    Failures to read or write the cache are logged and otherwise ignored,
+    the caller parses the files as if there was no cache. Entries are only
+    loaded if they are owned by the current user and not writable by
+    anybody else, unpickling runs arbitrary code.
+    """
+
+    def __init__(self, asadm_version="", cache_dir=CACHE_DIR, max_entries=None):
+        self.asadm_version = asadm_version
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries if max_entries else CACHE_MAX_ENTRIES
+        self.logger = logging.getLogger("asadm")
+
+    def get_key(self, files):
+        """
+        Returns the cache key of the parsed map of files or None if a file
+        can not be read.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            ("%s\0%s\0" % (self.asadm_version, CACHE_FORMAT_VERSION)).encode()
+        )
+
+        try:
+            for path in files:
+                digest.update(
+                    (
+                        "%s\0%s\0" % (os.path.basename(path), os.path.getsize(path))
+                    ).encode()
+                )
+
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+
+        except Exception as e:
+            self.logger.debug("Cannot compute collectinfo cache key: %s" % (e))
+            return None
+
+        return digest.hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, key + CACHE_FILE_EXTENSION)
+
+    @staticmethod
+    def _is_trusted(file_stat):
+        if hasattr(os, "getuid") and file_stat.st_uid != os.getuid():
+            return False
+
+        return not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def load(self, key):
+        """
+        Returns the parsed map stored for key or None if there is none.
+        """
+        if not key:
+            return None
+
+        path = self._get_path(key)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                if not self._is_trusted(os.fstat(f.fileno())):
+                    self.logger.debug(
+                        "Ignoring collectinfo cache %s, it is not owned by the current"
+                        " user or is writable by group or others" % (path)
+                    )
+                    return None
+
+                data = pickle.load(f)
+
+            # Mark as recently used.
+            os.utime(path)
+            return data
+
+        except Exception as e:
+            self.logger.debug("Cannot load collectinfo cache %s: %s" % (path, e))
+
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+
+            return None
+
+    def store(self, key, data):
+        if not key or not data:
+            return
+
+        tmp_path = None
+
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, mode=0o700)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, self._get_path(key))
+            tmp_path = None
+            self._evict()
+
+        except Exception as e:
+            self.logger.debug("Cannot store collectinfo cache: %s" % (e))
+
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _evict(self):
+        entries = []
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_FILE_EXTENSION):
+                continue
+
+            path = os.path.join(self.cache_dir, name)
+
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+
+        entries.sort(reverse=True)
+
+        for _, path in entries[self.max_entries :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
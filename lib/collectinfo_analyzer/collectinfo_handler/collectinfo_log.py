@@ -67,8 +67,39 @@ class _CollectinfoSnapshot(object):
         self.cinfo_data = self.ns_name_fault_check(cinfo_data)
         self.cinfo_file = cinfo_file
         self.node_lookup = LookupDict()
+        self._loaded_sections = set()
         self._initialize_nodes()
 
+    def _load_section(self, name):
+        """
+        Parses as_stat section name for all nodes the first time it is used,
+        if the parser left it for later (see full_parser.LazySection).
+        """
+        if name in self._loaded_sections:
+            return
+
+        self._loaded_sections.add(name)
+        loaded = False
+
+        for node, node_data in self.cinfo_data.items():
+            try:
+                section = node_data["as_stat"][name]
+            except Exception:
+                continue
+
+            if not isinstance(section, full_parser.LazySection):
+                continue
+
+            loaded = True
+
+            try:
+                node_data["as_stat"][name] = section.load(node)
+            except KeyError:
+                del node_data["as_stat"][name]
+
+        if loaded:
+            self.ns_name_fault_check(self.cinfo_data)
+
     def _initialize_nodes(self):
         try:
             self._set_nodes(self.get_node_names())
@@ -99,13 +130,13 @@ class _CollectinfoSnapshot(object):
                 if not "as_stat" in node_data:
                     continue
 
-                if "config" in node_data["as_stat"]:
+                if isinstance(node_data["as_stat"].get("config"), dict):
                     if "namespace" in node_data["as_stat"]["config"]:
                         for ns in value[node]["as_stat"]["config"]["namespace"].keys():
                             if " " in ns:
                                 del value[node]["as_stat"]["config"]["namespace"][ns]
 
-                if "statistics" in node_data["as_stat"]:
+                if isinstance(node_data["as_stat"].get("statistics"), dict):
                     if "namespace" in node_data["as_stat"]["statistics"]:
                         for ns in value[node]["as_stat"]["statistics"][
                             "namespace"
@@ -163,6 +194,8 @@ class _CollectinfoSnapshot(object):
         if not type or not self.cinfo_data:
             return data
 
+        self._load_section(type)
+
         try:
             # return copy.deepcopy(self.cinfo_data[type][stanza])
             for node, node_data in self.cinfo_data.items():
@@ -432,12 +465,25 @@ class _CollectinfoSnapshot(object):
 
 
 class CollectinfoLog(object):
-    def __init__(self, cinfo_path, files, reader):
+    def __init__(self, cinfo_path, files, reader, cache=None):
         self.files = files
         self.reader = reader
         self.snapshots = {}
         self.data = {}
-        full_parser.parse_info_all(files, self.data, True)
+        self._cache = None
+        self._cache_key = None
+
+        if cache:
+            cache_key = cache.get_key(files)
+            self.data = cache.load(cache_key) or {}
+
+            if not self.data:
+                # Stored fully parsed by destroy(), so reopening never parses.
+                self._cache = cache
+                self._cache_key = cache_key
+
+        if not self.data:
+            full_parser.parse_info_all(files, self.data, True, lazy=True)
 
         if self.data:
             for ts in sorted(self.data.keys(), reverse=True):
@@ -452,7 +498,21 @@ class CollectinfoLog(object):
                     # Since we are not dealing with timeseries we should fetch only one snapshot
                     break
 
+    def _store_in_cache(self):
+        cache, self._cache = self._cache, None
+
+        if not cache or not self.data:
+            return
+
+        full_parser.load_lazy_sections(self.data)
+        cache.store(self._cache_key, self.data)
+
     def destroy(self):
+        try:
+            self._store_in_cache()
+        except Exception:
+            pass
+
         try:
             del self.files
             del self.reader
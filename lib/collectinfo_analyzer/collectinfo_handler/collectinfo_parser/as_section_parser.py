@@ -137,6 +137,13 @@ def get_meta_info(imap, meta_map):
             meta_map[node].update(ip_meta[node])
 
 
+def get_nodes(imap):
+    """
+    Returns the ids of the nodes parse_as_section() parses sections for.
+    """
+    return _identify_nodes(imap)
+
+
 def _compare_version(ver2, ver1):
     m1 = re.match(r"(.+)\.(.+)\.(.+)", ver1)
     m2 = re.match(r"(.+)\.(.+)\.(.+)", ver2)
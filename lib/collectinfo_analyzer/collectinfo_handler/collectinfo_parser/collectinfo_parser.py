@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
+import contextlib
 import json
-import re
 import logging
+import mmap
+import os
+import re
 
 from . import section_filter_list
 
@@ -32,6 +34,271 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.CRITICAL)
 
 
+# Section list param with the literal parts of each regex param.
+_LITERALS_PARAM = {"regex_new": "literals_new", "regex_old": "literals_old"}
+
+
+class SectionMatcher(object):
+    """
+    Finds the section a header line starts. Equivalent to calling
+    re.search() with the 'regex' pattern of every section in list order, but
+    patterns are compiled once and only tried on lines containing one of
+    the literals declared for them (see section_filter_list), so most lines
+    are rejected with a few substring checks.
+    """
+
+    def __init__(self, section_list, regex):
+        self.sections = [
+            (
+                section_id,
+                section.get(_LITERALS_PARAM.get(regex)),
+                re.compile(section[regex]),
+            )
+            for section_id, section in section_list.items()
+            if regex in section
+        ]
+
+    def match(self, line):
+        """
+        Returns the id of the first section whose pattern occurs in line or
+        None.
+        """
+        for section_id, literals, pattern in self.sections:
+            if literals is not None:
+                for literal in literals:
+                    if literal in line:
+                        break
+                else:
+                    continue
+
+            if pattern.search(line):
+                return section_id
+
+        return None
+
+
+_FILTER_LIST_MATCHERS = {
+    regex: SectionMatcher(FILTER_LIST, regex) for regex in ("regex_new", "regex_old")
+}
+
+
+def _get_section_matcher(section_list, regex):
+    if section_list is FILTER_LIST:
+        return _FILTER_LIST_MATCHERS[regex]
+
+    return SectionMatcher(section_list, regex)
+
+
+def _split_lines(data):
+    """
+    Decodes a slice of a collectinfo file into lines the way readline() on
+    the file opened in text mode would return them.
+    """
+    text = data.decode("utf-8", "replace")
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    lines = text.split("\n")
+    last = lines.pop()
+    lines = [line + "\n" for line in lines]
+
+    if last:
+        lines.append(last)
+
+    return lines
+
+
+def _scan_sections(buf, section_list, delimiter):
+    """
+    Finds the sections of a collectinfo file with delimiters. Returns the
+    list of (section id or None if not recognized, start, end) with the byte
+    range of each section body and the number of lines which contain the
+    delimiter.
+    """
+    matcher = _get_section_matcher(section_list, "regex_new")
+    delimiter_bytes = delimiter.encode()
+    size = len(buf)
+    sections = []
+    n_section = 0
+    current = None
+    pos = 0
+
+    while True:
+        index = buf.find(delimiter_bytes, pos)
+
+        if index == -1:
+            break
+
+        line_start = buf.rfind(b"\n", 0, index) + 1
+        pos = buf.find(b"\n", index) + 1 or size
+        n_section += 1
+
+        if current:
+            sections.append(current + (line_start,))
+            current = None
+
+        # The section header is one of the next SECTION_DETECTION_LINE_MAX
+        # lines.
+        section_id = None
+        eof = False
+
+        for _ in range(SECTION_DETECTION_LINE_MAX):
+            if pos >= size:
+                eof = True
+                break
+
+            line_end = buf.find(b"\n", pos) + 1 or size
+            line = _split_lines(buf[pos:line_end])[0]
+            pos = line_end
+
+            if delimiter in line:
+                n_section += 1
+
+            # if line is > 300 ignore
+            if len(line) > 300:
+                continue
+
+            section_id = matcher.match(line)
+
+            if section_id:
+                break
+
+        if eof and not section_id:
+            break
+
+        current = (section_id, pos)
+
+    if current:
+        sections.append(current + (size,))
+
+    return sections, n_section
+
+
+class CollectinfoFileIndex(object):
+    """
+    What the analyzer needs to know about a text collectinfo file, found by
+    scanning a read only mmap of it instead of reading it once per question:
+    file type markers, timestamp, delimiter style and, for files with
+    delimiters, the byte range and section id of every section. Everything
+    is computed on first use. Use get_file_index() to share one index per
+    file between file type detection and parsing.
+    """
+
+    HEAD_LINES = 30
+
+    def __init__(self, path):
+        self.path = path
+        self._head = None
+        self._sections = None
+        self._n_section = 0
+
+    @contextlib.contextmanager
+    def buffer(self):
+        with open(self.path, "rb") as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file, it can not be mapped.
+                yield b""
+                return
+
+            try:
+                yield buf
+            finally:
+                buf.close()
+
+    @property
+    def head(self):
+        """
+        First HEAD_LINES lines of the file.
+        """
+        if self._head is None:
+            with self.buffer() as buf:
+                end = 0
+
+                for _ in range(self.HEAD_LINES):
+                    end = buf.find(b"\n", end) + 1
+
+                    if not end:
+                        end = len(buf)
+                        break
+
+                self._head = _split_lines(buf[:end])
+
+        return self._head
+
+    @property
+    def timestamp(self):
+        line = self.head[0] if self.head else ""
+        return line.strip() if "UTC" in line else ""
+
+    def head_contains(self, text):
+        return any(text in line for line in self.head)
+
+    def contains(self, text):
+        with self.buffer() as buf:
+            return buf.find(text.encode()) != -1
+
+    def search(self, pattern):
+        """
+        True if a line of the file matches the regular expression.
+        """
+        with self.buffer() as buf:
+            return re.search(pattern.encode(), buf) is not None
+
+    @property
+    def sections(self):
+        """
+        List of (section id or None if not recognized, start, end) with the
+        byte range of the section body, i.e. the lines after the delimiter
+        and section header lines up to the next delimiter.
+        """
+        if self._sections is None:
+            with self.buffer() as buf:
+                self._sections, self._n_section = _scan_sections(
+                    buf, FILTER_LIST, SECTION_DELIMITER
+                )
+
+        return self._sections
+
+    @property
+    def n_section(self):
+        """
+        Number of lines which contain SECTION_DELIMITER.
+        """
+        self.sections
+        return self._n_section
+
+
+_file_indexes = {}
+
+
+def get_file_index(path):
+    """
+    Returns the CollectinfoFileIndex of a file, reusing the previous one
+    while the file is unchanged and release_file_indexes() was not called.
+    """
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _file_indexes.get(path)
+
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    index = CollectinfoFileIndex(path)
+    _file_indexes[path] = (key, index)
+    return index
+
+
+def release_file_indexes():
+    """
+    Drops the indexes kept by get_file_index(), called when the analyzer
+    closes its collectinfo files.
+    """
+    _file_indexes.clear()
+
+
 def extract_validate_filter_section_from_file(cinfo_path, imap, ignore_exception):
     """
     Parse the collectinfo and convert it into intermediate map form for
@@ -56,6 +323,25 @@ def extract_validate_filter_section_from_file(cinfo_path, imap, ignore_exception
     _imap_remove_disabled_filter_sections(imap)
 
 
+def merge_imap(imap, file_imap, ignore_exception):
+    """
+    Adds the intermediate map of one collectinfo file to imap, the result is
+    the same as extracting the file into imap directly.
+    """
+    for key, sections in file_imap.items():
+        if key in ("section_ids", "cinfo_paths") or key not in imap:
+            imap[key] = imap.get(key, []) + sections
+            continue
+
+        if ignore_exception:
+            imap[key] = imap[key] + sections
+            continue
+
+        # Report collisions with sections of previous files.
+        for section in sections:
+            _update_imap_for_new_cinfo(imap, key, section, SKIP_LIST, ignore_exception)
+
+
 def extract_section_from_live_cmd(command, command_raw_output, imap):
     """
     Parse output of live command and convert it into intermediate map form for
@@ -153,6 +439,8 @@ def _parse_old_collectinfo_to_imap(cinfo_path, section_list, imap, ignore_except
         logger.warning("collectinfo doesn't exist at Path: " + cinfo_path)
         return
 
+    matcher = _get_section_matcher(section_list, "regex_old")
+
     with open(cinfo_path, "r") as cinfo:
 
         current_section_data = []
@@ -175,28 +463,15 @@ def _parse_old_collectinfo_to_imap(cinfo_path, section_list, imap, ignore_except
                 break
 
             # Look for Start New Section
-            found_new_section = False
-            new_section_name = None
-            new_section_id = None
-
-            for section_id in section_list:
-
-                section = section_list[section_id]
-
-                if "regex_old" not in section.keys():
-                    continue
-
-                if re.search(section["regex_old"], fileline):
-                    found_new_section = True
-                    new_section_id = section_id
-                    new_section_name = section["raw_section_name"]
-                    break
+            new_section_id = matcher.match(fileline)
 
             # If new section is found, add current section to imap if
             # it exists. And set current = new
             #
             # If new section is not found add content to current data
-            if found_new_section:
+            if new_section_id:
+                new_section_name = section_list[new_section_id]["raw_section_name"]
+
                 if current_section_name:
                     _update_imap_for_old_cinfo(
                         imap,
@@ -239,131 +514,42 @@ def _parse_new_collectinfo_to_imap(
         logger.warning("collectinfo doesn't exist at path: " + cinfo_path)
         return
 
-    with open(cinfo_path, "r") as cinfo:
+    index = get_file_index(cinfo_path)
 
-        current_section_name = None
-        current_section_data = []
-        current_section_id = 0
+    with index.buffer() as buf:
+        if section_list is FILTER_LIST and delimiter == SECTION_DELIMITER:
+            sections = index.sections
+        else:
+            sections = _scan_sections(buf, section_list, delimiter)[0]
 
-        while True:
+        for section_id, start, end in sections:
+            section_data = _split_lines(buf[start:end])
 
-            try:
-                fileline = cinfo.readline()
-            except UnicodeDecodeError as e:
+            if not section_id:
                 if not ignore_exception:
-                    logger.warning("Error at: " + fileline)
-                    logger.warning(e)
-                continue
-
-            if fileline == "":
-                break
-            regex = "regex_new"
-
-            # Identify 'ASCOLLECTINFO' section
-            if re.search(delimiter, fileline):
-
-                # Update imap at delimiter if current section exists
-                if current_section_name:
-                    _update_imap_for_new_cinfo(
-                        imap,
-                        current_section_name,
-                        current_section_data,
-                        section_skip_list,
-                        ignore_exception,
+                    logger.warning(
+                        "Unknown section detected, printing first few lines:"
+                        + str(section_data[:3])
                     )
-                    imap["section_ids"].append(current_section_id)
-                    current_section_data = []
-                    current_section_name = None
-                    found_new_section = False
-
-                # Search for next section name
-                index = 1
-                section_line = ""
-                while index <= SECTION_DETECTION_LINE_MAX:
-
-                    try:
-                        section_line = cinfo.readline()
-                    except UnicodeDecodeError as e:
-                        if not ignore_exception:
-                            logger.warning("Error at: " + section_line)
-                            logger.warning(e)
-                        continue
-
-                    if section_line == "":
-                        break
-
-                    index = index + 1
-
-                    # if line is > 300 ignore
-                    if len(section_line) > 300:
-                        continue
-
-                    # Check for only two lines after delimiter for filter line
-                    for section_id in section_list:
-                        section = section_list[section_id]
-
-                        # Check if this filter doesn't have regex of same
-                        # version as collectinfo.
-                        if regex not in section.keys():
-                            continue
-
-                        if re.search(section[regex], section_line):
-                            found_new_section = True
-                            new_section_name = section["raw_section_name"]
-                            new_section_id = section_id
-                            break
-                    if found_new_section:
-                        break
-
-                if section_line == "":
-                    break
-
-                if not found_new_section:
-                    if not ignore_exception:
-                        logger.warning(
-                            "Unknown section detected, printing first few lines:"
-                            + str(current_section_data[:3])
-                        )
-                        raise Exception(
-                            "Unknown section detected" + str(current_section_data[:3])
-                        )
-                    continue
-
-                current_section_id = new_section_id
-                current_section_name = new_section_name
-
-            else:
-                if current_section_name:
-                    current_section_data.append(fileline)
+                    raise Exception("Unknown section detected" + str(section_data[:3]))
+                continue
 
-        if current_section_name:
             _update_imap_for_new_cinfo(
                 imap,
-                current_section_name,
-                current_section_data,
+                section_list[section_id]["raw_section_name"],
+                section_data,
                 section_skip_list,
                 ignore_exception,
             )
-            imap["section_ids"].append(current_section_id)
-            current_section_data = []
-            current_section_name = None
+            imap["section_ids"].append(section_id)
 
 
 def get_timestamp_from_file(cinfo_path):
-    timestamp = ""
-    fileline = ""
     if not os.path.exists(cinfo_path):
         logger.warning("collectinfo doesn't exist at Path: " + cinfo_path)
         return
-    with open(cinfo_path, "r") as cinfo:
-        try:
-            fileline = cinfo.readline()
-        except UnicodeDecodeError as e:
-            logger.warning("Error at: " + fileline)
-            logger.warning(e)
-        if "UTC" in fileline:
-            timestamp = fileline.strip()
-    return timestamp
+
+    return get_file_index(cinfo_path).timestamp
 
 
 def _imap_remove_disabled_filter_sections(imap):
@@ -384,53 +570,26 @@ def _imap_remove_disabled_filter_sections(imap):
 
 
 def _collectinfo_has_delimiter(cinfo_path, delimiter):
-    with open(cinfo_path, "r") as cinfo:
-        index = 0
-        fileline = ""
-        while True:
-            try:
-                fileline = cinfo.readline()
-                if fileline == "":
-                    break
-            except UnicodeDecodeError as e:
-                logger.warning("Error at: " + fileline)
-                logger.warning(e)
-                continue
-            # Check only till "COLLECTINFO_START_LINE_MAX" number of lines.
-            if index >= COLLECTINFO_START_LINE_MAX:
-                break
-            if re.search(delimiter, fileline):
-                return True
-            index += 1
-        return False
+    # Check only till "COLLECTINFO_START_LINE_MAX" number of lines.
+    head = get_file_index(cinfo_path).head[:COLLECTINFO_START_LINE_MAX]
+    return any(delimiter in fileline for fileline in head)
 
 
 # Count no of sections in new cinfo file
 
 
 def _get_collectinfo_num_sections(cinfo_path, delimiter):
-    n_section = 0
     if not os.path.exists(cinfo_path):
         logger.warning("collectinfo doesn't exist at path: " + cinfo_path)
         return
 
-    infile = cinfo_path
-    with open(infile, "r") as cinfo:
-        while True:
-            fileline = ""
-            try:
-                fileline = cinfo.readline()
-                if fileline == "":
-                    break
-            except UnicodeDecodeError as e:
-                logger.warning("Error at: " + fileline)
-                logger.warning(e)
-                continue
+    index = get_file_index(cinfo_path)
 
-            if re.search(delimiter, fileline):
-                n_section += 1
+    if delimiter == SECTION_DELIMITER:
+        return index.n_section
 
-    return n_section
+    with index.buffer() as buf:
+        return _scan_sections(buf, FILTER_LIST, delimiter)[1]
 
 
 def _update_imap_for_old_cinfo(imap, key, value, ignore_exception):
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor
 import copy
 from datetime import datetime
+import gzip
 import json
 import logging
 import os
@@ -34,8 +36,37 @@ SYS_SECTION_NAME_LIST = section_filter_list.SYS_SECTION_NAME_LIST
 SECTION_FILTER_LIST = section_filter_list.FILTER_LIST
 DERIVED_SECTION_LIST = section_filter_list.DERIVED_SECTION_LIST
 
+# Inputs smaller than this are parsed in this process, starting worker
+# processes would take longer than parsing them.
+PARALLEL_PARSE_MIN_SIZE = 4 * 1024 * 1024
 
-def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False):
+# as_stat sections parse_info_all() leaves unparsed with lazy=True, and the
+# sections each one is parsed from. config is always parsed, the cluster
+# name is read from it.
+LAZY_AS_SECTIONS = {
+    "statistics": ["statistics", "statistics.dc", "statistics.xdr"],
+    "histogram": HISTOGRAM_SECTION_NAME_LIST,
+    "latency": LATENCY_SECTION_NAME_LIST,
+}
+
+
+def is_collectinfo_json_file(path):
+    return path.endswith(".json") or path.endswith(".json.gz")
+
+
+def _open_collectinfo_json(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+
+    return open(path)
+
+
+def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False, lazy=False):
+    """
+    Parses collectinfo files into parsed_map. With lazy=True the
+    LAZY_AS_SECTIONS of text files are stored as LazySection objects, which
+    parse them for all nodes when one of them is loaded.
+    """
     UNKNOWN_NODE = "UNKNOWN_NODE"
 
     # Get imap
@@ -48,10 +79,10 @@ def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False):
     # IF a valid cinfo json is present in cinfo_paths then append
     # its data in parsed_map.
     for cinfo_path_name in cinfo_paths:
-        if os.path.splitext(cinfo_path_name)[1] == ".json":
+        if is_collectinfo_json_file(cinfo_path_name):
             cinfo_map = {}
             try:
-                with open(cinfo_path_name) as cinfo_json:
+                with _open_collectinfo_json(cinfo_path_name) as cinfo_json:
                     cinfo_map = json.load(cinfo_json, object_hook=_stringify)
             except IOError as e:
                 if not ignore_exception:
@@ -67,27 +98,43 @@ def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False):
                 json_parsed_timestamps = list(cinfo_map.keys())
                 break
 
+    text_paths = [
+        cinfo_path
+        for cinfo_path in cinfo_paths
+        if not is_collectinfo_json_file(cinfo_path)
+        and os.path.splitext(cinfo_path)[1] != ".conf"
+    ]
+    executor = _create_executor(text_paths)
+
+    try:
+        # Sections of the text files are extracted independently, in worker
+        # processes if there is an executor, and merged in file order.
+        file_imaps = _run_tasks(
+            executor,
+            [
+                (_extract_file_imap, (cinfo_path, ignore_exception))
+                for cinfo_path in text_paths
+            ],
+        )
+    finally:
+        if executor:
+            executor.shutdown()
+
     parsed_conf_map = {}
     for cinfo_path in cinfo_paths:
-        if os.path.splitext(cinfo_path)[1] == ".json":
+        if is_collectinfo_json_file(cinfo_path):
             continue
 
         if os.path.splitext(cinfo_path)[1] == ".conf":
             parsed_conf_map = conf_parser.parse_file(cinfo_path)
 
         else:
+            file_timestamp, file_imap = file_imaps.pop(0)
+
             if timestamp == "":
-                timestamp = collectinfo_parser.get_timestamp_from_file(cinfo_path)
-            try:
-                collectinfo_parser.extract_validate_filter_section_from_file(
-                    cinfo_path, imap, ignore_exception
-                )
-            except Exception as e:
-                if not ignore_exception:
-                    logger.error(
-                        "Cinfo parser cannot create intermediate json. Err: " + str(e)
-                    )
-                    raise
+                timestamp = file_timestamp
+
+            collectinfo_parser.merge_imap(imap, file_imap, ignore_exception)
 
     if json_parsed_timestamps:
 
@@ -103,16 +150,45 @@ def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False):
             ignore_exception,
         )
 
+    lazy_sections = []
+    as_section_name_list = AS_SECTION_NAME_LIST
+
+    if lazy:
+        lazy_sections = [
+            name
+            for name, section_name_list in LAZY_AS_SECTIONS.items()
+            if _get_section_list_for_parsing(imap, section_name_list)
+        ]
+        as_section_name_list = [
+            section_name
+            for section_name in AS_SECTION_NAME_LIST
+            if section_name not in LAZY_AS_SECTIONS["statistics"]
+        ]
+
     # get as_map using imap
-    as_map = _get_as_map(imap, AS_SECTION_NAME_LIST, ignore_exception)
+    as_map = _get_as_map(imap, as_section_name_list, ignore_exception)
 
-    # get histogram_map using imap
-    histogram_map = _get_as_map(imap, HISTOGRAM_SECTION_NAME_LIST, ignore_exception)
+    if "statistics" in lazy_sections:
+        # Create the nodes parsing statistics would have created.
+        try:
+            for node in as_section_parser.get_nodes(imap):
+                as_map.setdefault(node, {})
+        except Exception:
+            if not ignore_exception:
+                raise
 
-    # get latency_map using imap
-    latency_map = _convert_parsed_latency_map_to_collectinfo_format(
-        _get_as_map(imap, LATENCY_SECTION_NAME_LIST, ignore_exception)
-    )
+    histogram_map = {}
+    latency_map = {}
+
+    if "histogram" not in lazy_sections:
+        # get histogram_map using imap
+        histogram_map = _get_as_map(imap, HISTOGRAM_SECTION_NAME_LIST, ignore_exception)
+
+    if "latency" not in lazy_sections:
+        # get latency_map using imap
+        latency_map = _convert_parsed_latency_map_to_collectinfo_format(
+            _get_as_map(imap, LATENCY_SECTION_NAME_LIST, ignore_exception)
+        )
 
     # get sys_map using imap
     sys_map = _get_sys_map(imap, ignore_exception)
@@ -220,6 +296,173 @@ def parse_info_all(cinfo_paths, parsed_map, ignore_exception=False):
     if UNKNOWN_NODE in nodemap:
         nodemap.pop(UNKNOWN_NODE, None)
 
+    if lazy_sections:
+        lazy_parser = LazySectionParser(
+            imap, lazy_sections, list(nodemap), ip_to_node_map, ignore_exception
+        )
+
+        for node_data in nodemap.values():
+            if "as_stat" not in node_data:
+                continue
+
+            for name in lazy_sections:
+                node_data["as_stat"][name] = LazySection(lazy_parser, name)
+
+
+class LazySection(object):
+    """
+    Placeholder for an as_stat section of a node, which is parsed together
+    with the same section of all other nodes the first time one is loaded.
+    """
+
+    __slots__ = ("parser", "name")
+
+    def __init__(self, parser, name):
+        self.parser = parser
+        self.name = name
+
+    def load(self, node):
+        """
+        Returns the section of node. Raises KeyError if the collectinfo has
+        none for node, the placeholder should then be removed.
+        """
+        return self.parser.parse(self.name)[node]
+
+
+def load_lazy_sections(parsed_map):
+    """
+    Replaces every LazySection in parsed_map, which has the
+    {timestamp: {cluster: {node: {...}}}} format, with its parsed section.
+    """
+    for clusters in parsed_map.values():
+        if not isinstance(clusters, dict):
+            continue
+
+        for nodes in clusters.values():
+            if not isinstance(nodes, dict):
+                continue
+
+            for node, node_data in nodes.items():
+                try:
+                    sections = node_data["as_stat"]
+                except Exception:
+                    continue
+
+                for name, section in list(sections.items()):
+                    if not isinstance(section, LazySection):
+                        continue
+
+                    try:
+                        sections[name] = section.load(node)
+                    except KeyError:
+                        del sections[name]
+
+
+class LazySectionParser(object):
+    """
+    Parses the LAZY_AS_SECTIONS of one collectinfo from its intermediate
+    map, the way parse_info_all() does, and keeps the results. The
+    intermediate map is released once every section is parsed.
+    """
+
+    def __init__(self, imap, names, nodes, node_ip_mapping, ignore_exception):
+        self.imap = imap
+        self.pending = set(names)
+        self.nodes = nodes
+        self.node_ip_mapping = node_ip_mapping
+        self.ignore_exception = ignore_exception
+        self.sections = {}
+
+    def parse(self, name):
+        """
+        Returns {node: section} for as_stat section name.
+        """
+        if name in self.sections:
+            return self.sections[name]
+
+        section_map = _get_as_map(
+            self.imap, LAZY_AS_SECTIONS[name], self.ignore_exception
+        )
+
+        if name == "latency":
+            section_map = _convert_parsed_latency_map_to_collectinfo_format(
+                section_map
+            )
+
+        nodemap = {node: {} for node in self.nodes}
+        _merge_nodelevel_map_to_mainmap(
+            {"": {"null": nodemap}},
+            section_map,
+            [""],
+            node_ip_mapping=self.node_ip_mapping,
+            keys_after_node_id=["as_stat"],
+        )
+
+        self.sections[name] = {
+            node: node_data["as_stat"][name]
+            for node, node_data in nodemap.items()
+            if name in node_data.get("as_stat", {})
+        }
+        self.pending.discard(name)
+
+        if not self.pending:
+            self.imap = None
+
+        return self.sections[name]
+
+
+def _create_executor(text_paths):
+    """
+    Returns a ProcessPoolExecutor to parse text_paths with or None if they
+    are too small to be worth it or worker processes can not be started.
+    """
+    try:
+        size = sum(os.path.getsize(cinfo_path) for cinfo_path in text_paths)
+    except OSError:
+        return None
+
+    workers = min(os.cpu_count() or 1, len(text_paths))
+
+    if size < PARALLEL_PARSE_MIN_SIZE or workers < 2:
+        return None
+
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except Exception as e:
+        logger.info("Cannot start collectinfo parser processes. Err: " + str(e))
+        return None
+
+
+def _run_tasks(executor, tasks):
+    """
+    Returns the results of the (function, args) tasks in order, running them
+    in executor if it is not None.
+    """
+    if executor:
+        futures = [executor.submit(func, *args) for func, args in tasks]
+        return [future.result() for future in futures]
+
+    return [func(*args) for func, args in tasks]
+
+
+def _extract_file_imap(cinfo_path, ignore_exception):
+    """
+    Returns the timestamp and intermediate map of one collectinfo file.
+    """
+    imap = {}
+    timestamp = collectinfo_parser.get_timestamp_from_file(cinfo_path)
+
+    try:
+        collectinfo_parser.extract_validate_filter_section_from_file(
+            cinfo_path, imap, ignore_exception
+        )
+    except Exception as e:
+        if not ignore_exception:
+            logger.error("Cinfo parser cannot create intermediate json. Err: " + str(e))
+            raise
+
+    return timestamp, imap
+
 
 def parse_aerospike_info_all(cinfo_path, parsed_map, ignore_exception=False):
     # Parse collectinfo and create intermediate section_map
@@ -23,20 +23,27 @@ CMD_PREFIX = "running shell command: "
 #             }
 # Param 'regex_new': regex for collectinfos having delimiter.
 # Param 'regex_old': regex for collectinfos, not having delimiter.
+# Param 'literals_new', 'literals_old': substrings of which at least one occurs in
+#   every line regex_new, regex_old matches. Lines containing none of them are
+#   not searched with the regex. Must be kept in sync with the regex.
 # Param 'collision_allowed': True if multiple sections allowed for same final_section_name
 FILTER_LIST = {
     "ID_1": {
         "enable": True,
         "raw_section_name": "Node",
         "regex_new": r"^Node\n",
-        "regex_old": r"^Node\n"
+        "literals_new": ("Node\n",),
+        "regex_old": r"^Node\n",
+        "literals_old": ("Node\n",),
         # 'parser_func'
     },
     "ID_2": {
         "enable": True,
         "raw_section_name": "Namespace",
         "regex_new": r"^Namespace\n|\['namespace'\]",
-        "regex_old": r"^Namespace\n"
+        "literals_new": ("Namespace\n", "['namespace']"),
+        "regex_old": r"^Namespace\n",
+        "literals_old": ("Namespace\n",),
         # 'parser_func'
     },
     "ID_3": {
@@ -44,7 +51,9 @@ FILTER_LIST = {
         "raw_section_name": "XDR",
         "final_section_name": "xdr_info",
         "regex_new": r"\['xdr'\]|^XDR\n",
+        "literals_new": ("['xdr']", "XDR\n"),
         "regex_old": r"^XDR\n",
+        "literals_old": ("XDR\n",),
         "collision_allowed": True
         # 'parser_func'
     },
@@ -52,7 +61,9 @@ FILTER_LIST = {
         "enable": True,
         "raw_section_name": "SETS",
         "regex_new": r"^SETS\n|\['set'\]",
-        "regex_old": r"^SETS\n"
+        "literals_new": ("SETS\n", "['set']"),
+        "regex_old": r"^SETS\n",
+        "literals_old": ("SETS\n",),
         # 'parser_func'
     },
     "ID_5": {
@@ -60,7 +71,9 @@ FILTER_LIST = {
         "raw_section_name": "printconfig",
         "final_section_name": "config",
         "regex_new": r"printconfig|\['config'\]",
-        "regex_old": r"^printconfig\n"
+        "literals_new": ("printconfig", "['config']"),
+        "regex_old": r"^printconfig\n",
+        "literals_old": ("printconfig\n",),
         # 'parser_func'
     },
     "ID_6": {
@@ -68,7 +81,8 @@ FILTER_LIST = {
         "raw_section_name": "config_xdr",
         "final_section_name": "xdr",
         "parent_section_name": "config",
-        "regex_new": r"\['config', 'xdr'\]"
+        "regex_new": r"\['config', 'xdr'\]",
+        "literals_new": ("['config', 'xdr']",),
         # 'parser_func'
     },
     "ID_7": {
@@ -77,18 +91,22 @@ FILTER_LIST = {
         "final_section_name": "dc",
         "parent_section_name": "config",
         "regex_new": r"\['config', 'dc'\]",
+        "literals_new": ("['config', 'dc']",),
     },
     "ID_8": {
         "enable": True,
         "raw_section_name": "compareconfig",
         "regex_new": "compareconfig",
-        "regex_old": r"^compareconfig\n"
+        "literals_new": ("compareconfig",),
+        "regex_old": r"^compareconfig\n",
+        "literals_old": ("compareconfig\n",),
         # 'parser_func'
     },
     "ID_9": {
         "enable": True,
         "raw_section_name": "config_diff",
         "regex_new": r"\['config', 'diff'\]",
+        "literals_new": ("['config', 'diff']",),
         # 'parser_func'
     },
     "ID_10": {
@@ -96,7 +114,9 @@ FILTER_LIST = {
         "raw_section_name": "latency",
         "final_section_name": "latency",
         "regex_new": "latency",
-        "regex_old": r"^latency\n"
+        "literals_new": ("latency",),
+        "regex_old": r"^latency\n",
+        "literals_old": ("latency\n",),
         # 'parser_func'
     },
     "ID_11": {
@@ -105,7 +125,9 @@ FILTER_LIST = {
         "raw_section_name": "statistics",
         "final_section_name": "statistics",
         "regex_new": r"^stat\n|\['statistics'\]|\"stat\"",
-        "regex_old": r"^stat\n"
+        "literals_new": ("stat\n", "['statistics']", '"stat"'),
+        "regex_old": r"^stat\n",
+        "literals_old": ("stat\n",),
         # 'parser_func'
     },
     "ID_12": {
@@ -114,6 +136,7 @@ FILTER_LIST = {
         "final_section_name": "xdr",
         "parent_section_name": "statistics",
         "regex_new": r"\['statistics', 'xdr'\]",
+        "literals_new": ("['statistics', 'xdr']",),
         # 'parser_func'
     },
     "ID_13": {
@@ -122,6 +145,7 @@ FILTER_LIST = {
         "final_section_name": "dc",
         "parent_section_name": "statistics",
         "regex_new": r"\['statistics', 'dc'\]",
+        "literals_new": ("['statistics', 'dc']",),
         # 'parser_func'
     },
     # Section was inside statistics earlier, check final_section_name.
@@ -133,13 +157,16 @@ FILTER_LIST = {
         "final_section_name": "sindex",
         "parent_section_name": "statistics",
         "regex_new": r"\['statistics', 'sindex'\]",
+        "literals_new": ("['statistics', 'sindex']",),
         # 'parser_func'
     },
     "ID_15": {
         "enable": True,
         "raw_section_name": "objsz",
         "regex_new": r"^objsz\n|-v objsz",
-        "regex_old": r"^objsz\n"
+        "literals_new": ("objsz\n", "-v objsz"),
+        "regex_old": r"^objsz\n",
+        "literals_old": ("objsz\n",),
         # 'parser_func'
     },
     "ID_16": {
@@ -149,28 +176,36 @@ FILTER_LIST = {
         #'regex_new': 'ttl',
         #'regex_new': "[INFO] Data collection for ['distribution'] in progress..",
         "regex_new": r"^ttl\n|-v ttl",
-        "regex_old": r"^ttl\n"
+        "literals_new": ("ttl\n", "-v ttl"),
+        "regex_old": r"^ttl\n",
+        "literals_old": ("ttl\n",),
         # 'parser_func'
     },
     "ID_17": {
         "enable": True,
         "raw_section_name": "evict",
         "regex_new": r"^evict\n|-v evict",
-        "regex_old": r"^evict\n"
+        "literals_new": ("evict\n", "-v evict"),
+        "regex_old": r"^evict\n",
+        "literals_old": ("evict\n",),
         # 'parser_func'
     },
     "ID_18": {
         "enable": True,
         "raw_section_name": "NAMESPACE STATS",
         "regex_new": "^NAMESPACE STATS\n",
-        "regex_old": "^NAMESPACE STATS\n"
+        "literals_new": ("NAMESPACE STATS\n",),
+        "regex_old": "^NAMESPACE STATS\n",
+        "literals_old": ("NAMESPACE STATS\n",),
         # 'parser_func'
     },
     "ID_19": {
         "enable": True,
         "raw_section_name": "XDR STATS",
         "regex_new": "^XDR STATS\n",
-        "regex_old": "^XDR STATS\n"
+        "literals_new": ("XDR STATS\n",),
+        "regex_old": "^XDR STATS\n",
+        "literals_old": ("XDR STATS\n",),
         # 'parser_func'
     },
     "ID_20": {
@@ -178,15 +213,23 @@ FILTER_LIST = {
         "enable": False,
         "raw_section_name": "sudo lsof|grep `sudo ps aux|grep -v grep|grep -E 'asd|cld'|awk '{print $2}'`",
         "regex_new": "sudo lsof[|]grep `sudo ps aux[|]grep -v grep[|]grep -E 'asd[|]cld'[|]awk '[{]print [$]2[}]'`",
+        "literals_new": (
+            "sudo lsof|grep `sudo ps aux|grep -v grep|grep -E 'asd|cld'|awk '{print $2}'`",
+        ),
         "regex_old": CMD_PREFIX
-        + "sudo lsof[|]grep `sudo ps aux[|]grep -v grep[|]grep -E 'asd[|]cld'[|]awk '[{]print [$]2[}]'`"
+        + "sudo lsof[|]grep `sudo ps aux[|]grep -v grep[|]grep -E 'asd[|]cld'[|]awk '[{]print [$]2[}]'`",
+        "literals_old": (
+            CMD_PREFIX + "sudo lsof|grep `sudo ps aux|grep -v grep|grep -E 'asd|cld'|awk '{print $2}'`",
+        ),
         # 'parser_func'
     },
     "ID_21": {
         "enable": True,
         "raw_section_name": "date",
         "regex_new": "date",
-        "regex_old": CMD_PREFIX + "date"
+        "literals_new": ("date",),
+        "regex_old": CMD_PREFIX + "date",
+        "literals_old": (CMD_PREFIX + "date",),
         # 'parser_func'
     },
     "ID_22": {
@@ -194,14 +237,18 @@ FILTER_LIST = {
         "raw_section_name": "hostname",
         "final_section_name": "hostname",
         "regex_new": "hostname",
-        "regex_old": CMD_PREFIX + "hostname"
+        "literals_new": ("hostname",),
+        "regex_old": CMD_PREFIX + "hostname",
+        "literals_old": (CMD_PREFIX + "hostname",),
         # 'parser_func'
     },
     "ID_23": {
         "enable": True,
         "raw_section_name": "ifconfig",
         "regex_new": "ifconfig",
-        "regex_old": CMD_PREFIX + "ifconfig"
+        "literals_new": ("ifconfig",),
+        "regex_old": CMD_PREFIX + "ifconfig",
+        "literals_old": (CMD_PREFIX + "ifconfig",),
         # 'parser_func'
     },
     "ID_24": {
@@ -209,7 +256,9 @@ FILTER_LIST = {
         "raw_section_name": "uname -a",
         "final_section_name": "uname",
         "regex_new": "uname -a",
-        "regex_old": CMD_PREFIX + "uname -a"
+        "literals_new": ("uname -a",),
+        "regex_old": CMD_PREFIX + "uname -a",
+        "literals_old": (CMD_PREFIX + "uname -a",),
         # 'parser_func'
     },
     "ID_25": {
@@ -217,7 +266,9 @@ FILTER_LIST = {
         "raw_section_name": "lsb_release_1",
         "final_section_name": "lsb",
         "regex_new": "lsb_release -a",
-        "regex_old": CMD_PREFIX + "lsb_release -a"
+        "literals_new": ("lsb_release -a",),
+        "regex_old": CMD_PREFIX + "lsb_release -a",
+        "literals_old": (CMD_PREFIX + "lsb_release -a",),
         # 'parser_func'
     },
     # Two sections having lsb, they both could occure in file.
@@ -226,7 +277,9 @@ FILTER_LIST = {
         "raw_section_name": "lsb_release_2",
         "final_section_name": "lsb",
         "regex_new": "ls /etc[|]grep release[|]xargs -I f cat /etc/f",
-        "regex_old": CMD_PREFIX + "ls /etc[|]grep release[|]xargs -I f cat /etc/f"
+        "literals_new": ("ls /etc|grep release|xargs -I f cat /etc/f",),
+        "regex_old": CMD_PREFIX + "ls /etc[|]grep release[|]xargs -I f cat /etc/f",
+        "literals_old": (CMD_PREFIX + "ls /etc|grep release|xargs -I f cat /etc/f",),
         # 'parser_func'
     },
     "ID_27": {
@@ -234,7 +287,9 @@ FILTER_LIST = {
         "raw_section_name": "build rpm",
         "final_section_name": "build",
         "regex_new": 'rpm -qa[|]grep -E "citrus[|]aero"',
-        "regex_old": CMD_PREFIX + 'rpm -qa[|]grep -E "citrus[|]aero"'
+        "literals_new": ('rpm -qa|grep -E "citrus|aero"',),
+        "regex_old": CMD_PREFIX + 'rpm -qa[|]grep -E "citrus[|]aero"',
+        "literals_old": (CMD_PREFIX + 'rpm -qa|grep -E "citrus|aero"',),
         # 'parser_func'
     },
     "ID_28": {
@@ -242,56 +297,72 @@ FILTER_LIST = {
         "raw_section_name": "build dpkg",
         "final_section_name": "build",
         "regex_new": 'dpkg -l[|]grep -E "citrus[|]aero"',
-        "regex_old": CMD_PREFIX + 'dpkg -l[|]grep -E "citrus[|]aero"'
+        "literals_new": ('dpkg -l|grep -E "citrus|aero"',),
+        "regex_old": CMD_PREFIX + 'dpkg -l[|]grep -E "citrus[|]aero"',
+        "literals_old": (CMD_PREFIX + 'dpkg -l|grep -E "citrus|aero"',),
         # 'parser_func'
     },
     "ID_29": {
         "enable": False,
         "raw_section_name": "aero_log",
         "regex_new": "tail -n 10* .*aerospike.log",
-        "regex_old": CMD_PREFIX + "tail -n 10* .*aerospike.log"
+        "literals_new": ("tail -n 1",),
+        "regex_old": CMD_PREFIX + "tail -n 10* .*aerospike.log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_30": {
         "enable": False,
         "raw_section_name": "citrus_log",
         "regex_new": "tail -n 10* .*citrusleaf.log",
-        "regex_old": CMD_PREFIX + "tail -n 10* .*citrusleaf.log"
+        "literals_new": ("citrusleaf",),
+        "regex_old": CMD_PREFIX + "tail -n 10* .*citrusleaf.log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_31": {
         "enable": False,
         "raw_section_name": "All aerospike/*.log",
         "regex_new": "tail -n 10* .*aerospike/[*].log",
+        "literals_new": ("aerospike/*",),
         "regex_old": CMD_PREFIX + "tail -n 10* .*aerospike/[*].log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_32": {
         "enable": False,
         "raw_section_name": "Udf log",
         "regex_new": "tail -n 10* .*aerospike/udf.log",
+        "literals_new": ("aerospike/udf",),
         "regex_old": CMD_PREFIX + "tail -n 10* .*aerospike/*.log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_33": {
         "enable": False,
         "raw_section_name": "All citrusleaf/*.log",
         "regex_new": "tail -n 10* .*citrusleaf/[*].log",
+        "literals_new": ("citrusleaf/*",),
         "regex_old": CMD_PREFIX + "tail -n 10* .*citrusleaf/[*].log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_34": {
         "enable": False,
         "raw_section_name": "xdr_log",
         "regex_new": "tail -n 10* /var/log/.*xdr.log",
-        "regex_old": CMD_PREFIX + "tail -n 10* /var/log/.*xdr.log"
+        "literals_new": (" /var/log/",),
+        "regex_old": CMD_PREFIX + "tail -n 10* /var/log/.*xdr.log",
+        "literals_old": (CMD_PREFIX + "tail -n 1",),
         # 'parser_func'
     },
     "ID_35": {
         "enable": True,
         "raw_section_name": "netstat -pant|grep 3000",
         "regex_new": "netstat -pant[|]grep 3000|^netstat\n",
-        "regex_old": CMD_PREFIX + "netstat -pant[|]grep 3000"
+        "literals_new": ("netstat -pant|grep 3000", "netstat\n"),
+        "regex_old": CMD_PREFIX + "netstat -pant[|]grep 3000",
+        "literals_old": (CMD_PREFIX + "netstat -pant|grep 3000",),
         # 'parser_func'
     },
     "ID_36": {
@@ -299,7 +370,9 @@ FILTER_LIST = {
         "raw_section_name": "top -n3 -b",
         "final_section_name": "top",
         "regex_new": "top -n3 -b",
-        "regex_old": CMD_PREFIX + "top -n3 -b"
+        "literals_new": ("top -n3 -b",),
+        "regex_old": CMD_PREFIX + "top -n3 -b",
+        "literals_old": (CMD_PREFIX + "top -n3 -b",),
         # 'parser_func'
     },
     "ID_37": {
@@ -307,7 +380,9 @@ FILTER_LIST = {
         "raw_section_name": "free -m",
         "final_section_name": "free-m",
         "regex_new": "free -m",
-        "regex_old": CMD_PREFIX + "free -m"
+        "literals_new": ("free -m",),
+        "regex_old": CMD_PREFIX + "free -m",
+        "literals_old": (CMD_PREFIX + "free -m",),
         # 'parser_func'
     },
     "ID_38": {
@@ -315,7 +390,9 @@ FILTER_LIST = {
         "raw_section_name": "df -h",
         "final_section_name": "df",
         "regex_new": "df -h",
-        "regex_old": CMD_PREFIX + "df -h"
+        "literals_new": ("df -h",),
+        "regex_old": CMD_PREFIX + "df -h",
+        "literals_old": (CMD_PREFIX + "df -h",),
         # 'parser_func'
     },
     "ID_39": {
@@ -323,23 +400,37 @@ FILTER_LIST = {
         #'raw_section_name': 'ls /sys/block/{sd*,xvd*}/queue/rotational |xargs -I f sh -c "echo f; cat f',
         "raw_section_name": "rotational_disk_info",
         "regex_new": 'ls /sys/block/{sd[*],xvd[*]}/queue/rotational [|]xargs -I f sh -c "echo f; cat f;"',
+        "literals_new": (
+            'ls /sys/block/{sd*,xvd*}/queue/rotational |xargs -I f sh -c "echo f; cat f;"',
+        ),
         "regex_old": CMD_PREFIX
-        + 'ls /sys/block/sd[*]/queue/rotational [|]xargs -I f sh -c "echo f; cat f;"'
+        + 'ls /sys/block/sd[*]/queue/rotational [|]xargs -I f sh -c "echo f; cat f;"',
+        "literals_old": (
+            CMD_PREFIX + 'ls /sys/block/sd*/queue/rotational |xargs -I f sh -c "echo f; cat f;"',
+        ),
         # 'parser_fun'
     },
     "ID_40": {
         "enable": True,
         "raw_section_name": "ls /sys/block/{sd*,xvd*}/device/model",
         "regex_new": 'ls /sys/block/{sd[*],xvd[*]}/device/model [|]xargs -I f sh -c "echo f; cat f;"',
+        "literals_new": (
+            'ls /sys/block/{sd*,xvd*}/device/model |xargs -I f sh -c "echo f; cat f;"',
+        ),
         "regex_old": CMD_PREFIX
         + 'ls /sys/block/{sd[*],xvd[*]}/device/model [|]xargs -I f sh -c "echo f; cat f;"',
+        "literals_old": (
+            CMD_PREFIX + 'ls /sys/block/{sd*,xvd*}/device/model |xargs -I f sh -c "echo f; cat f;"',
+        ),
         # 'parser_func':
     },
     "ID_41": {
         "enable": False,
         "raw_section_name": "lsof",
         "regex_new": "(?=.*lsof)(?!.*grep)",
-        "regex_old": CMD_PREFIX + "(?=.*lsof)(?!.*grep)"
+        "literals_new": ("lsof",),
+        "regex_old": CMD_PREFIX + "(?=.*lsof)(?!.*grep)",
+        "literals_old": (CMD_PREFIX,),
         # 'parser_func':
     },
     "ID_42": {
@@ -347,7 +438,9 @@ FILTER_LIST = {
         "raw_section_name": "dmesg",
         "final_section_name": "dmesg",
         "regex_new": "dmesg",
-        "regex_old": CMD_PREFIX + "dmesg"
+        "literals_new": ("dmesg",),
+        "regex_old": CMD_PREFIX + "dmesg",
+        "literals_old": (CMD_PREFIX + "dmesg",),
         # 'parser_func':
     },
     "ID_43": {
@@ -355,48 +448,61 @@ FILTER_LIST = {
         "raw_section_name": "iostat -x",
         "final_section_name": "iostat",
         "regex_new": "iostat -x 1 10",
-        "regex_old": CMD_PREFIX + "iostat -x|iostat -x 1 10"
+        "literals_new": ("iostat -x 1 10",),
+        "regex_old": CMD_PREFIX + "iostat -x|iostat -x 1 10",
+        "literals_old": (CMD_PREFIX + "iostat -x", "iostat -x 1 10"),
         # 'parser_func':
     },
     "ID_44": {
         "enable": True,
         "raw_section_name": "vmstat -s",
         "regex_new": "vmstat -s",
+        "literals_new": ("vmstat -s",),
         "regex_old": CMD_PREFIX + "vmstat -s",
+        "literals_old": (CMD_PREFIX + "vmstat -s",),
         # 'parser_func':
     },
     "ID_45": {
         "enable": True,
         "raw_section_name": "vmstat -m",
         "regex_new": "vmstat -m",
+        "literals_new": ("vmstat -m",),
         "regex_old": CMD_PREFIX + "vmstat -m",
+        "literals_old": (CMD_PREFIX + "vmstat -m",),
         # 'parser_func':
     },
     "ID_46": {
         "enable": True,
         "raw_section_name": "iptables -L",
         "regex_new": "iptables -L",
+        "literals_new": ("iptables -L",),
         "regex_old": CMD_PREFIX + "iptables -L",
+        "literals_old": (CMD_PREFIX + "iptables -L",),
         # 'parser_func':
     },
     "ID_47": {
         "enable": True,
         "raw_section_name": "aero_conf",
         "regex_new": "cat /etc/aerospike/aerospike.conf",
-        "regex_old": CMD_PREFIX + "cat /etc/aerospike/aerospike.conf"
+        "literals_new": ("cat /etc/aerospike/aerospike",),
+        "regex_old": CMD_PREFIX + "cat /etc/aerospike/aerospike.conf",
+        "literals_old": (CMD_PREFIX + "cat /etc/aerospike/aerospike",),
         # 'parser_func':
     },
     "ID_48": {
         "enable": True,
         "raw_section_name": "citrus_conf",
         "regex_new": "cat /etc/citrusleaf/citrusleaf.conf",
-        "regex_old": CMD_PREFIX + "cat /etc/citrusleaf/citrusleaf.conf"
+        "literals_new": ("cat /etc/citrusleaf/citrusleaf",),
+        "regex_old": CMD_PREFIX + "cat /etc/citrusleaf/citrusleaf.conf",
+        "literals_old": (CMD_PREFIX + "cat /etc/citrusleaf/citrusleaf",),
         # 'parser_func':
     },
     "ID_49": {
         "enable": True,
         "raw_section_name": "info_network",
         "regex_new": "'network'",
+        "literals_new": ("'network'",),
         "collision_allowed": True
         # 'parser_func':
     },
@@ -404,7 +510,8 @@ FILTER_LIST = {
         "enable": True,
         "raw_section_name": "info_service table",
         #'regex_new': '(?=.*service)(?!.*services)',
-        "regex_new": "'service'"
+        "regex_new": "'service'",
+        "literals_new": ("'service'",),
         # 'parser_func':
     },
     "ID_51": {
@@ -412,6 +519,7 @@ FILTER_LIST = {
         "raw_section_name": "info_sindex",
         "final_section_name": "sindex_info",
         "regex_new": r"\['sindex'\]",
+        "literals_new": ("['sindex']",),
         # 'parser_func':
     },
     # This is technically a ttl section, of different format
@@ -419,18 +527,21 @@ FILTER_LIST = {
         "enable": True,
         "raw_section_name": "info_ttl_distribution_2",
         "regex_new": r"\['distribution'\]",
+        "literals_new": ("['distribution']",),
         # 'parser_func':
     },
     "ID_53": {
         "enable": True,
         "raw_section_name": "info_eviction_distribution_2",
         "regex_new": r"\['distribution', 'eviction'\]",
+        "literals_new": ("['distribution', 'eviction']",),
         # 'parser_func':
     },
     "ID_54": {
         "enable": True,
         "raw_section_name": "info_objectsz_distribution_2",
         "regex_new": r"\['distribution', 'object_size', '-b'\]",
+        "literals_new": ("['distribution', 'object_size', '-b']",),
         # 'parser_func':
     },
     "ID_55": {
@@ -441,6 +552,7 @@ FILTER_LIST = {
         #'regex_new': '[INFO] Data collection for service in progress..',
         #'regex_new': "service\n|(?=.*service)(?!.*(services|'service'))"
         "regex_new": "service\n|for service in",
+        "literals_new": ("service\n", "for service in"),
         # 'parser_func':
     },
     "ID_56": {
@@ -448,84 +560,98 @@ FILTER_LIST = {
         "raw_section_name": "info_services",
         "final_section_name": "services",
         "regex_new": "services\n| for services in",
+        "literals_new": ("services\n", " for services in"),
         # 'parser_func':
     },
     "ID_57": {
         "enable": True,
         "raw_section_name": "info_xdr-min-lastshipinfo",
         "regex_new": "xdr-min-lastshipinfo:",
+        "literals_new": ("xdr-min-lastshipinfo:",),
         # 'parser_func':
     },
     "ID_58": {
         "enable": True,
         "raw_section_name": "info_dump-fabric",
         "regex_new": "dump-fabric:",
+        "literals_new": ("dump-fabric:",),
         # 'parser_func':
     },
     "ID_59": {
         "enable": True,
         "raw_section_name": "info_dump-hb:",
         "regex_new": "dump-hb:",
+        "literals_new": ("dump-hb:",),
         # 'parser_func':
     },
     "ID_60": {
         "enable": True,
         "raw_section_name": "info_dump-migrates:",
         "regex_new": "dump-migrates:",
+        "literals_new": ("dump-migrates:",),
         # 'parser_func':
     },
     "ID_61": {
         "enable": True,
         "raw_section_name": "info_dump-msgs:",
         "regex_new": "dump-msgs:",
+        "literals_new": ("dump-msgs:",),
         # 'parser_func':
     },
     "ID_62": {
         "enable": True,
         "raw_section_name": "info_dump-paxos:",
         "regex_new": "dump-paxos:",
+        "literals_new": ("dump-paxos:",),
         # 'parser_func':
     },
     "ID_63": {
         "enable": True,
         "raw_section_name": "info_dump-smd:",
         "regex_new": "dump-smd:",
+        "literals_new": ("dump-smd:",),
         # 'parser_func':
     },
     "ID_64": {
         "enable": True,
         "raw_section_name": "info_dump-wb:",
         "regex_new": "dump-wb:",
+        "literals_new": ("dump-wb:",),
         # 'parser_func':
     },
     "ID_65": {
         "enable": True,
         "raw_section_name": "info_infodump-wb-summary",
         "regex_new": "dump-wb-summary:",
+        "literals_new": ("dump-wb-summary:",),
         # 'parser_func':
     },
     "ID_66": {
         "enable": True,
         "raw_section_name": "info_dump-wr",
         "regex_new": "dump-wr:",
+        "literals_new": ("dump-wr:",),
         # 'parser_func':
     },
     "ID_67": {
         "enable": True,
         "raw_section_name": "info_sindex-dump:",
         "regex_new": "sindex-dump:",
+        "literals_new": ("sindex-dump:",),
         # 'parser_func':
     },
     "ID_68": {
         "enable": True,
         "raw_section_name": "info_uptime",
         "regex_new": "uptime",
+        "literals_new": ("uptime",),
         # 'parser_func':
     },
     "ID_69": {
         "enable": True,
         "raw_section_name": "info_collect_sys",
         "regex_new": "collect_sys",
+        "literals_new": ("collect_sys",),
         # 'parser_func':
     },
     "ID_70": {
@@ -533,91 +659,107 @@ FILTER_LIST = {
         "raw_section_name": "info_get_awsdata",
         "final_section_name": "awsdata",
         "regex_new": "get_awsdata",
+        "literals_new": ("get_awsdata",),
         # 'parser_func':
     },
     "ID_71": {
         "enable": True,
         "raw_section_name": "info_stderr",
-        "regex_new": "tail -n 10* stderr"
+        "regex_new": "tail -n 10* stderr",
+        "literals_new": ("tail -n 1",),
         # 'parser_func':
     },
     "ID_72": {
         "enable": True,
         "raw_section_name": "info_ip addr",
         "final_section_name": "ip_addr",
-        "regex_new": "ip addr"
+        "regex_new": "ip addr",
+        "literals_new": ("ip addr",),
         # 'parser_func':
     },
     "ID_73": {
         "enable": True,
         "raw_section_name": "info_ip_link",
         "regex_new": "ip -s link",
+        "literals_new": ("ip -s link",),
         # 'parser_func'
     },
     "ID_74": {
         "enable": True,
         "raw_section_name": "ss -pant",
         "regex_new": r"\['ss -pant'\]",
+        "literals_new": ("['ss -pant']",),
         # 'parser_func'
     },
     "ID_75": {
         "enable": True,
         "raw_section_name": "ss -pant | grep .* | grep TIME-WAIT | wc -l",
         "regex_new": "ss -pant [|] grep .* [|] grep TIME-WAIT [|] wc -l",
+        "literals_new": (" | grep TIME-WAIT | wc -l",),
         # 'parser_func'
     },
     "ID_76": {
         "enable": True,
         "raw_section_name": "ss -pant | grep .* | grep CLOSE-WAIT | wc -l",
         "regex_new": "ss -pant [|] grep .* [|] grep CLOSE-WAIT [|] wc -l",
+        "literals_new": (" | grep CLOSE-WAIT | wc -l",),
         # 'parser_func'
     },
     "ID_77": {
         "enable": True,
         "raw_section_name": "ss -pant | grep .* | grep ESTAB | wc -l",
         "regex_new": "ss -pant [|] grep .* [|] grep ESTAB [|] wc -l",
+        "literals_new": (" | grep ESTAB | wc -l",),
         # 'parser_func'
     },
     "ID_78": {
         "enable": True,
         "raw_section_name": "sar -n EDEV",
         "regex_new": "sar -n EDEV",
+        "literals_new": ("sar -n EDEV",),
         # 'parser_func'
     },
     "ID_79": {
         "enable": True,
         "raw_section_name": "sar -n DEV",
         "regex_new": "sar -n DEV",
+        "literals_new": ("sar -n DEV",),
     },
     "ID_80": {
         "enable": False,
         "raw_section_name": "obfuscated",
         "regex_new": "obfuscated",
+        "literals_new": ("obfuscated",),
         # 'parser_func'
     },
     "ID_81": {
         "enable": False,
         "raw_section_name": "aerospike_critical.log",
         "regex_new": "tail -n 10* .*aerospike/aerospike_critical.log",
+        "literals_new": ("aerospike/aerospike_critical",),
         # 'parser_func'
     },
     "ID_82": {
         "enable": False,
         "raw_section_name": "log messages",
         "regex_new": "cat /var/log/messages",
+        "literals_new": ("cat /var/log/messages",),
         # 'parser_func'
     },
     "ID_83": {
         "enable": True,
         "raw_section_name": "Running with Force on Offline Aerospike Server",
         "regex_new": "Running with Force on Offline Aerospike Server",
+        "literals_new": ("Running with Force on Offline Aerospike Server",),
         "regex_old": "Running with Force on Offline Aerospike Server",
+        "literals_old": ("Running with Force on Offline Aerospike Server",),
         # 'parser_func'
     },
     "ID_84": {
         "enable": True,
         "raw_section_name": "sysctl",
         "regex_new": 'sudo sysctl -a [|] grep -E "shmmax[|]file-max[|]maxfiles"',
+        "literals_new": ('sudo sysctl -a | grep -E "shmmax|file-max|maxfiles"',),
         # 'parser_func'
     },
     "ID_85": {
@@ -626,12 +768,14 @@ FILTER_LIST = {
         "raw_section_name": "Request metadata",
         "final_section_name": "awsdata",
         "regex_new": "Requesting... http://",
+        "literals_new": ("Requesting",),
         # 'parser_func'
     },
     "ID_86": {
         "enable": True,
         "raw_section_name": "DC info",
         "regex_new": r"\['dc'\]",
+        "literals_new": ("['dc']",),
         # 'parser_func'
     },
     "ID_87": {
@@ -639,37 +783,43 @@ FILTER_LIST = {
         "raw_section_name": "features",
         "final_section_name": "features",
         "regex_new": "'features'",
+        "literals_new": ("'features'",),
         # 'parser_func'
     },
     "ID_88": {
         "enable": True,
         "raw_section_name": "mpstat -P ALL 2 3",
         "regex_new": "mpstat -P ALL 2 3",
+        "literals_new": ("mpstat -P ALL 2 3",),
         # 'parser_func'
     },
     "ID_89": {
         "enable": True,
         "raw_section_name": "cpuinfo",
-        "regex_new": r"\['cpuinfo'\]|^cat /proc/cpuinfo\n"
+        "regex_new": r"\['cpuinfo'\]|^cat /proc/cpuinfo\n",
+        "literals_new": ("['cpuinfo']", "cat /proc/cpuinfo\n"),
         # 'parser_func'
     },
     "ID_90": {
         "enable": True,
         "raw_section_name": "ASD stats",
-        "regex_new": r"^ASD STATS\n"
+        "regex_new": r"^ASD STATS\n",
+        "literals_new": ("ASD STATS\n",),
         # 'parser_func'
     },
     "ID_91": {
         "enable": True,
         "raw_section_name": "aerospike profiling conf",
-        "regex_new": "cat /etc/aerospike/aerospike_profiling.conf"
+        "regex_new": "cat /etc/aerospike/aerospike_profiling.conf",
+        "literals_new": ("cat /etc/aerospike/aerospike_profiling",),
         # 'parser_func'
     },
     "ID_92": {
         "enable": True,
         "raw_section_name": "meminfo_kb",
         "final_section_name": "meminfo",
-        "regex_new": "cat /proc/meminfo"
+        "regex_new": "cat /proc/meminfo",
+        "literals_new": ("cat /proc/meminfo",),
         # 'parser_func'
     },
     "ID_93": {
@@ -677,30 +827,35 @@ FILTER_LIST = {
         "raw_section_name": "interrupts",
         "final_section_name": "interrupts",
         "regex_new": "cat /proc/interrupts",
+        "literals_new": ("cat /proc/interrupts",),
         # 'parser_func'
     },
     "ID_94": {
         "enable": True,
         "raw_section_name": "asadm version",
-        "regex_new": "asadm version"
+        "regex_new": "asadm version",
+        "literals_new": ("asadm version",),
         # 'parser_func'
     },
     "ID_95": {
         "enable": True,
         "raw_section_name": "pmap",
-        "regex_new": r"\['pmap'\]"
+        "regex_new": r"\['pmap'\]",
+        "literals_new": ("['pmap']",),
         # 'parser_func'
     },
     "ID_96": {
         "enable": True,
         "raw_section_name": "syslog",
-        "regex_new": "cat /var/log/syslog"
+        "regex_new": "cat /var/log/syslog",
+        "literals_new": ("cat /var/log/syslog",),
         # 'parser_func'
     },
     "ID_97": {
         "enable": True,
         "raw_section_name": "partition-info",
-        "regex_new": "partition-info"
+        "regex_new": "partition-info",
+        "literals_new": ("partition-info",),
         # 'parser_func'
     },
     "ID_98": {
@@ -708,6 +863,7 @@ FILTER_LIST = {
         "raw_section_name": "hist-dump:ttl",
         "final_section_name": "ttl",
         "regex_new": "hist-dump:ns=.*;hist=ttl",
+        "literals_new": ("hist-dump:ns=",),
         "parent_section_name": "histogram",
         "collision_allowed": True
         # 'parser_func'
@@ -717,6 +873,7 @@ FILTER_LIST = {
         "raw_section_name": "hist-dump:objsz",
         "final_section_name": "objsz",
         "regex_new": "hist-dump:ns=.*;hist=objsz",
+        "literals_new": ("hist-dump:ns=",),
         "parent_section_name": "histogram",
         "collision_allowed": True
         # 'parser_func'
@@ -726,7 +883,8 @@ FILTER_LIST = {
         "enable": True,
         "raw_section_name": "scheduler_info",
         "final_section_name": "scheduler",
-        "regex_new": 'ls /sys/block/{.*}/queue/scheduler [|]xargs -I f sh -c "echo f; cat f;"'
+        "regex_new": 'ls /sys/block/{.*}/queue/scheduler [|]xargs -I f sh -c "echo f; cat f;"',
+        "literals_new": ('}/queue/scheduler |xargs -I f sh -c "echo f; cat f;"',),
         # 'parser_func'
     },
     "ID_101": {
@@ -734,7 +892,8 @@ FILTER_LIST = {
         "raw_section_name": "config_cluster",
         "final_section_name": "cluster",
         "parent_section_name": "config",
-        "regex_new": r"\['config', 'cluster'\]"
+        "regex_new": r"\['config', 'cluster'\]",
+        "literals_new": ("['config', 'cluster']",),
         # 'parser_func'
     },
     # Leave 102 for merge from pensive
@@ -742,32 +901,42 @@ FILTER_LIST = {
         "enable": True,
         "raw_section_name": "ss -ant state time-wait sport = :%d or dport = :%d | wc -l",
         "regex_new": "ss -ant state time-wait sport = :%d or dport = :%d [|] wc -l",
+        "literals_new": ("ss -ant state time-wait sport = :%d or dport = :%d | wc -l",),
         # 'parser_func'
     },
     "ID_104": {
         "enable": True,
         "raw_section_name": "ss -ant state close-wait sport = :%d or dport = :%d | wc -l",
         "regex_new": "ss -ant state close-wait sport = :%d or dport = :%d [|] wc -l",
+        "literals_new": (
+            "ss -ant state close-wait sport = :%d or dport = :%d | wc -l",
+        ),
         # 'parser_func'
     },
     "ID_105": {
         "enable": True,
         "raw_section_name": "ss -ant state established sport = :%d or dport = :%d | wc -l",
         "regex_new": "ss -ant state established sport = :%d or dport = :%d [|] wc -l",
+        "literals_new": (
+            "ss -ant state established sport = :%d or dport = :%d | wc -l",
+        ),
         # 'parser_func'
     },
     "ID_106": {
         "enable": True,
         "raw_section_name": "netstat -ant|grep 3000",
         "regex_new": r"netstat -ant[|]grep 3000|^netstat\n",
-        "regex_old": CMD_PREFIX + "netstat -ant[|]grep 3000"
+        "literals_new": ("netstat -ant|grep 3000", "netstat\n"),
+        "regex_old": CMD_PREFIX + "netstat -ant[|]grep 3000",
+        "literals_old": (CMD_PREFIX + "netstat -ant|grep 3000",),
         # 'parser_func'
     },
     "ID_107": {
         "enable": True,
         "raw_section_name": "lscpu",
         "final_section_name": "lscpu",
-        "regex_new": r"[cpu] lscpu\n"
+        "regex_new": r"[cpu] lscpu\n",
+        "literals_new": (" lscpu\n",),
         # 'parser_func'
     },
     "ID_108": {
@@ -775,6 +944,7 @@ FILTER_LIST = {
         "raw_section_name": "iptables -S",
         "final_section_name": "iptables",
         "regex_new": "iptables",
+        "literals_new": ("iptables",),
         # 'parser_func':
     },
     "ID_109": {
@@ -782,6 +952,7 @@ FILTER_LIST = {
         "raw_section_name": "sysctl vm sys",
         "final_section_name": "sysctlall",
         "regex_new": "sysctlall",
+        "literals_new": ("sysctlall",),
         # 'parser_func':
     },
     "ID_110": {
@@ -789,6 +960,7 @@ FILTER_LIST = {
         "raw_section_name": 'sudo fdisk -l |grep Disk |grep dev | cut -d " " -f 2 | cut -d ":" -f 1 | xargs sudo hdparm -I 2>/dev/null',
         "final_section_name": "hdparm",
         "regex_new": "hdparm",
+        "literals_new": ("hdparm",),
         # 'parser_func':
     },
     "ID_111": {
@@ -796,6 +968,7 @@ FILTER_LIST = {
         "raw_section_name": 'sudo pgrep asd | xargs -I f sh -c "cat /proc/f/limits"',
         "final_section_name": "limits",
         "regex_new": "limits",
+        "literals_new": ("limits",),
         # 'parser_func':
     },
     "ID_112": {
@@ -803,6 +976,7 @@ FILTER_LIST = {
         "raw_section_name": "curl -m 1 http://169.254.169.254/1.0/ || true",
         "final_section_name": "environment",
         "regex_new": "environment",
+        "literals_new": ("environment",),
         # 'parser_func':
     },
     "ID_113": {
@@ -810,7 +984,9 @@ FILTER_LIST = {
         "raw_section_name": "roster:",
         "final_section_name": "roster",
         "regex_new": "roster",
-        "regex_old": r"^roster\n"
+        "literals_new": ("roster",),
+        "regex_old": r"^roster\n",
+        "literals_old": ("roster\n",),
         # 'parser_func'
     }
     # {
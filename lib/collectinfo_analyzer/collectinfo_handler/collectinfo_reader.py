@@ -12,14 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from lib.utils.util import shell_command
+from .collectinfo_parser import collectinfo_parser
 
 
 class CollectinfoReader:
     cinfo_log_file_identifier_key = "=ASCOLLECTINFO"
     cinfo_log_file_identifiers = [
-        "Configuration~~~\|Configuration (.*)~",
-        "Statistics~\|Statistics (.*)~",
+        r"Configuration~~~|Configuration \(.*\)~",
+        r"Statistics~|Statistics \(.*\)~",
     ]
     system_log_file_identifier_key = "=ASCOLLECTINFO"
     system_log_file_identifiers = [
@@ -31,71 +31,44 @@ class CollectinfoReader:
         "cat /var/log/syslog",
     ]
 
-    def is_cinfo_log_file(self, log_file=""):
+    def _get_file_index(self, log_file, identifier_key):
         if not log_file:
-            return False
+            return None
 
         try:
-            out, err = shell_command(['head -n 30 "%s"' % (log_file)])
+            index = collectinfo_parser.get_file_index(log_file)
+
+            if not index.head_contains(identifier_key):
+                return None
         except Exception:
-            return False
+            return None
 
-        if err or not out:
-            return False
+        return index
 
-        lines = out.strip().split("\n")
-        found = False
-        for line in lines:
-            try:
-                if self.cinfo_log_file_identifier_key in line:
-                    found = True
-                    break
-            except Exception:
-                pass
+    def is_cinfo_log_file(self, log_file=""):
+        index = self._get_file_index(log_file, self.cinfo_log_file_identifier_key)
 
-        if not found:
+        if not index:
             return False
 
-        for search_string in self.cinfo_log_file_identifiers:
-            try:
-                out, err = shell_command(
-                    ['grep -m 1 "%s" "%s"' % (search_string, log_file)]
-                )
-            except Exception:
-                return False
-            if err or not out:
-                return False
-        return True
+        try:
+            return all(
+                index.search(search_string)
+                for search_string in self.cinfo_log_file_identifiers
+            )
+        except Exception:
+            return False
 
     def is_system_log_file(self, log_file=""):
-        if not log_file:
+        index = self._get_file_index(log_file, self.system_log_file_identifier_key)
+
+        if not index:
             return False
+
         try:
-            out, err = shell_command(['head -n 30 "%s"' % (log_file)])
+            return any(
+                index.contains(search_string)
+                for search_string in self.system_log_file_identifiers
+            )
         except Exception:
             return False
-        if err or not out:
-            return False
-        lines = out.strip().split("\n")
-        found = False
-        for line in lines:
-            try:
-                if self.system_log_file_identifier_key in line:
-                    found = True
-                    break
-            except Exception:
-                pass
-        if not found:
-            return False
-        for search_string in self.system_log_file_identifiers:
-            try:
-                out, err = shell_command(
-                    ['grep -m 1 "%s" "%s"' % (search_string, log_file)]
-                )
-            except Exception:
-                continue
-            if err or not out:
-                continue
-            else:
-                return True
-        return False
@@ -20,8 +20,10 @@ import zipfile
 
 from lib.utils import common, log_util, util, constants
 
+from .collectinfo_cache import CollectinfoCache
 from .collectinfo_reader import CollectinfoReader
 from .collectinfo_log import CollectinfoLog
+from .collectinfo_parser import collectinfo_parser, full_parser
 
 ###### Constants ######
 DATE_SEG = 0
@@ -45,8 +47,9 @@ class CollectinfoLogHandler(object):
     all_cinfo_logs = {}
     selected_cinfo_logs = {}
 
-    def __init__(self, cinfo_path):
+    def __init__(self, cinfo_path, asadm_version=""):
         self.cinfo_path = cinfo_path
+        self.cache = CollectinfoCache(asadm_version)
         self.collectinfo_dir = COLLECTINFO_DIR + str(os.getpid())
         self._validate_and_extract_compressed_files(
             cinfo_path, dest_dir=self.collectinfo_dir
@@ -94,6 +97,8 @@ class CollectinfoLogHandler(object):
             self.all_cinfo_logs.clear()
             self.selected_cinfo_logs.clear()
 
+        collectinfo_parser.release_file_indexes()
+
         if os.path.exists(self.collectinfo_dir):
             shutil.rmtree(self.collectinfo_dir)
 
@@ -262,7 +267,7 @@ class CollectinfoLogHandler(object):
                 try:
                     # ToDo: It should be some proper check for asadm
                     # collectinfo json file.
-                    if os.path.splitext(log_file)[1] == ".json":
+                    if full_parser.is_collectinfo_json_file(log_file):
                         valid_files.append(log_file)
                         continue
                 except Exception:
@@ -321,7 +326,7 @@ class CollectinfoLogHandler(object):
         if not files:
             raise Exception("No valid Aerospike collectinfo log available.")
 
-        cinfo_log = CollectinfoLog(cinfo_path, files, self.reader)
+        cinfo_log = CollectinfoLog(cinfo_path, files, self.reader, self.cache)
         self.selected_cinfo_logs = cinfo_log.snapshots
         self.all_cinfo_logs = cinfo_log.snapshots
         snapshots_added = len(self.all_cinfo_logs)
@@ -36,7 +36,9 @@ class CollectinfoRootController(BaseController):
         super(CollectinfoRootController, self).__init__(asadm_version)
 
         # Create Static Instance of Loghdlr
-        CollectinfoRootController.log_handler = CollectinfoLogHandler(clinfo_path)
+        CollectinfoRootController.log_handler = CollectinfoLogHandler(
+            clinfo_path, asadm_version=asadm_version
+        )
 
         CollectinfoRootController.command = CollectinfoCommandController(
             self.log_handler
@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
-from distutils.version import LooseVersion
-from lib.utils import common, util, constants
+import operator
+
+from lib.utils import common, util
+
+# each namespace is divided into 4096 partitions
+PARTITION_COUNT = 4096
+_PARTITION_IDS = frozenset(str(pid) for pid in range(PARTITION_COUNT))
 
 
 def get_sindex_stats(cluster, nodes="all", for_mods=[]):
     stats = cluster.info_sindex(nodes=nodes)
 
-    sindex_stats = {}
+    # sindex_key -> ((ns, indexname), sindex definition), the definition from
+    # the last host listing the sindex wins.
+    sindexes = {}
     if stats:
         for host, stat_list in stats.items():
             if not stat_list or isinstance(stat_list, Exception):
@@ -50,19 +58,33 @@ def get_sindex_stats(cluster, nodes="all", for_mods=[]):
                     continue
 
                 sindex_key = "%s %s %s" % (ns, set_, indexname)
+                sindexes[sindex_key] = ((ns, indexname), stat)
+
+    sindex_stats = {}
+    if not sindexes:
+        return sindex_stats
+
+    # Statistics of all sindexes from all nodes in a single cluster-wide pass.
+    all_stats = cluster.info_all_sindex_statistics(
+        list({ns_index for ns_index, _ in sindexes.values()}), nodes=nodes
+    )
+
+    for sindex_key, (ns_index, stat) in sindexes.items():
+        sindex_stats[sindex_key] = {}
+
+        for node, node_stats in all_stats.items():
+            if isinstance(node_stats, Exception):
+                sindex_stats[sindex_key][node] = node_stats
+                continue
+
+            sindex_stat = node_stats[ns_index]
+
+            if sindex_stat and not isinstance(sindex_stat, Exception):
+                sindex_stat = dict(sindex_stat)
+                sindex_stat.update(stat)
+
+            sindex_stats[sindex_key][node] = sindex_stat
 
-                if sindex_key not in sindex_stats:
-                    sindex_stats[sindex_key] = {}
-                sindex_stats[sindex_key] = cluster.info_sindex_statistics(
-                    ns, indexname, nodes=nodes
-                )
-                for node in sindex_stats[sindex_key].keys():
-                    if not sindex_stats[sindex_key][node] or isinstance(
-                        sindex_stats[sindex_key][node], Exception
-                    ):
-                        continue
-                    for key, value in stat.items():
-                        sindex_stats[sindex_key][node][key] = value
     return sindex_stats
 
 
@@ -107,12 +129,12 @@ class GetLatenciesController:
     def get_latencies_and_latency_nodes(self, nodes="all"):
         latencies_nodes = []
         latency_nodes = []
-        builds = self.cluster.info_build_version(nodes=nodes)
+        profiles = self.cluster.get_profile(nodes=nodes)
 
-        for node, build in builds.items():
-            if isinstance(build, Exception):
+        for node, profile in profiles.items():
+            if isinstance(profile, Exception) or not profile.build:
                 continue
-            if common.is_new_latencies_version(build):
+            if profile.new_latencies_version:
                 latencies_nodes.append(node)
             else:
                 latency_nodes.append(node)
@@ -362,12 +384,12 @@ class GetConfigController:
 
     def get_xdr5_nodes(self, nodes="all"):
         xdr5_nodes = []
-        builds = self.cluster.info_build_version(nodes=nodes)
+        profiles = self.cluster.get_profile(nodes=nodes)
 
-        for node, build in builds.items():
-            if isinstance(build, Exception):
+        for node, profile in profiles.items():
+            if isinstance(profile, Exception) or not profile.build:
                 continue
-            if LooseVersion(constants.SERVER_NEW_XDR5_VERSION) <= LooseVersion(build):
+            if profile.xdr5:
                 xdr5_nodes.append(node)
 
         return xdr5_nodes
@@ -387,12 +409,12 @@ class GetConfigController:
 
     def get_old_xdr_nodes(self, nodes="all"):
         old_xdr_nodes = []
-        builds = self.cluster.info_build_version(nodes=nodes)
+        profiles = self.cluster.get_profile(nodes=nodes)
 
-        for node, build in builds.items():
-            if isinstance(build, Exception):
+        for node, profile in profiles.items():
+            if isinstance(profile, Exception) or not profile.build:
                 continue
-            if LooseVersion(constants.SERVER_NEW_XDR5_VERSION) > LooseVersion(build):
+            if not profile.xdr5:
                 old_xdr_nodes.append(node)
 
         return old_xdr_nodes
@@ -498,9 +520,18 @@ class GetStatisticsController:
     def __init__(self, cluster):
         self.cluster = cluster
 
-    def get_all(self, nodes="all"):
+    def get_all(self, nodes="all", collection_times=None):
         futures = [
-            ("service", (util.Future(self.get_service, nodes=nodes).start())),
+            (
+                "service",
+                (
+                    util.Future(
+                        self.get_service,
+                        nodes=nodes,
+                        collection_times=collection_times,
+                    ).start()
+                ),
+            ),
             ("namespace", (util.Future(self.get_namespace, nodes=nodes).start())),
             ("set", (util.Future(self.get_sets, nodes=nodes).start())),
             ("bin", (util.Future(self.get_bins, nodes=nodes).start())),
@@ -512,8 +543,24 @@ class GetStatisticsController:
 
         return stat_map
 
-    def get_service(self, nodes="all"):
-        service_stats = self.cluster.info_statistics(nodes=nodes)
+    def get_service(self, nodes="all", collection_times=None):
+        """
+        If collection_times is a dict, the time each node's statistics arrived
+        is stored in it.
+        """
+        if collection_times is None:
+            return self.cluster.info_statistics(nodes=nodes)
+
+        service_stats = {}
+        timed_stats = self.cluster.info_timed_statistics(nodes=nodes)
+
+        for node, timed_stat in timed_stats.items():
+            if isinstance(timed_stat, Exception):
+                service_stats[node] = timed_stat
+                continue
+
+            collection_times[node], service_stats[node] = timed_stat
+
         return service_stats
 
     def get_namespace(self, nodes="all", for_mods=[]):
@@ -717,11 +764,12 @@ class GetPmapController:
 
         return ns_info
 
-    def _get_pmap_data(self, pmap_info, ns_info, cluster_keys, node_ids):
-        pid_range = 4096  # each namespace is divided into 4096 partition
-        pmap_data = {}
-        ns_available_part = {}
-
+    @staticmethod
+    def _get_partition_columns(fields):
+        """
+        Returns the column indices of partition-info rows and whether fields,
+        the first row, is a header.
+        """
         # format : (index_ptr, field_name, default_index)
         # required fields present in all versions
         required_fields = [
@@ -740,109 +788,143 @@ class GetPmapController:
         # fields present in version >= 3.15.0
         optional_new_fields = [("working_master_index", "working_master", None)]
 
-        for _node, partitions in pmap_info.items():
-            node_pmap = dict()
-            ck = cluster_keys[_node]
-            node_id = node_ids[_node]
+        f_indices = {}
 
-            if isinstance(partitions, Exception):
-                continue
+        # Setting default indices in partition fields for server < 3.8.4
+        for t in required_fields + optional_old_fields + optional_new_fields:
+            f_indices[t[0]] = t[2]
 
-            f_indices = {}
+        # pmap format contains headers from server 3.8.4 onwards
+        if not all(i[1] in fields for i in required_fields):
+            return f_indices, False
 
-            # Setting default indices in partition fields for server < 3.8.4
-            for t in required_fields + optional_old_fields + optional_new_fields:
-                f_indices[t[0]] = t[2]
+        for t in required_fields:
+            f_indices[t[0]] = fields.index(t[1])
 
-            # First row might be header, we need to check and set indices if its header row
-            index_set = False
+        if all(i[1] in fields for i in optional_old_fields):
+            for t in optional_old_fields:
+                f_indices[t[0]] = fields.index(t[1])
+        elif all(i[1] in fields for i in optional_new_fields):
+            for t in optional_new_fields:
+                f_indices[t[0]] = fields.index(t[1])
 
-            for item in partitions.split(";"):
-                fields = item.split(":")
+        return f_indices, True
 
-                if not index_set:
-                    # pmap format contains headers from server 3.8.4 onwards
-                    index_set = True
+    @staticmethod
+    def _get_partition_role(node_id, state, replica, working_master, origin, target):
+        """
+        Returns "master_partition_count", "prole_partition_count" or None for
+        a partition this node does not hold.
+        """
+        replica = int(replica)
 
-                    if all(i[1] in fields for i in required_fields):
-                        for t in required_fields:
-                            f_indices[t[0]] = fields.index(t[1])
+        if working_master:
+            if node_id == working_master:
+                # Working master
+                return "master_partition_count"
 
-                        if all(i[1] in fields for i in optional_old_fields):
-                            for t in optional_old_fields:
-                                f_indices[t[0]] = fields.index(t[1])
-                        elif all(i[1] in fields for i in optional_new_fields):
-                            for t in optional_new_fields:
-                                f_indices[t[0]] = fields.index(t[1])
+            if replica == 0 or state == "S" or state == "D":
+                # Eventual master or replicas
+                return "prole_partition_count"
 
-                        continue
+        elif replica == 0:
+            if origin == "0":
+                # Working master (Final and proper master)
+                return "master_partition_count"
 
-                ns, pid, state, replica = (
-                    fields[f_indices["namespace_index"]],
-                    int(fields[f_indices["partition_index"]]),
-                    fields[f_indices["state_index"]],
-                    int(fields[f_indices["replica_index"]]),
-                )
+            # Eventual master
+            return "prole_partition_count"
 
-                if f_indices["working_master_index"]:
-                    working_master = fields[f_indices["working_master_index"]]
-                    origin = target = None
-                else:
-                    origin, target = (
-                        fields[f_indices["origin_index"]],
-                        fields[f_indices["target_index"]],
-                    )
-                    working_master = None
+        elif target == "0":
+            if state == "S" or state == "D":
+                return "prole_partition_count"
+
+        else:
+            # Working master (Acting master)
+            return "master_partition_count"
+
+        return None
+
+    def _get_node_pmap(self, partitions, node_id):
+        items = partitions.split(";")
+        f_indices, has_header = self._get_partition_columns(items[0].split(":"))
+
+        if has_header:
+            del items[0]
+
+        # Only split rows as far as the last column which is needed.
+        maxsplit = max(i for i in f_indices.values() if i is not None) + 1
+        rows = [item.split(":", maxsplit) for item in items]
+        pid_index = f_indices["partition_index"]
+
+        if not _PARTITION_IDS.issuperset(map(operator.itemgetter(pid_index), rows)):
+            valid_rows = []
 
-                if pid not in range(pid_range):
+            for row in rows:
+                pid = int(row[pid_index])
+
+                if pid not in range(PARTITION_COUNT):
                     print(
                         "For {0} found partition-ID {1} which is beyond legal partitions(0...4096)".format(
-                            ns, pid
+                            row[f_indices["namespace_index"]], pid
                         )
                     )
                     continue
 
-                if ns not in node_pmap:
-                    node_pmap[ns] = {
-                        "master_partition_count": 0,
-                        "prole_partition_count": 0,
-                    }
+                valid_rows.append(row)
 
-                if ck not in ns_available_part:
-                    ns_available_part[ck] = {}
+            rows = valid_rows
 
-                if ns not in ns_available_part[ck]:
-                    ns_available_part[ck][ns] = {}
-                    ns_available_part[ck][ns]["available_partition_count"] = 0
+        # Partitions are counted per distinct combination of the columns
+        # which decide their role, every combination is then classified once.
+        if f_indices["working_master_index"]:
+            columns = operator.itemgetter(
+                f_indices["namespace_index"],
+                f_indices["state_index"],
+                f_indices["replica_index"],
+                f_indices["working_master_index"],
+            )
+            counts = collections.Counter(map(columns, rows))
+            keys = {key: key + (None, None) for key in counts}
+        else:
+            columns = operator.itemgetter(
+                f_indices["namespace_index"],
+                f_indices["state_index"],
+                f_indices["replica_index"],
+                f_indices["origin_index"],
+                f_indices["target_index"],
+            )
+            counts = collections.Counter(map(columns, rows))
+            keys = {key: key[:3] + (None,) + key[3:] for key in counts}
 
-                if working_master:
-                    if node_id == working_master:
-                        # Working master
-                        node_pmap[ns]["master_partition_count"] += 1
+        node_pmap = {}
 
-                    elif replica == 0 or state == "S" or state == "D":
-                        # Eventual master or replicas
-                        node_pmap[ns]["prole_partition_count"] += 1
+        for key, count in counts.items():
+            ns, state, replica, working_master, origin, target = keys[key]
 
-                elif replica == 0:
-                    if origin == "0":
-                        # Working master (Final and proper master)
-                        node_pmap[ns]["master_partition_count"] += 1
+            if ns not in node_pmap:
+                node_pmap[ns] = {
+                    "master_partition_count": 0,
+                    "prole_partition_count": 0,
+                }
 
-                    else:
-                        # Eventual master
-                        node_pmap[ns]["prole_partition_count"] += 1
+            role = self._get_partition_role(
+                node_id, state, replica, working_master, origin, target
+            )
 
-                else:
-                    if target == "0":
-                        if state == "S" or state == "D":
-                            node_pmap[ns]["prole_partition_count"] += 1
+            if role:
+                node_pmap[ns][role] += count
+
+        return node_pmap
 
-                    else:
-                        # Working master (Acting master)
-                        node_pmap[ns]["master_partition_count"] += 1
+    def _get_pmap_data(self, pmap_info, ns_info, cluster_keys, node_ids):
+        pmap_data = {}
+
+        for _node, partitions in pmap_info.items():
+            if isinstance(partitions, Exception):
+                continue
 
-            pmap_data[_node] = node_pmap
+            pmap_data[_node] = self._get_node_pmap(partitions, node_ids[_node])
 
         for _node, _ns_data in pmap_data.items():
             ck = cluster_keys[_node]
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import select
 import socket
+import time
 import warnings
 
 from .info import (
@@ -51,6 +53,31 @@ except ImportError:
     HAVE_PYOPENSSL = False
 
 
+# Pooled connections which have been used or validated within this many
+# seconds are assumed to be alive and are not probed.
+VALIDATE_INTERVAL = 1.0
+
+# The server closes client connections which are idle for longer than
+# proto-fd-idle-ms (60 seconds by default). Connections idle for almost that
+# long are not reused since they could be reaped in the middle of a request.
+MAX_IDLE_TIME = 55.0
+
+
+def _is_readable(fileno):
+    """
+    Non-blocking check for pending data, EOF or errors on a file descriptor.
+    """
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(
+            fileno, select.POLLIN | select.POLLPRI | select.POLLERR | select.POLLHUP
+        )
+        return bool(poller.poll(0))
+
+    readable, _, errored = select.select([fileno], [], [fileno], 0)
+    return bool(readable or errored)
+
+
 class ASSocket:
     def __init__(
         self, ip, port, tls_name, user, password, auth_mode, ssl_context, timeout=5
@@ -64,6 +91,9 @@ class ASSocket:
         self.auth_mode = auth_mode
         self.ssl_context = ssl_context
         self._timeout = timeout
+        self.created_at = time.time()
+        self.last_used = 0
+        self.validated_at = 0
 
     def _wrap_socket(self, sock, ctx):
         if ctx:
@@ -180,6 +210,39 @@ class ASSocket:
                 return False
         except Exception:
             return False
+
+        self.created_at = self.last_used = self.validated_at = time.time()
+        return True
+
+    def is_alive(self):
+        """
+        Cheap liveness check for pooled connections. Unlike is_connected() it
+        does not send a request, it only polls the socket. An idle info
+        connection never has anything to read, so a readable socket means EOF,
+        an error or stale data left over from an earlier request.
+        """
+        if not self.sock:
+            return False
+
+        now = time.time()
+
+        if now - self.last_used > MAX_IDLE_TIME:
+            return False
+
+        if now - self.validated_at < VALIDATE_INTERVAL:
+            return True
+
+        try:
+            if self.ssl_context and self.sock.pending():
+                return False
+
+            if _is_readable(self.sock.fileno()):
+                return False
+
+        except Exception:
+            return False
+
+        self.validated_at = now
         return True
 
     def is_connected(self):
@@ -213,7 +276,9 @@ class ASSocket:
         self.sock.settimeout(timeout)
 
     def info(self, command):
-        return info(self.sock, command)
+        result = info(self.sock, command)
+        self.last_used = self.validated_at = time.time()
+        return result
 
     def create_user(self, user, password, roles):
         rsp_code = create_user(self.sock, user, password, roles)
@@ -0,0 +1,214 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import socket
+import threading
+import time
+
+from .assocket import MAX_IDLE_TIME
+from .info import (
+    ASResponse,
+    ASField,
+    _PROTOCOL_HEADER_SIZE,
+    _TOTAL_HEADER_SIZE,
+    _create_authenticate_request,
+    _create_info_request,
+    _hash_password,
+    _parse_info_response,
+    _unpack_admin_header,
+    _unpack_protocol_header,
+)
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop():
+    """
+    Returns the event loop shared by all AsyncASSockets. It runs forever in a
+    daemon thread so connections opened on it can be reused across commands.
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="asadm-event-loop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+
+        return _loop
+
+
+def run_coroutine(coro, timeout=None):
+    """
+    Runs a coroutine on the shared event loop and waits for its result. Must
+    not be called from the event loop thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result(timeout)
+
+
+def call_soon(callback, *args):
+    """
+    Schedules a callback on the shared event loop from any thread.
+    """
+    if _loop is not None:
+        _loop.call_soon_threadsafe(callback, *args)
+
+
+class AsyncASSocket:
+    """
+    asyncio counterpart of ASSocket for info requests. It uses the same
+    framing as info.py so many requests to many nodes can be in flight on a
+    single thread. TLS is not supported, asadm's SSL contexts are pyOpenSSL
+    contexts which asyncio cannot use, so those connections use ASSocket.
+    """
+
+    def __init__(self, ip, port, user, password, auth_mode, timeout=5):
+        self.reader = None
+        self.writer = None
+        self.ip = ip
+        self.port = port
+        self.user = user
+        self.password = password
+        self.auth_mode = auth_mode
+        self._timeout = timeout
+        self.created_at = time.time()
+        self.last_used = 0
+
+    async def _open_connection(self, addrinfo):
+        # sock_info format : (family, socktype, proto, canonname, sockaddr)
+        sock_addr = addrinfo[4]
+
+        return await asyncio.wait_for(
+            asyncio.open_connection(sock_addr[0], sock_addr[1]), self._timeout
+        )
+
+    async def connect(self):
+        try:
+            loop = asyncio.get_running_loop()
+            addrinfos = await loop.getaddrinfo(
+                self.ip, self.port, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+            )
+        except Exception:
+            return False
+
+        # for DNS it will try all possible addresses
+        for addrinfo in addrinfos:
+            try:
+                self.reader, self.writer = await self._open_connection(addrinfo)
+                break
+            except Exception:
+                self.reader = self.writer = None
+
+        if not self.writer:
+            return False
+
+        self.created_at = self.last_used = time.time()
+        return True
+
+    async def _receive_data(self, sz):
+        try:
+            return await asyncio.wait_for(self.reader.readexactly(sz), self._timeout)
+        except asyncio.IncompleteReadError:
+            raise IOError("Connection closed by peer")
+
+    async def _send(self, buf):
+        self.writer.write(buf)
+        await asyncio.wait_for(self.writer.drain(), self._timeout)
+
+    async def _send_and_get_admin_header(self, send_buf):
+        await self._send(bytes(send_buf))
+        recv_buf = await self._receive_data(_TOTAL_HEADER_SIZE)
+        return recv_buf, _unpack_admin_header(recv_buf, _PROTOCOL_HEADER_SIZE)
+
+    async def _authenticate(self, user, password, password_field_id):
+        send_buf = _create_authenticate_request(user, password, password_field_id)
+        _, (_, return_code, _, _, _) = await self._send_and_get_admin_header(send_buf)
+        return return_code
+
+    async def authenticate(self, session_token):
+        if self.user is None:
+            return True
+
+        if not self.writer:
+            return False
+
+        if session_token is None:
+            # old authentication
+            resp_code = await self._authenticate(
+                self.user, _hash_password(self.password), ASField.CREDENTIAL
+            )
+        else:
+            # new authentication with session_token
+            resp_code = await self._authenticate(
+                self.user, session_token, ASField.SESSION_TOKEN
+            )
+
+        if resp_code != ASResponse.OK:
+            # TODO remove print statement and raise an exception like requests
+            print(
+                "Authentication failed for",
+                self.user,
+                ":",
+                str(ASResponse(resp_code)) + ".",
+            )
+            self.close()
+            return False
+
+        return True
+
+    def is_alive(self):
+        if not self.writer or self.writer.is_closing():
+            return False
+
+        if self.reader.at_eof():
+            return False
+
+        return time.time() - self.last_used <= MAX_IDLE_TIME
+
+    async def info(self, command):
+        if not self.writer:
+            raise IOError("Error: Could not connect to node")
+
+        try:
+            await self._send(_create_info_request(command))
+            rsp_hdr = await self._receive_data(_PROTOCOL_HEADER_SIZE)
+            _, _, data_size, _ = _unpack_protocol_header(rsp_hdr)
+            rsp_data = None
+
+            if data_size > 0:
+                rsp_data = await self._receive_data(data_size)
+
+        except Exception as ex:
+            raise IOError("Error: %s" % str(ex))
+
+        self.last_used = time.time()
+
+        if rsp_data is None:
+            return -1
+
+        return _parse_info_response(command, rsp_data)
+
+    def close(self):
+        if self.writer:
+            try:
+                self.writer.close()
+            except Exception:
+                pass
+
+        self.reader = self.writer = None
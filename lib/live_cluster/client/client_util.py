@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
-import itertools
+import functools
+import sys
 import threading
 from time import time
 
+from lib.utils import thread_pool
+
 
 def info_to_dict(value, delimiter=";", ignore_field_without_key_value_delimiter=True):
     """
@@ -28,52 +30,71 @@ def info_to_dict(value, delimiter=";", ignore_field_without_key_value_delimiter=
     if isinstance(value, Exception):
         return value
 
+    fields = value.split(delimiter)
+
+    if not ignore_field_without_key_value_delimiter:
+        fields = _join_fields_without_key_value_delimiter(fields, delimiter)
+
+    # Single pass over the fields. Runs of consecutive fields with the same
+    # key are joined into one sorted, comma separated value. A run containing
+    # a field without "=" is dropped and only the part between the first and
+    # the second "=" of a field is its value.
     stat_dict = {}
-    _tmp_value_list = info_to_list(value, delimiter)
-    _value_list = []
-    delimiter2 = "="
-
-    if ignore_field_without_key_value_delimiter:
-        _value_list = _tmp_value_list
-
-    else:
-        # Sometimes value contains confusing delimiter
-        # In such cases, after splitting on delimiter, we get items without next delimiter (=).
-        # By default we ignore such items. But in some cases like dc configs we need to accept those and append to previous item.
-        # For ex. "dc-name=REMOTE_DC_1:nodes=2000:10:3:0:0:0:100:d+3000:int-ext-ipmap=172.68.17.123...."
-        # In this example, first split will give ["dc-name=REMOTE_DC_1", "nodes=2000", "10", "3",
-        # "0", "0", "100", "d+3000", "int-ext-ipmap=172.68.17.123", ....]. In such cases we need to append items
-        # (10, 3, 0, 0, 100, "d+3000") to previous valid item ("nodes=2000") with delimiter (":").
-        # It gives "nodes=2000:10:3:0:0:0:100:d+3000".
-
-        for _v in _tmp_value_list:
-            if delimiter2 not in _v:
-                try:
-                    _value_list[-1] = str(_value_list[-1]) + delimiter + str(_v)
-
-                except Exception:
-                    pass
+    run_key = None
+    run_values = []
+    run_valid = False
 
-            else:
-                _value_list.append(_v)
+    for field in fields:
+        parts = field.split("=", 2)
 
-    stat_param = [info_to_tuple(sp, delimiter2) for sp in _value_list]
+        if parts[0] != run_key:
+            if run_valid:
+                stat_dict[run_key] = _join_values(run_values)
 
-    for g in itertools.groupby(stat_param, lambda x: x[0]):
-        try:
-            value = [v[1] for v in g[1]]
-            value = ",".join(sorted(value)) if len(value) > 1 else value[0]
-            stat_dict[g[0]] = value
-        except Exception:
-            # NOTE: 3.0 had a bug in stats at least prior to 3.0.44. This will
-            # ignore that bug.
+            run_key = parts[0]
+            run_values = []
+            run_valid = True
+
+        if len(parts) > 1:
+            run_values.append(parts[1])
+        else:
+            # NOTE: 3.0 had a bug in stats at least prior to 3.0.44 which sent
+            # fields without values, ignore them.
+            run_valid = False
+
+    if run_valid:
+        stat_dict[run_key] = _join_values(run_values)
 
-            # Not sure if this bug is fixed or not.. removing this try/catch
-            # results in things not working. TODO: investigate.
-            pass
     return stat_dict
 
 
+def _join_values(values):
+    if len(values) == 1:
+        return values[0]
+
+    return ",".join(sorted(values))
+
+
+def _join_fields_without_key_value_delimiter(fields, delimiter):
+    # Sometimes value contains confusing delimiter
+    # In such cases, after splitting on delimiter, we get items without next delimiter (=).
+    # By default we ignore such items. But in some cases like dc configs we need to accept those and append to previous item.
+    # For ex. "dc-name=REMOTE_DC_1:nodes=2000:10:3:0:0:0:100:d+3000:int-ext-ipmap=172.68.17.123...."
+    # In this example, first split will give ["dc-name=REMOTE_DC_1", "nodes=2000", "10", "3",
+    # "0", "0", "100", "d+3000", "int-ext-ipmap=172.68.17.123", ....]. In such cases we need to append items
+    # (10, 3, 0, 0, 100, "d+3000") to previous valid item ("nodes=2000") with delimiter (":").
+    # It gives "nodes=2000:10:3:0:0:0:100:d+3000".
+    joined = []
+
+    for field in fields:
+        if "=" in field:
+            joined.append(field)
+        elif joined:
+            joined[-1] = joined[-1] + delimiter + field
+
+    return joined
+
+
 def info_to_dict_multi_level(
     value,
     keyname,
@@ -124,7 +145,7 @@ def info_colon_to_dict(value):
 def info_to_list(value, delimiter=";"):
     if isinstance(value, Exception):
         return []
-    return re.split(delimiter, value)
+    return value.split(delimiter)
 
 
 def info_to_tuple(value, delimiter=":"):
@@ -199,58 +220,311 @@ def parse_peers_string(
     return peers_list
 
 
-def concurrent_map(func, data):
+def concurrent_map(func, data, timeout=None):
     """
-    Similar to the builtin function map(). But spawn a thread for each argument
-    and apply 'func' concurrently.
+    Similar to the builtin function map(). But apply 'func' concurrently on
+    the shared asadm thread pool.
 
     Note: unlie map(), we cannot take an iterable argument. 'data' should be an
-    indexable sequence.
+    indexable sequence. A call which raises leaves None in its slot. If timeout
+    is given and the calls do not finish within timeout seconds
+    thread_pool.TaskTimeoutError is raised.
     """
 
-    N = len(data)
-    result = [None] * N
-
     # Uncomment following line to run single threaded.
     # return [func(datum) for datum in data]
 
-    # wrapper to dispose the result in the right slot
-    def task_wrapper(i):
-        result[i] = func(data[i])
+    def task_wrapper(datum):
+        try:
+            return func(datum)
+        except Exception:
+            return None
 
-    threads = [threading.Thread(target=task_wrapper, args=(i,)) for i in range(N)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    return thread_pool.concurrent_map(task_wrapper, data, timeout=timeout)
 
-    return result
+
+# Default bounds of a cached() instance.
+CACHE_MAX_ENTRIES = 4096
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Expired entries which are not at the LRU end are dropped at most this often.
+CACHE_PURGE_INTERVAL = 10.0
+
+
+def _sizeof(value):
+    """
+    Rough size in bytes of a cached value, info responses are strings or dicts
+    of strings.
+    """
+    if isinstance(value, (str, bytes)):
+        return len(value)
+
+    if isinstance(value, dict):
+        return sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return sum(_sizeof(v) for v in value)
+
+    return sys.getsizeof(value)
+
+
+class _InFlightCall(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.exc = None
+
+    def wait(self):
+        self.event.wait()
+
+        if self.exc is not None:
+            raise self.exc
+
+        return self.value
 
 
 class cached(object):
     # Doesn't support lists, dicts and other unhashables
     # Also doesn't support kwargs for reason above.
-
-    def __init__(self, func, ttl=0.5):
+    #
+    # LRU cache with a TTL per entry, bounded by max_entries and max_bytes.
+    # ttl_policy is an optional function of the call arguments returning the
+    # TTL for that call, a TTL <= 0 disables caching for it. Concurrent calls
+    # with the same arguments share a single call to func.
+    #
+    # Entries and counters are also tracked per owner, the first argument of
+    # the call, i.e. the instance when used as a method decorator, so they can
+    # be cleared and reported for a single instance.
+
+    COUNTERS = ("hits", "misses", "coalesced", "evictions", "expirations")
+
+    def __init__(
+        self,
+        func,
+        ttl=0.5,
+        ttl_policy=None,
+        max_entries=CACHE_MAX_ENTRIES,
+        max_bytes=CACHE_MAX_BYTES,
+    ):
         self.func = func
         self.ttl = ttl
+        self.ttl_policy = ttl_policy
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # key -> (value, eol, size), least recently used first. A plain dict
+        # rather than an OrderedDict, iterating it never hashes the keys again.
         self.cache = {}
+        self.size = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._last_purge = time()
+
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def _get_owner_counters(self, owner, create=False):
+        # Must be called with the lock held. The counters of the calls of an
+        # owner are kept on the owner, so they go away with it. Owners without
+        # attributes, e.g. strings, have none.
+        try:
+            owner_counters = owner.__dict__.setdefault("_cached_counters", {})
+        except AttributeError:
+            return None
+
+        counters = owner_counters.get(self)
+
+        if counters is None and create:
+            counters = owner_counters[self] = dict.fromkeys(self.COUNTERS, 0)
+
+        return counters
+
+    def _count(self, key, counter):
+        # Must be called with the lock held.
+        self._counters[counter] += 1
+
+        if key:
+            owner_counters = self._get_owner_counters(key[0], create=True)
+
+            if owner_counters is not None:
+                owner_counters[counter] += 1
+
+    def _remove(self, key):
+        try:
+            _, _, size = self.cache.pop(key)
+        except KeyError:
+            # The hash of the key changed since it was stored.
+            self._remove_if(lambda k, entry: k is key)
+            return
+
+        self.size -= size
+
+    def _remove_if(self, predicate):
+        # Must be called with the lock held. Rebuilds the cache instead of
+        # popping keys one by one, the hash of a key may have changed since it
+        # was stored (e.g. Node hashes on its address). Returns removed keys.
+        removed = []
+        kept = {}
+
+        for key, entry in self.cache.items():
+            if predicate(key, entry):
+                removed.append(key)
+                self.size -= entry[2]
+            else:
+                kept[key] = entry
+
+        self.cache = kept
+        return removed
+
+    @staticmethod
+    def _is_owned_by(key, owner):
+        try:
+            return bool(key) and (key[0] is owner or key[0] == owner)
+        except Exception:
+            return False
+
+    def _purge(self, now):
+        # Must be called with the lock held.
+        if now - self._last_purge >= CACHE_PURGE_INTERVAL:
+            self._last_purge = now
+
+            for key in self._remove_if(lambda key, entry: entry[1] <= now):
+                self._count(key, "expirations")
+
+        while self.cache and (
+            len(self.cache) > self.max_entries or self.size > self.max_bytes
+        ):
+            key = next(iter(self.cache))
+            self._remove(key)
+            self._count(key, "evictions")
 
     def __setitem__(self, key, value):
-        self.cache[key] = (value, time() + self.ttl)
+        ttl = self.ttl_policy(*key) if self.ttl_policy else self.ttl
 
-    def __getitem__(self, key):
+        if ttl <= 0:
+            return
+
+        now = time()
+        size = _sizeof(value)
+
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+
+            self.cache[key] = (value, now + ttl, size)
+            self.size += size
+            self._purge(now)
+
+    def _lookup(self, key):
+        # Must be called with the lock held. Returns (True, value) for a live
+        # entry, (False, None) otherwise.
         if key in self.cache:
-            value, eol = self.cache[key]
+            value, eol, _ = self.cache[key]
+
             if eol > time():
+                # Re-insert to mark the entry as most recently used.
+                self.cache[key] = self.cache.pop(key)
+                self._count(key, "hits")
+                return True, value
+
+            self._remove(key)
+            self._count(key, "expirations")
+
+        return False, None
+
+    def peek(self, key):
+        """
+        Returns (True, value) if key has a live entry, (False, None) otherwise.
+        Never calls func and never waits for an in-flight call, so it is safe
+        to use from an event loop.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+
+            if not found:
+                self._count(key, "misses")
+
+            return found, value
+
+    def __getitem__(self, key):
+        with self._lock:
+            found, value = self._lookup(key)
+
+            if found:
                 return value
 
-        self[key] = self.func(*key)
-        return self.cache[key][0]
+            call = self._in_flight.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._in_flight[key] = _InFlightCall()
+                self._count(key, "misses")
+            else:
+                self._count(key, "coalesced")
+
+        if not leader:
+            return call.wait()
+
+        try:
+            call.value = self.func(*key)
+            self[key] = call.value
+        except Exception as e:
+            call.exc = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+            call.event.set()
+
+        return call.value
 
     def __call__(self, *args):
         return self[args]
 
+    def __get__(self, instance, owner):
+        # Used as a method decorator the instance is part of the key.
+        if instance is None:
+            return self
+
+        return functools.partial(self.__call__, instance)
+
+    def clear(self, owner=None):
+        """
+        Removes all entries, or only the entries owner would get, i.e. of
+        calls whose first argument is or equals owner, if it is given.
+        """
+        with self._lock:
+            if owner is None:
+                self.cache.clear()
+                self.size = 0
+                return
+
+            self._remove_if(lambda key, entry: self._is_owned_by(key, owner))
+
+    def get_statistics(self, owner=None):
+        """
+        Returns the counters, entries and bytes of the whole cache, or only
+        of the calls of owner if it is given.
+        """
+        with self._lock:
+            if owner is None:
+                stats = dict(self._counters)
+                stats["entries"] = len(self.cache)
+                stats["bytes"] = self.size
+                return stats
+
+            stats = dict(
+                self._get_owner_counters(owner) or dict.fromkeys(self.COUNTERS, 0)
+            )
+            sizes = [
+                size
+                for k, (_, _, size) in self.cache.items()
+                if self._is_owned_by(k, owner)
+            ]
+            stats["entries"] = len(sizes)
+            stats["bytes"] = sum(sizes)
+            return stats
+
 
 def flatten(list1):
     """
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+import asyncio
+import contextlib
+import random
 import re
 import threading
 import logging
@@ -21,13 +23,125 @@ from time import time
 from lib.utils.lookup_dict import LookupDict
 from lib.utils import util, constants
 
-from . import client_util
+from . import async_assocket, client_util
 from .node import Node
 
 
 # interval time in second for cluster refreshing
 CLUSTER_REFRESH_INTERVAL = 3
 
+# Fraction of the background refresh interval by which every delay is
+# randomly lengthened or shortened.
+REFRESH_JITTER = 0.2
+
+# Upper bound in seconds of the background refresh delay while no node of the
+# cluster can be reached.
+REFRESH_MAX_BACKOFF = 60
+
+
+class ClusterRefresher(threading.Thread):
+    """
+    Daemon thread which crawls the cluster every interval seconds so callers
+    never have to. Delays are jittered, and doubled after every refresh which
+    found no live node, up to REFRESH_MAX_BACKOFF.
+    """
+
+    def __init__(self, cluster, interval):
+        super().__init__(name="asadm-cluster-refresher", daemon=True)
+        self.cluster = cluster
+        self.interval = interval
+        self.failures = 0
+        self._stop_event = threading.Event()
+
+    def next_delay(self):
+        delay = self.interval
+
+        if self.failures:
+            delay = min(
+                self.interval * 2 ** min(self.failures, 16),
+                max(self.interval, REFRESH_MAX_BACKOFF),
+            )
+
+        return delay * random.uniform(1 - REFRESH_JITTER, 1 + REFRESH_JITTER)
+
+    def run(self):
+        while not self._stop_event.wait(self.next_delay()):
+            try:
+                found_live_nodes = self.cluster._background_refresh()
+            except Exception as e:
+                Cluster.logger.debug("Background cluster refresh failed: %s" % (e))
+                found_live_nodes = False
+
+            if found_live_nodes:
+                self.failures = 0
+            else:
+                self.failures += 1
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class _NodeAccessLock(object):
+    """
+    Lets any number of callers use the nodes of a cluster at once, while the
+    background refresher, which reconnects them, waits until none does. A
+    waiting refresh holds off new callers so it is not starved.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._users = 0
+        self._refreshing = False
+        self._waiting_refreshes = 0
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def use(self):
+        # Re-entrant per thread, a caller already using the nodes must not
+        # wait for a refresh which is waiting for it.
+        depth = getattr(self._local, "depth", 0)
+
+        if not depth:
+            with self._condition:
+                while self._refreshing or self._waiting_refreshes:
+                    self._condition.wait()
+
+                self._users += 1
+
+        self._local.depth = depth + 1
+
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+
+            if not depth:
+                with self._condition:
+                    self._users -= 1
+
+                    if not self._users:
+                        self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def refresh(self):
+        with self._condition:
+            self._waiting_refreshes += 1
+
+            try:
+                while self._refreshing or self._users:
+                    self._condition.wait()
+            finally:
+                self._waiting_refreshes -= 1
+
+            self._refreshing = True
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._refreshing = False
+                self._condition.notify_all()
+
 
 class Cluster(object):
     # Kinda like a singleton... All instantiated classes will share the same
@@ -35,6 +149,13 @@ class Cluster(object):
     cluster_state = {}
     use_services_alumni = False
     use_services_alt = False
+    # Run node methods which have an asyncio variant (<method>_async) for all
+    # nodes on a single event loop instead of a thread per node.
+    use_async_info = False
+    # Seconds between crawls of the background refresher, 0 crawls inline
+    # from call_node_method when the node list is older than
+    # CLUSTER_REFRESH_INTERVAL.
+    background_refresh_interval = 0
     crawl_lock = threading.Lock()
     logger = logging.getLogger("asadm")
 
@@ -85,8 +206,13 @@ class Cluster(object):
         # crawl the cluster search for nodes in addition to the seed nodes.
         self.last_cluster_refresh_time = 0
         self.only_connect_seed = only_connect_seed
+        self._refresher = None
+        self._node_access = _NodeAccessLock()
         self._refresh_cluster()
 
+        if Cluster.background_refresh_interval > 0:
+            self.start_background_refresh(Cluster.background_refresh_interval)
+
         # to avoid same label (NODE column) for multiple nodes we need to keep track
         # of available nodes name, if names are same then we can use ip:port
         self._same_name_nodes = False
@@ -238,18 +364,25 @@ class Cluster(object):
         peers = []
         aliases = {}
         if self.nodes:
-            for node_key in list(self.nodes.keys()):
-                node = self.nodes[node_key]
-                node.refresh_connection()
+            known_nodes = list(self.nodes.items())
+
+            # Nodes whose peers-generation did not change are not reconnected,
+            # the others are refreshed concurrently.
+            client_util.concurrent_map(
+                lambda node: node.refresh_topology(),
+                [node for _, node in known_nodes],
+            )
+
+            for node_key, node in known_nodes:
                 if node.key != node_key:
                     # change in service list
                     self.nodes.pop(node_key)
                     self.update_node(node)
                 _endpoints = node.service_addresses
                 self.update_aliases(aliases, _endpoints, node.key)
-                added_endpoints = added_endpoints + _endpoints
+                added_endpoints.extend(_endpoints)
                 if not self.only_connect_seed:
-                    peers = peers + node.peers
+                    peers.extend(node.peers)
         else:
             peers = self._seed_nodes
 
@@ -263,7 +396,13 @@ class Cluster(object):
             # But it will keep peers-list as it is, so we will check it again
             # while crawling and update missing endpoints(IPv6) to aliases
             nodes_to_add = list(set(peers) - set(added_endpoints))
-            self.aliases = copy.deepcopy(aliases)
+
+            # Apply the membership diff in place, readers keep a consistent
+            # view of the aliases of the nodes which did not change.
+            for alias in [a for a in self.aliases if a not in aliases]:
+                del self.aliases[alias]
+
+            self.aliases.update(aliases)
 
         return nodes_to_add
 
@@ -441,6 +580,10 @@ class Cluster(object):
             return []
 
     def need_to_refresh_cluster(self):
+        if self._refresher is not None and self._refresher.is_alive():
+            # Kept up to date by the background refresher.
+            return False
+
         if time() - self.last_cluster_refresh_time > CLUSTER_REFRESH_INTERVAL:
             return True
         return False
@@ -455,6 +598,39 @@ class Cluster(object):
                 print(e)
                 raise e
 
+    def _background_refresh(self):
+        """
+        Crawls the cluster from the background refresher. Returns True if at
+        least one node is alive.
+        """
+        # Nodes are reconnected in place, wait until no command is using them.
+        with Cluster.crawl_lock, self._node_access.refresh():
+            # Crawl into copies, callers which are iterating over the current
+            # node list or aliases do not see them change size.
+            self.nodes = dict(self.nodes)
+            self.aliases = dict(self.aliases)
+            self._crawl()
+            # _crawl() returns early when there is no new peer, known nodes
+            # may have died all the same.
+            self._refresh_node_liveliness()
+            self.last_cluster_refresh_time = time()
+
+        return len(self._live_nodes) > 0
+
+    def start_background_refresh(self, interval):
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._refresher = ClusterRefresher(self, interval)
+        self._refresher.start()
+
+    def stop_background_refresh(self):
+        refresher = self._refresher
+        self._refresher = None
+
+        if refresher is not None:
+            refresher.stop()
+
     def call_node_method(self, nodes, method_name, *args, **kwargs):
         """
         Run a particular method command across a set of nodes
@@ -481,6 +657,24 @@ class Cluster(object):
             raise TypeError("nodes should be 'all' or list found %s" % type(nodes))
         if len(use_nodes) == 0:
             raise IOError("Unable to find any Aerospike nodes")
+
+        # The background refresher does not reconnect nodes while they run.
+        with self._node_access.use():
+            return self._call_node_method(use_nodes, method_name, *args, **kwargs)
+
+    def _call_node_method(self, use_nodes, method_name, *args, **kwargs):
+        async_method_name = method_name + "_async"
+
+        if Cluster.use_async_info and all(
+            hasattr(node, async_method_name) and node.supports_async_info()
+            for node in use_nodes
+        ):
+            return async_assocket.run_coroutine(
+                self._call_node_method_async(
+                    use_nodes, async_method_name, *args, **kwargs
+                )
+            )
+
         return dict(
             client_util.concurrent_map(
                 lambda node: (node.key, getattr(node, method_name)(*args, **kwargs)),
@@ -488,12 +682,30 @@ class Cluster(object):
             )
         )
 
+    @staticmethod
+    async def _call_node_method_async(use_nodes, method_name, *args, **kwargs):
+        results = await asyncio.gather(
+            *[getattr(node, method_name)(*args, **kwargs) for node in use_nodes],
+            return_exceptions=True
+        )
+
+        return dict(zip([node.key for node in use_nodes], results))
+
     def is_XDR_enabled(self, nodes="all"):
         return self.call_node_method(nodes, "is_XDR_enabled")
 
     def is_feature_present(self, feature, nodes="all"):
         return self.call_node_method(nodes, "is_feature_present", feature)
 
+    def get_profile(self, nodes="all"):
+        return self.call_node_method(nodes, "get_profile")
+
+    def get_socket_pool_statistics(self, nodes="all"):
+        return self.call_node_method(nodes, "get_socket_pool_statistics")
+
+    def get_info_cache_statistics(self, nodes="all"):
+        return self.call_node_method(nodes, "get_info_cache_statistics")
+
     def get_IP_to_node_map(self):
         if self.need_to_refresh_cluster():
             self._refresh_cluster()
@@ -542,6 +754,8 @@ class Cluster(object):
             raise AttributeError("Cluster has not attribute '%s'" % (name))
 
     def close(self):
+        self.stop_background_refresh()
+
         for node_key in self.nodes.keys():
             try:
                 node = self.nodes[node_key]
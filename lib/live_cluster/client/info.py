@@ -123,15 +123,30 @@ def _unpack_protocol_header(buf, offset=0):
 
 
 def _receive_data(sock, sz):
+    """
+    Reads exactly sz bytes from sock into a preallocated bytearray. The size
+    is always known upfront from the protocol header so the response is
+    assembled in place instead of concatenating chunks.
+    """
+    data = bytearray(sz)
+    view = memoryview(data)
     pos = 0
-    data = None
+
+    # Older PyOpenSSL connections do not provide recv_into.
+    recv_into = getattr(sock, "recv_into", None)
+
     while pos < sz:
-        chunk = sock.recv(sz - pos)
-        if pos == 0:
-            data = chunk
+        if recv_into is not None:
+            n = recv_into(view[pos:], sz - pos)
         else:
-            data += chunk
-        pos += len(chunk)
+            chunk = sock.recv(sz - pos)
+            n = len(chunk)
+            view[pos : pos + n] = chunk
+
+        if n == 0:
+            raise IOError("Connection closed by peer")
+
+        pos += n
 
     return data
 
@@ -537,7 +552,7 @@ def _send_and_get_admin_header(sock, send_buf):
     return rsp_header
 
 
-def _authenticate(sock, user, password, password_field_id):
+def _create_authenticate_request(user, password, password_field_id):
     field_count = 2
     admin_data_size = len(user) + len(password)
 
@@ -546,6 +561,11 @@ def _authenticate(sock, user, password, password_field_id):
     )
     offset = _pack_admin_field(send_buf, offset, ASField.USER, user)
     offset = _pack_admin_field(send_buf, offset, password_field_id, password)
+    return send_buf
+
+
+def _authenticate(sock, user, password, password_field_id):
+    send_buf = _create_authenticate_request(user, password, password_field_id)
 
     try:
         # OpenSSL wrapper doesn't support ctypes
@@ -1183,7 +1203,7 @@ def _parse_session_info(data, field_count):
     return session_token, session_ttl
 
 
-def login(sock, user, password, auth_mode):
+def _create_login_request(user, password, auth_mode):
     credential = _hash_password(password)
 
     if auth_mode == constants.AuthMode.INTERNAL:
@@ -1206,11 +1226,29 @@ def login(sock, user, password, auth_mode):
         offset = _pack_admin_field(send_buf, offset, ASField.CREDENTIAL, credential)
         offset = _pack_admin_field(send_buf, offset, ASField.CLEAR_PASSWORD, password)
 
+    # OpenSSL wrapper doesn't support ctypes
+    return _c_str_to_bytes(send_buf)
+
+
+def _parse_login_session(recv_buff, field_count):
+    session_token, session_ttl = _parse_session_info(recv_buff, field_count)
+    session_token = _c_str_to_bytes(session_token)
+
+    if session_ttl is None:
+        session_expiration = 0
+    else:
+        # Subtract 60 seconds from ttl so asadm session expires before server session.
+        session_expiration = time() + session_ttl - 60
+
+    return session_token, session_expiration
+
+
+def login(sock, user, password, auth_mode):
+    send_buf = _create_login_request(user, password, auth_mode)
+
     try:
-        # OpenSSL wrapper doesn't support ctypes
-        send_buf = _c_str_to_bytes(send_buf)
         sock.sendall(send_buf)
-        recv_buff = _receive_data(sock, _PROTOCOL_HEADER_SIZE + _ADMIN_HEADER_SIZE)
+        recv_buff = _receive_data(sock, _TOTAL_HEADER_SIZE)
         _, _, data_size, offset = _unpack_protocol_header(recv_buff)
         _, return_code, _, field_count, _ = _unpack_admin_header(recv_buff)
         data_size -= _ADMIN_HEADER_SIZE
@@ -1228,14 +1266,9 @@ def login(sock, user, password, auth_mode):
         if data_size < 0 or field_count < 1:
             raise IOError("Login failed to retrieve session token")
         recv_buff = _receive_data(sock, data_size)
-        session_token, session_ttl = _parse_session_info(recv_buff, field_count)
-        session_token = _c_str_to_bytes(session_token)
-
-        if session_ttl is None:
-            session_expiration = 0
-        else:
-            # Subtract 60 seconds from ttl so asadm session expires before server session.
-            session_expiration = time() + session_ttl - 60
+        session_token, session_expiration = _parse_login_session(
+            recv_buff, field_count
+        )
 
         return 0, session_token, session_expiration
 
@@ -1265,7 +1298,7 @@ def _info_request(sock, buf):
 
         sock.send(buf)
         # get response
-        rsp_hdr = sock.recv(8)
+        rsp_hdr = _receive_data(sock, _PROTOCOL_HEADER_SIZE)
         _, _, data_size, _ = _unpack_protocol_header(rsp_hdr)
 
         if data_size > 0:
@@ -1281,9 +1314,7 @@ def _info_request(sock, buf):
     return rsp_data
 
 
-def info(sock, names=None):
-    if not sock:
-        raise IOError("Error: Could not connect to node")
+def _create_info_request(names=None):
     buf = None
     # Passed a set of names: created output buf
     if names is None:
@@ -1310,16 +1341,31 @@ def info(sock, names=None):
         )
         offset = _pack_info_field(buf, offset, namestr)
 
-    rsp_data = _info_request(sock, buf)
-    rsp_data = util.bytes_to_str(rsp_data)
+    # OpenSSL does not support c-types
+    return bytes(buf)
 
-    if rsp_data == -1 or rsp_data is None:
-        return -1
+
+def _parse_info_response(names, rsp_data):
+    # Lines are parsed directly out of the receive buffer, only the names and
+    # values are decoded.
+    rsp_view = memoryview(rsp_data)
+    rsp_size = len(rsp_data)
 
     # if the original request was a single string, return a single string
     if isinstance(names, str):
-        lines = rsp_data.split("\n")
-        name, sep, value = lines[0].partition("\t")
+        end = rsp_data.find(b"\n")
+
+        if end == -1:
+            end = rsp_size
+
+        sep = rsp_data.find(b"\t", 0, end)
+
+        if sep == -1:
+            name = str(rsp_view[:end], "utf-8")
+            value = ""
+        else:
+            name = str(rsp_view[:sep], "utf-8")
+            value = str(rsp_view[sep + 1 : end], "utf-8")
 
         if name != names:
             print(" problem: requested name ", names, " got name ", name)
@@ -1328,13 +1374,43 @@ def info(sock, names=None):
 
     else:
         rdict = dict()
-        for line in rsp_data.split("\n"):
-            if len(line) < 1:
+        start = 0
+
+        while start < rsp_size:
+            end = rsp_data.find(b"\n", start)
+
+            if end == -1:
+                end = rsp_size
+
+            if end == start:
                 # this accounts for the trailing '\n' - cheaper than chomp
+                start = end + 1
                 continue
-            name, sep, value = line.partition("\t")
-            rdict[name] = value
+
+            sep = rsp_data.find(b"\t", start, end)
+
+            if sep == -1:
+                rdict[str(rsp_view[start:end], "utf-8")] = ""
+            else:
+                rdict[str(rsp_view[start:sep], "utf-8")] = str(
+                    rsp_view[sep + 1 : end], "utf-8"
+                )
+
+            start = end + 1
+
         return rdict
 
 
+def info(sock, names=None):
+    if not sock:
+        raise IOError("Error: Could not connect to node")
+
+    rsp_data = _info_request(sock, _create_info_request(names))
+
+    if rsp_data == -1 or rsp_data is None:
+        return -1
+
+    return _parse_info_response(names, rsp_data)
+
+
 ###############################
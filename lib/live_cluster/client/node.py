@@ -13,13 +13,16 @@
 # limitations under the License.
 import traceback
 
+import asyncio
 import copy
+import functools
 import logging
 import os
 import re
 import socket
 import threading
 import time
+import uuid
 import base64
 
 from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_parser import conf_parser
@@ -27,6 +30,10 @@ from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_parser import full
 from lib.utils import common, constants, util
 
 from .assocket import ASSocket
+from .async_assocket import AsyncASSocket
+from .node_profile import NodeProfile
+from .socket_pool import SocketPool
+from . import async_assocket
 from . import client_util
 
 #### Remote Server connection module
@@ -80,9 +87,99 @@ def return_exceptions(func):
     return wrapper
 
 
+def return_exceptions_async(func):
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            args[0].alive = False
+            return e
+
+    return wrapper
+
+
+# TTLs in seconds of cached info responses. Static facts about a node only
+# change on upgrade or restart, everything else (statistics, configs, ...) is
+# kept just long enough to serve the concurrent requests of one command.
+# connect() drops all entries of the node, so static facts are re-read on
+# every (re)connection. "node" is not static, connect() relies on it to check
+# that the node is reachable.
+INFO_CACHE_STATIC_TTL = 120.0
+INFO_CACHE_DEFAULT_TTL = 0.5
+INFO_CACHE_STATIC_COMMANDS = frozenset(
+    ["build", "build_os", "edition", "features", "version"]
+)
+
+
+def info_cache_ttl(node, command, *args):
+    if isinstance(command, str) and command in INFO_CACHE_STATIC_COMMANDS:
+        return INFO_CACHE_STATIC_TTL
+
+    return INFO_CACHE_DEFAULT_TTL
+
+
+# Maximum number of info commands packed into a single request by
+# Node.info_batch().
+INFO_BATCH_MAX_SIZE = 256
+
+# SSH sessions used for remote system statistics are kept per node and
+# reused until they have been idle for this many seconds.
+SSH_SESSION_IDLE_TIMEOUT = 300.0
+# Seconds allowed per system command of the remote system statistics script.
+SYS_CMD_TIMEOUT = 30
+
+
+def _build_system_script(sys_cmds, commands, marker):
+    """
+    Returns the lines of a shell script which runs the system commands of the
+    requested keys in one go. Alternatives of a key are tried in order until
+    one exits successfully with output, which is printed between a
+    "<marker> <key> <index>" line and a "<marker>" line. The marker is
+    assembled at runtime so the terminal echo of the script never contains
+    it. Commands read from /dev/null, the rest of the script is on stdin.
+    """
+    lines = ['m=%s""%s' % (marker[: len(marker) // 2], marker[len(marker) // 2 :])]
+
+    for key, _, cmds in sys_cmds:
+        if key not in commands:
+            continue
+
+        lines.append("d=")
+
+        for index, cmd in enumerate(cmds):
+            if not cmd:
+                continue
+
+            lines.append(
+                'if [ -z "$d" ]; then o=$({ %s; } </dev/null 2>&1); '
+                'if [ $? -eq 0 ] && [ -n "$o" ]; then d=1; '
+                'printf "%%s %s %d\\n%%s\\n%%s\\n" "$m" "$o" "$m"; fi; fi'
+                % (cmd, key, index)
+            )
+
+    return lines
+
+
+def _parse_system_script_output(output, marker):
+    """
+    Returns {key: (command index, output)} for every section printed by a
+    script from _build_system_script(). Sections cut off by a timeout are
+    dropped.
+    """
+    sections = {}
+    marker = re.escape(marker)
+    pattern = re.compile(
+        r"%s (\S+) (\d+)\r?\n(.*?)\r?\n%s\r?\n" % (marker, marker), re.DOTALL
+    )
+
+    for key, index, out in pattern.findall(output + "\n"):
+        sections[key] = (int(index), out)
+
+    return sections
+
+
 class Node(object):
     dns_cache = {}
-    pool_lock = threading.Lock()
 
     def __init__(
         self,
@@ -143,6 +240,11 @@ class Node(object):
         self.sys_default_user_id = None
         self.sys_default_pwd = None
         self.sys_default_ssh_key = None
+        # Pooled SSH session, see _checkout_ssh_session().
+        self._ssh_lock = threading.Lock()
+        self._ssh_session = None
+        self._ssh_session_credentials = None
+        self._ssh_session_last_used = 0
         self.sys_cmds = [
             # format: (command name as in parser, ignore error, command list)
             ("hostname", False, ["hostname -I", "hostname"]),
@@ -214,10 +316,27 @@ class Node(object):
         self.conf_data = {}
 
     def _initialize_socket_pool(self):
-        self.socket_pool = {}
-        self.socket_pool[self.port] = set()
-        self.socket_pool[self.xdr_port] = set()
-        self.socket_pool_max_size = 3
+        # Pools (and their statistics) survive reconnects, close() only drops
+        # the pooled connections.
+        if not getattr(self, "socket_pool", None):
+            self.socket_pool = {}
+
+        # Idle AsyncASSockets by port and in-flight async requests, only
+        # touched from the event loop thread.
+        if not getattr(self, "async_socket_pool", None):
+            self.async_socket_pool = {}
+            self.async_in_flight = {}
+
+        self._get_socket_pool(self.port)
+        self._get_socket_pool(self.xdr_port)
+
+    def _get_socket_pool(self, port):
+        pool = self.socket_pool.get(port)
+
+        if pool is None:
+            pool = self.socket_pool.setdefault(port, SocketPool())
+
+        return pool
 
     def _is_any_my_ip(self, ips):
         if not ips:
@@ -228,6 +347,10 @@ class Node(object):
         return False
 
     def connect(self, address, port):
+        # The node may have been upgraded or restarted since the cached build,
+        # edition and features were read.
+        self.clear_info_cache()
+
         try:
             if not self.login():
                 raise IOError("Login Error")
@@ -237,7 +360,11 @@ class Node(object):
                 # Not able to connect this address
                 raise self.node_id
 
-            self.features = self.info("features")
+            self.profile = NodeProfile(
+                build=self.info_build_version(),
+                edition=self.info("edition"),
+                features=self.info("features"),
+            )
             self.use_peers_list = self.is_feature_present(feature="peers")
 
             # Original address may not be the service address, the
@@ -248,7 +375,9 @@ class Node(object):
             # else : might be it's IP is not available, node should try all old
             # service addresses
 
-            self.close()
+            # Keeps the pooled SSH session, it does not depend on the info
+            # connections.
+            self._close_connections()
             self._initialize_socket_pool()
             _current_host = (self.ip, self.port, self.tls_name)
             if (
@@ -282,7 +411,6 @@ class Node(object):
             self._key = hash(self._service_IP_port)
             if self.has_peers_changed():
                 self.peers = self.info_peers_list()
-            self.new_histogram_version = self._is_new_histogram_version()
             self.alive = True
 
         except Exception:
@@ -295,22 +423,52 @@ class Node(object):
 
             self.node_id = "000000000000000"
             self.service_addresses = [(self.ip, self.port, self.tls_name)]
-            self.features = ""
+            self.profile = NodeProfile()
             self.use_peers_list = False
             self.peers = []
-            self.use_new_histogram_format = False
             self.alive = False
 
     def refresh_connection(self):
         self.connect(self.ip, self.port)
 
-    def login(self):
-        if self.user is None:
-            return True
+    def refresh_topology(self):
+        """
+        Periodic refresh used by the cluster crawl. A live node whose node id
+        and peers-generation did not change keeps its service addresses,
+        peers and pooled connections. Otherwise the node reconnects and
+        re-reads them.
 
-        if not self.perform_login and (
-            self.session_expiration == 0 or self.session_expiration > time.time()
+        Returns:
+        bool -- True if the node had to reconnect.
+        """
+        if (
+            self.alive
+            and self.use_peers_list
+            and self.peers_generation != -1
+            and not self._is_login_required()
         ):
+            resp = self.info_batch(["node", "peers-generation"])
+
+            if (
+                not isinstance(resp, Exception)
+                and resp.get("node") == self.node_id
+                and resp.get("peers-generation") == self.peers_generation
+            ):
+                return False
+
+        self.refresh_connection()
+        return True
+
+    def _is_login_required(self):
+        if self.user is None:
+            return False
+
+        return self.perform_login or (
+            self.session_expiration != 0 and self.session_expiration <= time.time()
+        )
+
+    def login(self):
+        if not self._is_login_required():
             return True
 
         sock = ASSocket(
@@ -392,9 +550,16 @@ class Node(object):
         return False
 
     def is_feature_present(self, feature):
-        if not self.features or isinstance(self.features, Exception):
-            return False
-        return feature in self.features
+        return self.profile.has_feature(feature)
+
+    def get_profile(self):
+        """
+        Get the capabilities read when the node was (re)connected.
+
+        Returns:
+        NodeProfile -- build, edition, features and derived protocol flags
+        """
+        return self.profile
 
     def has_peers_changed(self):
         try:
@@ -410,35 +575,14 @@ class Node(object):
         except Exception:
             return True
 
-    def _is_new_histogram_version(self):
-        as_version = self.info_build_version()
-        if isinstance(as_version, Exception):
-            return False
-
-        return common.is_new_histogram_version(as_version)
-
     def _get_connection(self, ip, port):
-        sock = None
-
-        with Node.pool_lock:
-
-            try:
-                while True:
-
-                    sock = self.socket_pool[port].pop()
-
-                    if sock.is_connected():
-                        if not self.ssl_context:
-                            sock.settimeout(self._timeout)
-                        break
-
-                    sock.close()
-                    sock = None
-
-            except Exception:
-                pass
+        pool = self._get_socket_pool(port)
+        sock = pool.get()
 
         if sock:
+            if not self.ssl_context:
+                sock.settimeout(self._timeout)
+
             return sock
 
         sock = ASSocket(
@@ -452,30 +596,69 @@ class Node(object):
             timeout=self._timeout,
         )
 
+        start_time = time.time()
+
         if sock.connect():
             if sock.authenticate(self.session_token):
+                pool.record_connect(time.time() - start_time)
                 return sock
             elif self.session_token is not None:
                 # login enabled.... might be session_token expired, need to perform login again
                 self.perform_login = True
 
+        pool.record_connect(time.time() - start_time, success=False)
         return None
 
-    def close(self):
+    def _put_connection(self, sock, port):
+        """
+        Restore the socket in the pool, the pool closes it if it is full.
+        """
         try:
-            while True:
-                sock = self.socket_pool[self.port].pop()
-                sock.close()
+            sock.settimeout(None)
+            self._get_socket_pool(port).put(sock)
         except Exception:
-            pass
+            sock.close()
 
-        try:
-            while True:
-                sock = self.socket_pool[self.xdr_port].pop()
-                sock.close()
-        except Exception:
-            pass
-        self.socket_pool = None
+    def close(self):
+        self._close_connections()
+        self._close_ssh_session()
+
+    def _close_connections(self):
+        for pool in list(self.socket_pool.values()):
+            pool.close()
+
+        async_assocket.call_soon(self._close_async_connections)
+
+    def _close_async_connections(self):
+        for pool in self.async_socket_pool.values():
+            while pool:
+                pool.pop().close()
+
+    def get_socket_pool_statistics(self):
+        """
+        Get connection pool counters for this node.
+
+        Returns:
+        dict -- {port: {counter_name: counter_value, ...}, ...}
+        """
+        return {
+            port: pool.get_statistics() for port, pool in self.socket_pool.items()
+        }
+
+    def clear_info_cache(self):
+        """
+        Drop the cached info responses of this node.
+        """
+        Node._info_cinfo_single_flight.clear(self)
+
+    def get_info_cache_statistics(self):
+        """
+        Get info response cache counters for this node.
+
+        Returns:
+        dict -- {counter_name: counter_value, ...}
+        """
+        return Node._info_cinfo_single_flight.get_statistics(self)
 
     ############################################################################
     #
@@ -493,14 +676,23 @@ class Node(object):
     # issues in future process.
 
     @return_exceptions
-    @client_util.cached
     def _info_cinfo(self, command, ip=None, port=None):
         # TODO: citrusleaf.py does not support passing a timeout default is
         # 0.5s
+        # command may also be a tuple of commands in which case all of them are
+        # sent in a single request and a dict of command -> response is
+        # returned. See info_batch().
         if ip is None:
             ip = self.ip
         if port is None:
             port = self.port
+
+        # Defaults are filled in first so every spelling of a request shares
+        # the cache entry and the in-flight call of the cache.
+        return self._info_cinfo_single_flight(command, ip, port)
+
+    @functools.partial(client_util.cached, ttl_policy=info_cache_ttl)
+    def _info_cinfo_single_flight(self, command, ip, port):
         result = None
 
         sock = self._get_connection(ip, port)
@@ -510,22 +702,13 @@ class Node(object):
         try:
             if sock:
                 result = sock.info(command)
-                try:
-                    if len(self.socket_pool[port]) < self.socket_pool_max_size:
-                        sock.settimeout(None)
-                        self.socket_pool[port].add(sock)
-
-                    else:
-                        sock.close()
-
-                except Exception:
-                    sock.close()
+                self._put_connection(sock, port)
 
             if result != -1 and result is not None:
                 return result
 
             else:
-                raise IOError("Error: Invalid command '%s'" % command)
+                raise IOError("Error: Invalid command '%s'" % (command,))
 
         except Exception as ex:
             if sock:
@@ -542,8 +725,177 @@ class Node(object):
         """
         return self._info_cinfo(command, self.ip)
 
+    def supports_async_info(self):
+        # AsyncASSocket does not support TLS.
+        return self.ssl_context is None
+
+    async def _get_async_connection(self, ip, port):
+        pool = self.async_socket_pool.setdefault(port, [])
+
+        while pool:
+            sock = pool.pop()
+
+            if sock.is_alive():
+                return sock
+
+            sock.close()
+
+        sock = AsyncASSocket(
+            ip, port, self.user, self.password, self.auth_mode, timeout=self._timeout
+        )
+
+        if await sock.connect():
+            if await sock.authenticate(self.session_token):
+                return sock
+            elif self.session_token is not None:
+                # login enabled.... might be session_token expired, need to perform login again
+                self.perform_login = True
+
+        sock.close()
+        return None
+
+    async def _info_cinfo_async(self, command, ip=None, port=None):
+        """
+        asyncio variant of _info_cinfo(). Must run on the shared event loop.
+        Responses are shared with _info_cinfo() through the same TTL cache.
+        Concurrent identical requests share a single network call, requests
+        on the event loop are coalesced separately from requests of threads
+        because the loop must not block on a thread's in-flight call.
+        """
+        if ip is None:
+            ip = self.ip
+        if port is None:
+            port = self.port
+
+        cache = Node._info_cinfo_single_flight
+        found, result = cache.peek((self, command, ip, port))
+
+        if found:
+            return result
+
+        key = (command, ip, port)
+        in_flight = self.async_in_flight.get(key)
+
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        in_flight = asyncio.ensure_future(
+            self._info_cinfo_async_request(command, ip, port)
+        )
+        self.async_in_flight[key] = in_flight
+
+        try:
+            result = await asyncio.shield(in_flight)
+        finally:
+            if self.async_in_flight.get(key) is in_flight:
+                del self.async_in_flight[key]
+
+        cache[(self, command, ip, port)] = result
+        return result
+
+    async def _info_cinfo_async_request(self, command, ip, port):
+        sock = await self._get_async_connection(ip, port)
+        if not sock:
+            raise IOError("Error: Could not connect to node %s" % ip)
+
+        try:
+            result = await sock.info(command)
+        except Exception:
+            sock.close()
+            raise
+
+        pool = self.async_socket_pool.setdefault(port, [])
+
+        if len(pool) < self._get_socket_pool(port).max_size:
+            pool.append(sock)
+        else:
+            sock.close()
+
+        if result != -1 and result is not None:
+            return result
+
+        raise IOError("Error: Invalid command '%s'" % (command,))
+
+    @return_exceptions_async
+    async def info_async(self, command):
+        """
+        asyncio variant of info(), used by Cluster.call_node_method to query
+        all nodes from a single event loop.
+
+        Arguments:
+        command -- the info command to execute on this node
+        """
+        return await self._info_cinfo_async(command, self.ip)
+
+    @return_exceptions
+    def info_batch(self, commands, port=None):
+        """
+        asinfo function equivalent for several commands. Commands are packed
+        into as few requests as possible and the tab separated response is
+        demultiplexed per command.
+
+        Arguments:
+        commands -- list of info commands to execute on this node
+        port -- port to send the commands to, defaults to the service port
+
+        Returns:
+        dict -- {command: response or Exception, ...}
+        """
+        # Remove duplicates but keep the order of the commands.
+        commands = list(dict.fromkeys(commands))
+        chunks = [
+            tuple(commands[i : i + INFO_BATCH_MAX_SIZE])
+            for i in range(0, len(commands), INFO_BATCH_MAX_SIZE)
+        ]
+
+        # Requests are sent concurrently, but never more at a time than the
+        # socket pool keeps connections for.
+        pool = self._get_socket_pool(self.port if port is None else port)
+        parallel = max(1, pool.max_size)
+        result = {}
+
+        for i in range(0, len(chunks), parallel):
+            wave = chunks[i : i + parallel]
+
+            if len(wave) == 1:
+                responses = [self._info_batch_chunk(wave[0], port)]
+            else:
+                responses = client_util.concurrent_map(
+                    lambda chunk: self._info_batch_chunk(chunk, port), wave
+                )
+
+            for response in responses:
+                result.update(response)
+
+        return result
+
+    def _info_batch_chunk(self, chunk, port):
+        if len(chunk) == 1:
+            # No need to demultiplex, use the single command path and its
+            # response name check.
+            if port is None:
+                return {chunk[0]: self._info_cinfo(chunk[0], self.ip)}
+
+            return {chunk[0]: self._info_cinfo(chunk[0], self.ip, port)}
+
+        if port is None:
+            resp = self._info_cinfo(chunk, self.ip)
+        else:
+            resp = self._info_cinfo(chunk, self.ip, port)
+
+        result = {}
+
+        for command in chunk:
+            if isinstance(resp, Exception):
+                result[command] = resp
+            elif command in resp:
+                result[command] = resp[command]
+            else:
+                result[command] = IOError("Error: Invalid command '%s'" % command)
+
+        return result
+
     @return_exceptions
-    @client_util.cached
     def xdr_info(self, command):
         """
         asinfo -p [xdr-port] equivalent
@@ -877,6 +1229,18 @@ class Node(object):
 
         return client_util.info_to_dict(self.info("statistics"))
 
+    @return_exceptions
+    def info_timed_statistics(self):
+        """
+        Get statistics for this node and the time the response arrived.
+
+        Returns:
+        tuple -- (seconds since the epoch, statistic name -> value)
+        """
+
+        stats = client_util.info_to_dict(self.info("statistics"))
+        return time.time(), stats
+
     @return_exceptions
     def info_namespaces(self):
         """
@@ -897,7 +1261,15 @@ class Node(object):
         dict -- {stat_name : stat_value, ...}
         """
 
-        ns_stat = client_util.info_to_dict(self.info("namespace/%s" % namespace))
+        return self._info_namespace_statistics_helper(
+            self.info("namespace/%s" % namespace)
+        )
+
+    def _info_namespace_statistics_helper(self, ns_stat):
+        """
+        Takes an info namespace/<ns> response and returns a dict.
+        """
+        ns_stat = client_util.info_to_dict(ns_stat)
 
         # Due to new server feature namespace add/remove with rolling restart,
         # there is possibility that different nodes will have different namespaces.
@@ -918,9 +1290,16 @@ class Node(object):
         if isinstance(namespaces, Exception):
             return namespaces
 
+        responses = self.info_batch(["namespace/%s" % ns for ns in namespaces])
+
+        if isinstance(responses, Exception):
+            return responses
+
         stats = {}
         for ns in namespaces:
-            stats[ns] = self.info_namespace_statistics(ns)
+            stats[ns] = self._info_namespace_statistics_helper(
+                responses["namespace/%s" % ns]
+            )
 
         return stats
 
@@ -990,7 +1369,7 @@ class Node(object):
         """
         # for new aerospike version (>=3.8) with
         # xdr-in-asd stats available on service port
-        if int(self.info_build_version()[0]) < 5:
+        if not self.profile.xdr5:
             if self.is_feature_present("xdr"):
                 return client_util.info_to_dict(self.info("statistics/xdr"))
 
@@ -1008,7 +1387,6 @@ class Node(object):
         Returns:
         dict -- stanza --> [namespace] --> param --> value
         """
-        xdr_major_version = int(self.info_build_version()[0])
         config = {}
         if stanza == "namespace":
             if namespace != "":
@@ -1026,17 +1404,28 @@ class Node(object):
             else:
                 namespace_configs = {}
                 namespaces = self.info_namespaces()
+                responses = self.info_batch(
+                    [
+                        "get-config:context=namespace;id=%s" % namespace
+                        for namespace in namespaces
+                    ]
+                )
+
                 for index, namespace in enumerate(namespaces):
-                    namespace_config = self.info_get_config(
-                        "namespace", namespace, namespace_id=index
+                    namespace_config = client_util.info_to_dict(
+                        responses["get-config:context=namespace;id=%s" % namespace]
                     )
-                    namespace_config = namespace_config[namespace]
+
+                    if isinstance(namespace_config, Exception):
+                        raise namespace_config
+
+                    namespace_config["nsid"] = str(index)
                     namespace_configs[namespace] = namespace_config
                 config = namespace_configs
 
         elif stanza == "" or stanza == "service":
             config = client_util.info_to_dict(self.info("get-config:"))
-        elif stanza == "xdr" and xdr_major_version >= 5:
+        elif stanza == "xdr" and self.profile.xdr5:
             xdr_config = {}
             xdr_config["dc_configs"] = {}
             xdr_config["ns_configs"] = {}
@@ -1044,24 +1433,40 @@ class Node(object):
                 self.info("get-config:context=xdr")
             )
 
-            for dc in xdr_config["xdr_configs"]["dcs"].split(","):
-                dc_config = self.info("get-config:context=xdr;dc=%s" % dc)
+            dcs = xdr_config["xdr_configs"]["dcs"].split(",")
+            dc_responses = self.info_batch(
+                ["get-config:context=xdr;dc=%s" % dc for dc in dcs]
+            )
+            ns_commands = []
+
+            for dc in dcs:
+                dc_config = dc_responses["get-config:context=xdr;dc=%s" % dc]
+
+                if isinstance(dc_config, Exception):
+                    raise dc_config
+
                 xdr_config["ns_configs"][dc] = {}
                 xdr_config["dc_configs"][dc] = client_util.info_to_dict(dc_config)
 
                 start_namespaces = dc_config.find("namespaces=") + len("namespaces=")
                 end_namespaces = dc_config.find(";", start_namespaces)
-                namespaces = (
-                    ns for ns in dc_config[start_namespaces:end_namespaces].split(",")
-                )
+                namespaces = dc_config[start_namespaces:end_namespaces].split(",")
 
-                for namespace in namespaces:
-                    namespace_config = self.info(
-                        "get-config:context=xdr;dc=%s;namespace=%s" % (dc, namespace)
-                    )
-                    xdr_config["ns_configs"][dc][namespace] = client_util.info_to_dict(
-                        namespace_config
+                ns_commands.extend(
+                    (
+                        dc,
+                        namespace,
+                        "get-config:context=xdr;dc=%s;namespace=%s" % (dc, namespace),
                     )
+                    for namespace in namespaces
+                )
+
+            ns_responses = self.info_batch([command for _, _, command in ns_commands])
+
+            for dc, namespace, command in ns_commands:
+                xdr_config["ns_configs"][dc][namespace] = client_util.info_to_dict(
+                    ns_responses[command]
+                )
 
             config = xdr_config
         elif stanza != "all":
@@ -1298,15 +1703,19 @@ class Node(object):
             ]
 
         hist_info = []
+        responses = self.info_batch(cmd_latencies)
+
         for cmd in cmd_latencies:
-            try:
-                hist_info.append(self.info(cmd))
-            except Exception:
+            resp = responses[cmd]
+
+            if isinstance(resp, Exception):
                 return data
-            if hist_info[-1].startswith("error"):
-                hist_info.pop()
+
+            if resp.startswith("error"):
                 continue
 
+            hist_info.append(resp)
+
         # example hist info after join:
         # batch-index:;{test}-read:msec,0.0,0.00,0.00,0.00,0.00,0.00,0.00,0.00,0.00,0.00,0.00, /
         # 0.00,0.00,0.00,0.00,0.00,0.00,0.00;{test}-write:msec,0.0,0.00,0.00,0.00,0.00,0.00,0.00, /
@@ -1418,10 +1827,8 @@ class Node(object):
         Returns:
         list -- list of dcs
         """
-        xdr_major_version = int(self.info_build_version()[0])
-
         # for server versions >= 5 using XDR5.0
-        if xdr_major_version >= 5:
+        if self.profile.xdr5:
             xdr_data = None
 
             if self.is_feature_present("xdr"):
@@ -1453,10 +1860,8 @@ class Node(object):
         Returns:
         dict -- {stat_name : stat_value, ...}
         """
-        xdr_major_version = int(self.info_build_version()[0])
-
         # If xdr version is < XDR5.0 return output of old asinfo command.
-        if xdr_major_version < 5:
+        if not self.profile.xdr5:
 
             if self.is_feature_present("xdr"):
                 return client_util.info_to_dict(self.info("dc/%s" % dc))
@@ -1480,9 +1885,24 @@ class Node(object):
         if isinstance(dcs, Exception):
             return {}
 
+        if not self.profile.xdr5:
+            command = "dc/%s"
+        else:
+            command = "get-stats:context=xdr;dc=%s"
+
+        if self.is_feature_present("xdr"):
+            port = None
+        else:
+            port = self.xdr_port
+
+        responses = self.info_batch([command % dc for dc in dcs], port=port)
+
+        if isinstance(responses, Exception):
+            return {}
+
         stats = {}
         for dc in dcs:
-            stat = self.info_dc_statistics(dc)
+            stat = client_util.info_to_dict(responses[command % dc])
             if not stat or isinstance(stat, Exception):
                 stat = {}
             stats[dc] = stat
@@ -1658,11 +2078,14 @@ class Node(object):
         self, histogram, command, logarithmic=False, raw_output=False
     ):
         namespaces = self.info_namespaces()
+        responses = self.info_batch(
+            [command % (namespace, histogram) for namespace in namespaces]
+        )
 
         data = {}
         for namespace in namespaces:
             try:
-                datum = self.info(command % (namespace, histogram))
+                datum = responses[command % (namespace, histogram)]
                 if not datum or isinstance(datum, Exception):
                     continue
 
@@ -1671,7 +2094,7 @@ class Node(object):
 
                 else:
                     d = common.parse_raw_histogram(
-                        histogram, datum, logarithmic, self.new_histogram_version
+                        histogram, datum, logarithmic, self.profile.new_histogram_version
                     )
                     if d and not isinstance(d, Exception):
                         data[namespace] = d
@@ -1683,7 +2106,7 @@ class Node(object):
 
     @return_exceptions
     def info_histogram(self, histogram, logarithmic=False, raw_output=False):
-        if not self.new_histogram_version:
+        if not self.profile.new_histogram_version:
             return self._collect_histogram_data(
                 histogram, command="hist-dump:ns=%s;hist=%s", raw_output=raw_output
             )
@@ -1726,6 +2149,29 @@ class Node(object):
             self.info("sindex/%s/%s" % (namespace, indexname))
         )
 
+    @return_exceptions
+    def info_all_sindex_statistics(self, sindexes):
+        """
+        Get statistics for several sindexes in one batched request.
+
+        Arguments:
+        sindexes -- list of (namespace, indexname) tuples
+
+        Returns:
+        dict -- {(namespace, indexname): {stat_name : stat_value, ...}, ...}
+        """
+        command = "sindex/%s/%s"
+        responses = self.info_batch([command % sindex for sindex in sindexes])
+
+        if isinstance(responses, Exception):
+            return responses
+
+        stats = {}
+        for sindex in sindexes:
+            stats[sindex] = client_util.info_to_dict(responses[command % sindex])
+
+        return stats
+
     @return_exceptions
     def info_sindex_create(
         self, index_name, namespace, bin_name, bin_type, index_type=None, set_=None
@@ -1799,11 +2245,7 @@ class Node(object):
             result = admin_func(sock, *args)
 
             # Either restore the socket in the pool or close it if it is full.
-            if len(self.socket_pool[port]) < self.socket_pool_max_size:
-                sock.settimeout(None)
-                self.socket_pool[port].add(sock)
-            else:
-                sock.close()
+            self._put_connection(sock, port)
 
         except Exception:
             if sock:
@@ -2141,6 +2583,29 @@ class Node(object):
         self.sys_ssh_key = self.sys_default_ssh_key
         self.sys_ssh_port = self.sys_default_ssh_port
 
+    def _run_localhost_system_command(self, cmds, ignore_error):
+        """
+        Runs the alternatives of a system command until one succeeds. Returns
+        its output or None.
+        """
+        for cmd in cmds:
+            if not cmd:
+                continue
+
+            self.logger.debug(
+                ("{}._get_localhost_system_statistics running cmd={}").format(
+                    self.ip, cmd,
+                ),
+                stackinfo=True,
+            )
+            o, e = util.shell_command([cmd], timeout=SYS_CMD_TIMEOUT)
+            if (e and not ignore_error) or not o:
+                continue
+
+            return o
+
+        return None
+
     @return_exceptions
     def _get_localhost_system_statistics(self, commands):
         sys_stats = {}
@@ -2150,27 +2615,28 @@ class Node(object):
             stackinfo=True,
         )
 
-        for _key, ignore_error, cmds in self.sys_cmds:
-            if _key not in commands:
-                continue
+        # Commands run concurrently and are parsed in sys_cmds order.
+        outputs = [
+            (
+                _key,
+                util.Future(
+                    self._run_localhost_system_command, cmds, ignore_error
+                ).start(),
+            )
+            for _key, ignore_error, cmds in self.sys_cmds
+            if _key in commands
+        ]
 
-            for cmd in cmds:
-                self.logger.debug(
-                    ("{}._get_localhost_system_statistics running cmd={}").format(
-                        self.ip, cmd,
-                    ),
-                    stackinfo=True,
-                )
-                o, e = util.shell_command([cmd])
-                if (e and not ignore_error) or not o:
-                    continue
+        for _key, output in outputs:
+            o = output.result()
 
-                try:
-                    full_parser.parse_system_live_command(_key, o, sys_stats)
-                except Exception:
-                    pass
+            if not o:
+                continue
 
-                break
+            try:
+                full_parser.parse_system_live_command(_key, o, sys_stats)
+            except Exception:
+                pass
 
         return sys_stats
 
@@ -2331,32 +2797,43 @@ class Node(object):
 
         return None
 
-    @return_exceptions
-    def _execute_remote_system_command(self, conn, cmd):
-        if not conn or not cmd or PEXPECT_VERSION == NO_MODULE:
-            return None
+    def _execute_remote_system_script(self, conn, lines, timeout):
+        """
+        Runs a script from _build_system_script() through the login shell of
+        the session, whatever it is, with bash if available so commands may
+        use bash expansions.
+
+        Returns:
+        tuple -- (True if the script finished within timeout, output so far)
+        """
+        eof = "ASADM_SCRIPT_EOF"
+        conn.sendline(
+            "sh -c 'if command -v bash >/dev/null 2>&1; then exec bash; "
+            "else exec sh; fi' <<'%s'" % (eof)
+        )
+
+        for line in lines:
+            conn.sendline(line)
+
+        conn.sendline(eof)
 
-        conn.sendline(cmd)
         if PEXPECT_VERSION == NEW_MODULE:
-            conn.prompt()
-        elif PEXPECT_VERSION == OLD_MODULE:
-            conn.expect(self.remote_system_command_prompt)
+            finished = conn.prompt(timeout=timeout)
         else:
-            return None
-        return conn.before
+            finished = (
+                conn.expect(
+                    [self.remote_system_command_prompt, pexpect.TIMEOUT],
+                    timeout=timeout,
+                )
+                == 0
+            )
 
-    @return_exceptions
-    def _execute_system_command(self, conn, cmd):
-        out = self._execute_remote_system_command(conn, cmd)
-        status = self._execute_remote_system_command(conn, "echo $?")
-        status = status.split("\r\n")
-        status = status[1].strip() if len(status) > 1 else status[0].strip()
-        try:
-            status = int(status)
-        except Exception:
-            status = 1
+        out = conn.before
+
+        if isinstance(out, bytes):
+            out = out.decode("utf-8", "replace")
 
-        return status, out
+        return finished, out
 
     @return_exceptions
     def _stop_ssh_connection(self, conn):
@@ -2378,6 +2855,46 @@ class Node(object):
 
         self.remote_system_command_prompt = "[#$] "
 
+    def _checkout_ssh_session(self, credentials):
+        """
+        Takes the pooled SSH session if it was opened with the same
+        credentials and is still usable. Must be called with _ssh_lock held.
+        """
+        conn = self._ssh_session
+        self._ssh_session = None
+
+        if conn is None:
+            return None
+
+        if (
+            self._ssh_session_credentials == credentials
+            and time.time() - self._ssh_session_last_used <= SSH_SESSION_IDLE_TIMEOUT
+            and conn.isalive()
+        ):
+            return conn
+
+        self._stop_ssh_connection(conn)
+        conn.close()
+        return None
+
+    def _return_ssh_session(self, conn, credentials):
+        """
+        Keeps the session for the next collection. Must be called with
+        _ssh_lock held.
+        """
+        self._ssh_session = conn
+        self._ssh_session_credentials = credentials
+        self._ssh_session_last_used = time.time()
+
+    def _close_ssh_session(self):
+        with self._ssh_lock:
+            conn = self._ssh_session
+            self._ssh_session = None
+
+        if conn is not None:
+            self._stop_ssh_connection(conn)
+            conn.close()
+
     @return_exceptions
     def _get_remote_host_system_statistics(self, commands):
         sys_stats = {}
@@ -2389,79 +2906,103 @@ class Node(object):
             )
             return sys_stats
 
-        sys_stats_collected = False
         self._set_system_credentials()
-        max_tries = 1
-        tries = 0
-
-        while tries < max_tries and not sys_stats_collected:
-            tries += 1
-            s = None
-
-            try:
-                s = self._create_ssh_connection(
-                    self.ip,
-                    self.sys_user_id,
-                    self.sys_pwd,
-                    self.sys_ssh_key,
-                    self.sys_ssh_port,
-                )
-                if not s:
-                    raise Exception("Wrong credentials to connect.")
-
-                if isinstance(s, Exception):
-                    raise s
-
-            except Exception as e:
-                if tries >= max_tries:
-                    self.logger.warning(
-                        "Ignoring system statistics collection. Couldn't make SSH login to remote server %s:%s. \n%s"
-                        % (
-                            str(self.ip),
-                            "22"
-                            if self.sys_ssh_port is None
-                            else str(self.sys_ssh_port),
-                            str(e),
+        # The address is part of it, the node may have moved on reconnect.
+        credentials = (
+            self.ip,
+            self.sys_user_id,
+            self.sys_pwd,
+            self.sys_ssh_key,
+            self.sys_ssh_port,
+        )
+        marker = "ASADM_%s" % (uuid.uuid4().hex)
+        lines = _build_system_script(self.sys_cmds, commands, marker)
+        timeout = SYS_CMD_TIMEOUT * max(1, len(commands))
+
+        with self._ssh_lock:
+            # A pooled session may have been dropped by the server while idle,
+            # in that case retry once with a new session.
+            s = self._checkout_ssh_session(credentials)
+            max_tries = 2 if s else 1
+            tries = 0
+
+            while tries < max_tries:
+                tries += 1
+
+                if s is None:
+                    try:
+                        s = self._create_ssh_connection(
+                            self.ip,
+                            self.sys_user_id,
+                            self.sys_pwd,
+                            self.sys_ssh_key,
+                            self.sys_ssh_port,
+                        )
+                        if not s:
+                            raise Exception("Wrong credentials to connect.")
+
+                        if isinstance(s, Exception):
+                            raise s
+
+                    except Exception as e:
+                        self.logger.warning(
+                            "Ignoring system statistics collection. Couldn't make SSH login to remote server %s:%s. \n%s"
+                            % (
+                                str(self.ip),
+                                "22"
+                                if self.sys_ssh_port is None
+                                else str(self.sys_ssh_port),
+                                str(e),
+                            )
                         )
+                        return sys_stats
+
+                try:
+                    finished, out = self._execute_remote_system_script(
+                        s, lines, timeout
                     )
+                except Exception as e:
+                    s.close()
+                    s = None
+
+                    if tries >= max_tries:
+                        self.logger.error(
+                            "Ignoring system statistics collection. Couldn't get or parse remote system stats for remote server %s:%s. \n%s"
+                            % (
+                                str(self.ip),
+                                "22"
+                                if self.sys_ssh_port is None
+                                else str(self.sys_ssh_port),
+                                str(e),
+                            )
+                        )
 
-                continue
+                    continue
 
-            try:
-                for _key, _, cmds in self.sys_cmds:
-                    if _key not in commands:
-                        continue
+                if finished:
+                    self._return_ssh_session(s, credentials)
+                else:
+                    # The shell is still busy, it can not be reused.
+                    s.close()
 
-                    for cmd in cmds:
-                        try:
-                            status, o = self._execute_system_command(s, cmd)
-                            if status or not o or isinstance(o, Exception):
-                                continue
-                            full_parser.parse_system_live_command(_key, o, sys_stats)
-                            break
+                break
 
-                        except Exception:
-                            pass
+        sections = _parse_system_script_output(out, marker) if s else {}
 
-                sys_stats_collected = True
-                self._stop_ssh_connection(s)
-
-            except Exception as e:
-                if tries >= max_tries:
-                    self.logger.error(
-                        "Ignoring system statistics collection. Couldn't get or parse remote system stats for remote server %s:%s. \n%s"
-                        % (
-                            str(self.ip),
-                            "22"
-                            if self.sys_ssh_port is None
-                            else str(self.sys_ssh_port),
-                            str(e),
-                        )
-                    )
+        for _key, _, cmds in self.sys_cmds:
+            if _key not in sections:
+                continue
 
-            finally:
-                if s and not isinstance(s, Exception):
-                    s.close()
+            index, o = sections[_key]
+
+            try:
+                # Same form as a command typed at the prompt: command line
+                # followed by its output.
+                full_parser.parse_system_live_command(
+                    _key, "%s\r\n%s\r\n" % (cmds[index], o), sys_stats
+                )
+            except Exception:
+                pass
 
         return sys_stats
 
@@ -0,0 +1,53 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from distutils.version import LooseVersion
+
+from lib.utils import common, constants
+
+
+class NodeProfile(object):
+    """
+    Capabilities of a node which only change on upgrade. Node reads them once
+    per connection and version dependent code consults the profile instead of
+    re-querying build and features for every request.
+    """
+
+    def __init__(self, build="", edition="", features=""):
+        self.build = self._valid(build)
+        self.edition = self._valid(edition)
+        self.features = self._valid(features)
+
+        self.new_histogram_version = common.is_new_histogram_version(self.build)
+        self.new_latencies_version = common.is_new_latencies_version(self.build)
+        self.xdr5 = bool(self.build) and LooseVersion(
+            constants.SERVER_NEW_XDR5_VERSION
+        ) <= LooseVersion(self.build)
+
+    @staticmethod
+    def _valid(value):
+        if not value or isinstance(value, Exception):
+            return ""
+
+        return value
+
+    def has_feature(self, feature):
+        return feature in self.features
+
+    def __repr__(self):
+        return "NodeProfile(build=%r, edition=%r, features=%r)" % (
+            self.build,
+            self.edition,
+            self.features,
+        )
@@ -0,0 +1,199 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+from time import time
+
+
+class SocketPool(object):
+    """
+    Bounded pool of idle ASSocket connections to a single (node, port).
+
+    Every pool has its own lock so nodes do not contend with each other. Idle
+    connections are reused most recently used first, connections which have
+    been idle for longer than idle_timeout or which are older than
+    max_lifetime are evicted. At least min_size idle connections are kept
+    regardless of idle_timeout.
+    """
+
+    # Defaults for new pools, asadm overrides these from the command line or
+    # config file.
+    max_size = 3
+    min_size = 0
+    idle_timeout = 30.0
+    max_lifetime = 600.0
+
+    def __init__(
+        self, max_size=None, min_size=None, idle_timeout=None, max_lifetime=None
+    ):
+        if max_size is not None:
+            self.max_size = max_size
+
+        if min_size is not None:
+            self.min_size = min_size
+
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+
+        if max_lifetime is not None:
+            self.max_lifetime = max_lifetime
+
+        self._lock = threading.Lock()
+        # Oldest idle connection on the left, most recently used on the right.
+        self._sockets = collections.deque()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connects = 0
+        self.connect_failures = 0
+        self.connect_time_total = 0.0
+        self.connect_time_max = 0.0
+
+    def __len__(self):
+        return len(self._sockets)
+
+    def _is_expired(self, sock, now):
+        if self.max_lifetime and now - sock.created_at > self.max_lifetime:
+            return True
+
+        return False
+
+    def _evict(self, now):
+        """
+        Removes expired connections and idle connections above min_size. Must
+        be called with the lock held. Returns the evicted connections so they
+        can be closed outside of the lock.
+        """
+        evicted = []
+
+        for sock in list(self._sockets):
+            if self._is_expired(sock, now):
+                self._sockets.remove(sock)
+                evicted.append(sock)
+
+        while len(self._sockets) > self.min_size:
+            sock = self._sockets[0]
+
+            if not self.idle_timeout or now - sock.last_used <= self.idle_timeout:
+                break
+
+            evicted.append(self._sockets.popleft())
+
+        self.evictions += len(evicted)
+        return evicted
+
+    @staticmethod
+    def _close_all(sockets):
+        for sock in sockets:
+            try:
+                sock.close()
+            except Exception:
+                pass
+
+    def get(self):
+        """
+        Returns an idle connection which passed the liveness probe or None if
+        the caller has to create a new one.
+        """
+        while True:
+            with self._lock:
+                evicted = self._evict(time())
+
+                try:
+                    sock = self._sockets.pop()
+                except IndexError:
+                    sock = None
+                    self.misses += 1
+
+            self._close_all(evicted)
+
+            if sock is None:
+                return None
+
+            if sock.is_alive():
+                with self._lock:
+                    self.hits += 1
+
+                return sock
+
+            with self._lock:
+                self.evictions += 1
+
+            sock.close()
+
+    def put(self, sock):
+        """
+        Returns a connection to the pool. It is closed if the pool is full or
+        the connection has reached max_lifetime.
+        """
+        now = time()
+
+        with self._lock:
+            evicted = self._evict(now)
+
+            if len(self._sockets) < self.max_size and not self._is_expired(
+                sock, now
+            ):
+                self._sockets.append(sock)
+                sock = None
+            else:
+                self.evictions += 1
+
+        self._close_all(evicted)
+
+        if sock is not None:
+            sock.close()
+
+    def record_connect(self, elapsed, success=True):
+        """
+        Records the latency of establishing (and authenticating) a new
+        connection.
+        """
+        with self._lock:
+            if not success:
+                self.connect_failures += 1
+                return
+
+            self.connects += 1
+            self.connect_time_total += elapsed
+            self.connect_time_max = max(self.connect_time_max, elapsed)
+
+    def close(self):
+        with self._lock:
+            sockets = list(self._sockets)
+            self._sockets.clear()
+
+        self._close_all(sockets)
+
+    def get_statistics(self):
+        with self._lock:
+            avg_connect_time = 0.0
+
+            if self.connects:
+                avg_connect_time = self.connect_time_total / self.connects
+
+            return {
+                "idle": len(self._sockets),
+                "max-size": self.max_size,
+                "min-size": self.min_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "connects": self.connects,
+                "connect-failures": self.connect_failures,
+                "avg-connect-ms": round(avg_connect_time * 1000, 3),
+                "max-connect-ms": round(self.connect_time_max * 1000, 3),
+            }
@@ -1,5 +1,4 @@
 import copy
-import json
 import shutil
 from distutils.version import LooseVersion
 import time
@@ -204,10 +203,10 @@ class CollectinfoController(LiveClusterCommandController):
                 if isinstance(data[section][node], Exception):
                     data[section][node] = {}
 
-    def _get_as_data_json(self):
+    def _get_as_data_json(self, collection_times=None):
         as_map = {}
         getter = GetStatisticsController(self.cluster)
-        stats = getter.get_all(nodes=self.nodes)
+        stats = getter.get_all(nodes=self.nodes, collection_times=collection_times)
 
         getter = GetConfigController(self.cluster)
         config = getter.get_all(nodes=self.nodes, flip=False)
@@ -381,17 +380,6 @@ class CollectinfoController(LiveClusterCommandController):
 
         return acl_map
 
-    def _dump_in_json_file(self, as_logfile_prefix, dump):
-        self.logger.info("Dumping collectinfo in JSON format.")
-        self.aslogfile = as_logfile_prefix + "ascinfo.json"
-
-        try:
-            json_dump = json.dumps(dump, indent=4, separators=(",", ":"))
-            with open(self.aslogfile, "w") as f:
-                f.write(json_dump)
-        except Exception as e:
-            self.logger.error("Failed to write JSON file: " + str(e))
-
     def _get_collectinfo_data_json(
         self,
         default_user,
@@ -428,7 +416,8 @@ class CollectinfoController(LiveClusterCommandController):
 
         cluster_names = util.Future(self.cluster.info, "cluster-name").start()
 
-        as_map = self._get_as_data_json()
+        collection_times = {}
+        as_map = self._get_as_data_json(collection_times)
 
         for node in as_map:
             dump_map[node] = {}
@@ -438,6 +427,14 @@ class CollectinfoController(LiveClusterCommandController):
             if node in meta_map:
                 dump_map[node]["as_stat"]["meta_data"] = meta_map[node]
 
+            # Time the node's statistics were read, rates derived from
+            # consecutive snapshots should use it rather than the snapshot
+            # timestamp.
+            if node in collection_times:
+                dump_map[node]["as_stat"].setdefault("meta_data", {})[
+                    "collection_time"
+                ] = round(collection_times[node], 3)
+
             if node in histogram_map:
                 dump_map[node]["as_stat"]["histogram"] = histogram_map[node]
 
@@ -480,27 +477,92 @@ class CollectinfoController(LiveClusterCommandController):
         enable_ssh,
         snp_count,
         wait_time,
+        compact_json=False,
+        gzip_json=False,
     ):
-        snpshots = {}
+        self.logger.info("Dumping collectinfo in JSON format.")
+        writer = common.CollectinfoJsonWriter(
+            as_logfile_prefix + "ascinfo.json", compact=compact_json, compress=gzip_json
+        )
+        self.aslogfile = writer.path
 
-        for i in range(snp_count):
+        try:
+            writer.open()
+        except Exception as e:
+            self.logger.error("Failed to write JSON file: " + str(e))
+            writer = None
 
-            snp_timestamp = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-            self.logger.info(
-                "Data collection for Snapshot: " + str(i + 1) + " in progress..."
-            )
-            snpshots[snp_timestamp] = self._get_collectinfo_data_json(
-                default_user,
-                default_pwd,
-                default_ssh_port,
-                default_ssh_key,
-                credential_file,
-                enable_ssh,
-            )
+        # Snapshots start every wait_time seconds regardless of how long
+        # collection takes. Snapshot N is written in the background while
+        # snapshot N+1 is collected, so at most two are held in memory.
+        next_start = time.time()
+        pending_write = None
 
-            time.sleep(wait_time)
+        try:
+            for i in range(snp_count):
+                if i:
+                    next_start += wait_time
+                    delay = next_start - time.time()
+
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Collection overran the interval, start right away
+                        # and keep the interval from here on.
+                        next_start = time.time()
+
+                snp_timestamp = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+                self.logger.info(
+                    "Data collection for Snapshot: " + str(i + 1) + " in progress..."
+                )
+                snapshot = self._get_collectinfo_data_json(
+                    default_user,
+                    default_pwd,
+                    default_ssh_port,
+                    default_ssh_key,
+                    credential_file,
+                    enable_ssh,
+                )
 
-        self._dump_in_json_file(as_logfile_prefix, snpshots)
+                writer = self._wait_for_json_write(writer, pending_write)
+                pending_write = None
+
+                if writer is not None:
+                    pending_write = util.Future(
+                        writer.write, snp_timestamp, snapshot
+                    ).start()
+
+                snapshot = None
+        finally:
+            writer = self._wait_for_json_write(writer, pending_write)
+
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception as e:
+                    self.logger.error("Failed to write JSON file: " + str(e))
+
+    def _wait_for_json_write(self, writer, pending_write):
+        """
+        Waits for a snapshot to be written. Returns the writer, or None if
+        writing failed and the JSON dump has been abandoned.
+        """
+        if pending_write is None:
+            return writer
+
+        try:
+            pending_write.result()
+        except Exception as e:
+            self.logger.error("Failed to write JSON file: " + str(e))
+
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+            return None
+
+        return writer
 
     ###########################################################################
     # Functions for dumping pretty print files
@@ -727,6 +789,8 @@ class CollectinfoController(LiveClusterCommandController):
         enable_ssh=False,
         output_prefix="",
         config_path="",
+        compact_json=False,
+        gzip_json=False,
     ):
 
         # JSON collectinfo snapshot count check
@@ -757,6 +821,8 @@ class CollectinfoController(LiveClusterCommandController):
             enable_ssh,
             snp_count,
             wait_time,
+            compact_json=compact_json,
+            gzip_json=gzip_json,
         )
 
         # Pretty print collectinfo
@@ -798,6 +864,22 @@ class CollectinfoController(LiveClusterCommandController):
             mods=self.mods,
         )
 
+        compact_json = util.check_arg_and_delete_from_mods(
+            line=line,
+            arg="--compact-json",
+            default=False,
+            modifiers=self.modifiers,
+            mods=self.mods,
+        )
+
+        gzip_json = util.check_arg_and_delete_from_mods(
+            line=line,
+            arg="--gzip-json",
+            default=False,
+            modifiers=self.modifiers,
+            mods=self.mods,
+        )
+
         default_user = util.get_arg_and_delete_from_mods(
             line=line,
             arg="--ssh-user",
@@ -874,6 +956,8 @@ class CollectinfoController(LiveClusterCommandController):
             enable_ssh=enable_ssh,
             output_prefix=output_prefix,
             config_path=config_path,
+            compact_json=compact_json,
+            gzip_json=gzip_json,
         )
 
     @CommandHelp(
@@ -883,8 +967,11 @@ class CollectinfoController(LiveClusterCommandController):
         "local node only.",
         "  Options:",
         "    -n              <int>        - Number of snapshots. Default: 1",
-        "    -s              <int>        - Sleep time in seconds between each snapshot. Default: 5 sec",
+        "    -t              <int>        - Interval in seconds between the start of consecutive snapshots.",
+        "                                   Default: 5 sec",
         "    --enable-ssh                 - Enables the collection of system statistics from the remote server.",
+        "    --compact-json               - Writes the JSON dump without indentation.",
+        "    --gzip-json                  - Writes the JSON dump gzip compressed.",
         "    --ssh-user      <string>     - Default user ID for remote servers. This is the ID of a user of the",
         "                                   system not the ID of an Aerospike user.",
         "    --ssh-pwd       <string>     - Default password or passphrase for key for remote servers. This is",
@@ -681,8 +681,10 @@ class HealthCheckController(LiveClusterCommandController):
             while sn_ct < snap_count:
                 fetched_as_val = {}
 
-                # Collecting data
-                sys_stats = self.cluster.info_system_statistics(
+                # Collecting data, system statistics and all the stanzas are
+                # fetched concurrently.
+                sys_stats = util.Future(
+                    self.cluster.info_system_statistics,
                     nodes=self.nodes,
                     default_user=default_user,
                     default_pwd=default_pwd,
@@ -690,14 +692,16 @@ class HealthCheckController(LiveClusterCommandController):
                     default_ssh_port=default_ssh_port,
                     credential_file=credential_file,
                     collect_remote_data=enable_ssh,
-                )
+                ).start()
 
                 for _key, (info_function, stanza_list) in stanza_dict.items():
 
                     for stanza_item in stanza_list:
 
                         stanza = stanza_item[0]
-                        fetched_as_val[(_key, stanza)] = info_function(stanza)
+                        fetched_as_val[(_key, stanza)] = util.Future(
+                            info_function, stanza
+                        ).start()
 
                 # Creating health input model
                 for _key, (info_function, stanza_list) in stanza_dict.items():
@@ -707,10 +711,9 @@ class HealthCheckController(LiveClusterCommandController):
                         stanza = stanza_item[0]
                         component_name = stanza_item[1]
 
-                        try:
-                            d = fetched_as_val[(_key, stanza)]
-                        except Exception:
-                            continue
+                        # Stanzas are added to the health input in order while
+                        # the later ones are still being fetched.
+                        d = fetched_as_val[(_key, stanza)].result()
 
                         try:
                             new_tuple_keys = copy.deepcopy(stanza_item[2])
@@ -727,7 +730,7 @@ class HealthCheckController(LiveClusterCommandController):
                             d, health_input, new_tuple_keys, new_component_keys
                         )
 
-                sys_stats = util.flip_keys(sys_stats)
+                sys_stats = util.flip_keys(sys_stats.result())
 
                 for cmd_key, (sys_function, sys_cmd_list) in sys_cmd_dict.items():
 
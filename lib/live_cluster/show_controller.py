@@ -30,6 +30,7 @@ class ShowController(LiveClusterCommandController):
             "roles": ShowRolesController,
             "udfs": ShowUdfsController,
             "sindex": ShowSIndexController,
+            "sockets": ShowSocketsController,
             # TODO
             # 'rosters': ShowRosterController,
             # 'racks': ShowRacksController,
@@ -1053,3 +1054,66 @@ class ShowSIndexController(LiveClusterCommandController):
         resp = list(sindexes_data.values())[0]
 
         return util.Future(self.view.show_sindex, resp, **self.mods)
+
+
+@CommandHelp(
+    '"show sockets" displays asadm connection pool and info response cache',
+    "statistics for each node.",
+    "  Options:",
+    "    -flip        - Flip output table to show Nodes on Y axis and stats on X axis.",
+)
+class ShowSocketsController(LiveClusterCommandController):
+    def __init__(self):
+        self.modifiers = set(["with", "like"])
+
+    def _do_default(self, line):
+        flip_output = util.check_arg_and_delete_from_mods(
+            line=line,
+            arg="-flip",
+            default=False,
+            modifiers=self.modifiers,
+            mods=self.mods,
+        )
+
+        pool_stats = self.cluster.get_socket_pool_statistics(nodes=self.nodes)
+        port_stats = {}
+
+        for node, node_stats in pool_stats.items():
+            if not node_stats or isinstance(node_stats, Exception):
+                continue
+
+            for port, stats in node_stats.items():
+                port_stats.setdefault(port, {})[node] = stats
+
+        cache_stats = self.cluster.get_info_cache_statistics(nodes=self.nodes)
+        cache_stats = {
+            node: stats
+            for node, stats in cache_stats.items()
+            if stats and not isinstance(stats, Exception)
+        }
+
+        futures = [
+            util.Future(
+                self.view.show_stats,
+                "Port %s Socket Pool Statistics" % (port),
+                port_stats[port],
+                self.cluster,
+                flip_output=flip_output,
+                **self.mods
+            )
+            for port in sorted(port_stats.keys())
+        ]
+
+        if cache_stats:
+            futures.append(
+                util.Future(
+                    self.view.show_stats,
+                    "Info Cache Statistics",
+                    cache_stats,
+                    self.cluster,
+                    flip_output=flip_output,
+                    **self.mods
+                )
+            )
+
+        return futures
@@ -21,6 +21,7 @@ import logging
 import operator
 import os
 import distro
+import gzip
 import socket
 import time
 import urllib.request
@@ -1737,7 +1738,17 @@ def _collect_ip_link_details(cmd=""):
     return out, None
 
 
-def _collectinfo_content(func, cmd="", alt_cmds=[]):
+# Seconds a system command collected by collectinfo may run before it is
+# killed.
+SYSTEM_COMMAND_TIMEOUT = 60
+
+
+def _collectinfo_content(func, cmd="", alt_cmds=[], timeout=None):
+    """
+    Runs func(cmd), falling back to the shell commands alt_cmds if it fails.
+    A timeout is passed on to func and the alternatives, func must then
+    accept it as keyword argument like util.shell_command does.
+    """
     fname = ""
     try:
         fname = func.__name__
@@ -1760,7 +1771,10 @@ def _collectinfo_content(func, cmd="", alt_cmds=[]):
     failed_cmds = []
 
     try:
-        o, e = func(cmd)
+        if timeout is None:
+            o, e = func(cmd)
+        else:
+            o, e = func(cmd, timeout=timeout)
     except Exception as e:
         return o_line + str(e), failed_cmds
 
@@ -1782,7 +1796,7 @@ def _collectinfo_content(func, cmd="", alt_cmds=[]):
                 )
                 logger.info(info_line)
                 o_line += str(alt_cmd) + "\n"
-                o_alt, e_alt = util.shell_command(alt_cmd)
+                o_alt, e_alt = util.shell_command(alt_cmd, timeout=timeout)
 
                 if e_alt:
                     e = e_alt
@@ -1813,6 +1827,10 @@ def _zip_files(dir_path, _size=1):
     for root, dirs, files in os.walk(dir_path):
         for _file in files:
             file_path = os.path.join(root, _file)
+            if _file.endswith(".gz"):
+                # Already compressed.
+                continue
+
             size_mb = os.path.getsize(file_path) // (1024 * 1024)
             if size_mb >= _size:
                 os.chdir(root)
@@ -1952,6 +1970,67 @@ def set_collectinfo_path(timestamp, output_prefix=""):
     return aslogdir, as_logfile_prefix
 
 
+class CollectinfoJsonWriter(object):
+    """
+    Writes the collectinfo JSON dump one snapshot at a time, so only the
+    snapshot being written has to be held in memory. The file holds a single
+    JSON object mapping snapshot timestamps to snapshots.
+
+    compact drops indentation, compress writes a gzip file with a ".gz"
+    suffix which the collectinfo analyzer reads as is.
+    """
+
+    def __init__(self, path, compact=False, compress=False):
+        if compress:
+            path += ".gz"
+
+        self.path = path
+        self.compact = compact
+        self.compress = compress
+        self.snapshot_count = 0
+        self._file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        if self.compress:
+            self._file = gzip.open(self.path, "wt", compresslevel=6)
+        else:
+            self._file = open(self.path, "w")
+
+        self._file.write("{")
+        return self
+
+    def write(self, timestamp, snapshot):
+        if self.compact:
+            separator = ""
+            dump = json.dumps(snapshot, separators=(",", ":"))
+        else:
+            separator = "\n"
+            dump = json.dumps(snapshot, indent=4, separators=(",", ":"))
+
+        if self.snapshot_count:
+            separator = "," + separator
+
+        self._file.write("%s%s:%s" % (separator, json.dumps(timestamp), dump))
+        self._file.flush()
+        self.snapshot_count += 1
+
+    def close(self):
+        if self._file is None:
+            return
+
+        try:
+            self._file.write("}" if self.compact else "\n}\n")
+        finally:
+            self._file.close()
+            self._file = None
+
+
 def archive_log(logdir):
     _zip_files(logdir)
     util.shell_command(["tar -czvf " + logdir + ".tgz " + logdir])
@@ -1989,60 +2068,46 @@ def collect_sys_info(port=3000, timestamp="", outfile=""):
 
     util.write_to_file(outfile, timestamp)
 
+    # Commands run concurrently, outputs are written in the usual order.
+    tasks = []
+
     try:
         for cmds in get_system_commands(port=port):
-            o, f_cmds = _collectinfo_content(
-                func=util.shell_command,
-                cmd=cmds[0:1],
-                alt_cmds=cmds[1:] if len(cmds) > 1 else [],
+            tasks.append(
+                util.Future(
+                    _collectinfo_content,
+                    util.shell_command,
+                    cmds[0:1],
+                    cmds[1:] if len(cmds) > 1 else [],
+                    timeout=SYSTEM_COMMAND_TIMEOUT,
+                ).start()
             )
-            failed_cmds += f_cmds
-            util.write_to_file(outfile, o)
     except Exception as e:
         print(e)
-        util.write_to_file(outfile, str(e))
-
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_cpuinfo)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
-
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_aws_data)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
-
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_gce_data)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
-
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_azure_data)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
-
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_lsof)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
+        tasks.append(e)
+
+    for func in (
+        _collect_cpuinfo,
+        _collect_aws_data,
+        _collect_gce_data,
+        _collect_azure_data,
+        _collect_lsof,
+        _collect_env_variables,
+        _collect_ip_link_details,
+    ):
+        tasks.append(util.Future(_collectinfo_content, func).start())
 
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_env_variables)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
+    for task in tasks:
+        if isinstance(task, Exception):
+            util.write_to_file(outfile, str(task))
+            continue
 
-    try:
-        o, f_cmds = _collectinfo_content(func=_collect_ip_link_details)
-        util.write_to_file(outfile, o)
-    except Exception as e:
-        util.write_to_file(outfile, str(e))
+        try:
+            o, f_cmds = task.result()
+            failed_cmds += f_cmds
+            util.write_to_file(outfile, o)
+        except Exception as e:
+            util.write_to_file(outfile, str(e))
 
     if not cluster_online:
         # Cluster is offline so collecting only system info and archiving files
@@ -66,6 +66,13 @@ _confdefault = {
     "asadm": {
         "services-alumni": False,
         "timeout": 5,
+        "pool-max-size": 3,
+        "pool-min-size": 0,
+        "pool-idle-timeout": 30,
+        "pool-max-lifetime": 600,
+        "thread-pool-size": 64,
+        "async-info": False,
+        "refresh-interval": 0,
         "line-separator": False,
         "no-color": False,
         "out-file": "",
@@ -110,6 +117,13 @@ _confspec = """{
             "properties" : {
                 "services-alumni" : { "type" : "boolean" },
                 "timeout" : { "type" : "integer" },
+                "pool-max-size" : { "type" : "integer" },
+                "pool-min-size" : { "type" : "integer" },
+                "pool-idle-timeout" : { "type" : "number" },
+                "pool-max-lifetime" : { "type" : "number" },
+                "thread-pool-size" : { "type" : "integer" },
+                "async-info" : { "type" : "boolean" },
+                "refresh-interval" : { "type" : "number" },
 
                 "line-separator": { "type" : "boolean" },
                 "no-color": { "type" : "boolean" },
@@ -429,6 +443,8 @@ def loadconfig(cli_args, logger):
     except Exception:
         logger.critical("Wrong authentication mode: " + str(asadm_dict["auth"]))
 
+    _validate_pool_options(asadm_dict, logger)
+
     # Find seed nods
     seeds = _getseeds(asadm_dict)
     args = _Namespace(asadm_dict)
@@ -452,6 +468,37 @@ def loadconfig(cli_args, logger):
     return args, seeds
 
 
+def _validate_pool_options(asadm_dict, logger):
+    """
+    Rejects connection and thread pool sizes and times which would break
+    connection checkout or the thread pool.
+    """
+    for name, minimum in (
+        ("pool_max_size", 1),
+        ("pool_min_size", 0),
+        ("thread_pool_size", 1),
+    ):
+        if asadm_dict[name] < minimum:
+            logger.critical(
+                "Wrong --%s: %s, it should be at least %d."
+                % (name.replace("_", "-"), asadm_dict[name], minimum)
+            )
+
+    for name in ("pool_idle_timeout", "pool_max_lifetime"):
+        if asadm_dict[name] <= 0:
+            logger.critical(
+                "Wrong --%s: %s, it should be greater than 0."
+                % (name.replace("_", "-"), asadm_dict[name])
+            )
+
+    if asadm_dict["pool_min_size"] > asadm_dict["pool_max_size"]:
+        logger.critical(
+            "Wrong --pool-min-size: %s, it should not be greater than"
+            " --pool-max-size: %s."
+            % (asadm_dict["pool_min_size"], asadm_dict["pool_max_size"])
+        )
+
+
 def print_config_help():
     print("\n")
     print("Usage: asadm [OPTIONS]")
@@ -615,6 +662,43 @@ def print_config_file_option():
         " --timeout=value      Set timeout value in seconds for node level operations. \n"
         "                      TLS connection does not support timeout. Default: 5 seconds"
     )
+    print(
+        " --pool-max-size=value\n"
+        "                      Maximum number of idle connections kept per node and port.\n"
+        "                      Default: 3"
+    )
+    print(
+        " --pool-min-size=value\n"
+        "                      Number of idle connections per node and port which are kept\n"
+        "                      regardless of --pool-idle-timeout. Default: 0"
+    )
+    print(
+        " --pool-idle-timeout=value\n"
+        "                      Close pooled connections idle for longer than this many\n"
+        "                      seconds. Default: 30 seconds"
+    )
+    print(
+        " --pool-max-lifetime=value\n"
+        "                      Close pooled connections older than this many seconds.\n"
+        "                      Default: 600 seconds"
+    )
+    print(
+        " --thread-pool-size=value\n"
+        "                      Maximum number of worker threads used to run requests\n"
+        "                      concurrently. Default: 64"
+    )
+    print(
+        " --async-info         Send raw info commands, e.g. those of asinfo, to all nodes\n"
+        "                      from a single asyncio event loop instead of one thread per\n"
+        "                      node. Other requests and TLS connections always use\n"
+        "                      threads. Default: disabled"
+    )
+    print(
+        " --refresh-interval=value\n"
+        "                      Refresh the cluster topology from a background thread every\n"
+        "                      this many seconds instead of before commands. Unreachable\n"
+        "                      clusters are retried with backoff. Default: 0, disabled"
+    )
 
 
 def config_file_help():
@@ -712,6 +796,13 @@ def get_cli_args():
     add_fn("-t", "--tls-name")
     add_fn("-s", "--services-alumni", action="store_true")
     add_fn("--timeout", type=float)
+    add_fn("--pool-max-size", type=int)
+    add_fn("--pool-min-size", type=int)
+    add_fn("--pool-idle-timeout", type=float)
+    add_fn("--pool-max-lifetime", type=float)
+    add_fn("--thread-pool-size", type=int)
+    add_fn("--async-info", action="store_true")
+    add_fn("--refresh-interval", type=float)
 
     add_fn("--config-file")
     add_fn("--instance")
@@ -0,0 +1,209 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as TaskTimeoutError
+
+# Process wide pool shared by util.Future and client_util.concurrent_map.
+# asadm overrides the size from the command line or config file.
+DEFAULT_MAX_WORKERS = 64
+
+_PENDING = "pending"
+_RUNNING = "running"
+_FINISHED = "finished"
+_CANCELLED = "cancelled"
+
+_executor_lock = threading.Lock()
+_executor = None
+_max_workers = DEFAULT_MAX_WORKERS
+
+
+def get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="asadm-worker"
+            )
+
+        return _executor
+
+
+def set_max_workers(max_workers):
+    """
+    Resizes the shared pool. Tasks already submitted finish on the old pool.
+    """
+    global _executor, _max_workers
+
+    if max_workers is None or max_workers < 1:
+        raise ValueError("Thread pool size should be a positive integer")
+
+    with _executor_lock:
+        old_executor = _executor
+        _executor = None
+        _max_workers = int(max_workers)
+
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+
+
+def get_max_workers():
+    return _max_workers
+
+
+class Task(object):
+    """
+    A function call scheduled on the shared thread pool.
+
+    Tasks can be nested: a task may start more tasks and wait for them. A
+    waiter which finds its task still queued runs it in its own thread instead
+    of blocking, so a saturated pool can not deadlock. A task which has not
+    started by its deadline is not run and raises TaskTimeoutError.
+    """
+
+    def __init__(self, func, *args, deadline=None, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self.deadline = deadline
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._state = _PENDING
+        self._future = None
+        self._result = None
+        self.exc = None
+
+    def _claim(self):
+        with self._lock:
+            if self._state != _PENDING:
+                return False
+
+            self._state = _RUNNING
+            return True
+
+    def _run(self):
+        """
+        Runs the task unless it already started or was cancelled. Returns True
+        if it ran.
+        """
+        if not self._claim():
+            return False
+
+        try:
+            if self.deadline is not None and time.time() > self.deadline:
+                raise TaskTimeoutError()
+
+            self._result = self._func(*self._args, **self._kwargs)
+        except Exception as e:
+            # Store original stack trace/exception to be re-thrown later.
+            self.exc = e
+        finally:
+            with self._lock:
+                self._state = _FINISHED
+
+            self._done.set()
+
+        return True
+
+    def start(self):
+        if self._future is None:
+            self._future = get_executor().submit(self._run)
+
+        return self
+
+    def cancel(self):
+        """
+        Cancels the task if it has not started running yet. Returns True on
+        success.
+        """
+        with self._lock:
+            if self._state != _PENDING:
+                return self._state == _CANCELLED
+
+            self._state = _CANCELLED
+
+        if self._future is not None:
+            self._future.cancel()
+
+        self._done.set()
+        return True
+
+    def cancelled(self):
+        return self._state == _CANCELLED
+
+    def done(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Waits for the task and returns its result or raises its exception.
+        Raises TaskTimeoutError if it does not finish within timeout seconds
+        and CancelledError if it was cancelled. A task which is still queued
+        runs here instead, and raises TaskTimeoutError if it took too long.
+        """
+        start_time = time.time()
+
+        # Run it here rather than waiting for a worker, nested waiters on a
+        # saturated pool would otherwise time out or deadlock.
+        if self._run():
+            if timeout is not None and time.time() - start_time > timeout:
+                raise TaskTimeoutError()
+        elif not self._done.wait(timeout):
+            raise TaskTimeoutError()
+
+        if self._state == _CANCELLED:
+            raise CancelledError()
+
+        if self.exc:
+            raise self.exc
+
+        return self._result
+
+
+def concurrent_map(func, data, timeout=None):
+    """
+    Similar to the builtin function map() but applies 'func' to every element
+    of 'data' concurrently on the shared thread pool.
+
+    If timeout is given and the results are not ready within timeout seconds,
+    TaskTimeoutError is raised. An exception raised by 'func' is re-raised.
+    Either way calls which have not started yet are cancelled.
+    """
+    deadline = None
+
+    if timeout is not None:
+        deadline = time.time() + timeout
+
+    tasks = [Task(func, datum, deadline=deadline).start() for datum in data]
+    result = []
+
+    try:
+        for task in tasks:
+            remaining = None
+
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.time())
+
+            result.append(task.result(remaining))
+    except Exception:
+        for task in tasks:
+            task.cancel()
+
+        raise
+
+    return result
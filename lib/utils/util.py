@@ -14,14 +14,18 @@
 
 import copy
 import io
+import os
 import pipes
 import re
+import signal
 import socket
 import subprocess
 import sys
 import threading
 import logging
 
+from lib.utils import thread_pool
+
 
 def logthis(log, level):
     logger = logging.getLogger(log)
@@ -45,47 +49,37 @@ def logthis(log, level):
     return _decorator
 
 
-class Future:
+class Future(thread_pool.Task):
 
     """
-    Very basic implementation of a async future.
+    Very basic implementation of a async future, runs on the shared asadm
+    thread pool.
     """
 
-    def __init__(self, func, *args, **kwargs):
-        self._result = None
-
-        args = list(args)
-        args.insert(0, func)
-        self.exc = None
-
-        def wrapper(func, *args, **kwargs):
-            self.exc = None
-            try:
-                self._result = func(*args, **kwargs)
-            except Exception as e:
-                # Store original stack trace/exception to be re-thrown later.
-                self.exc = e
-
-        self._worker = threading.Thread(target=wrapper, args=args, kwargs=kwargs)
-
-    def start(self):
-        self._worker.start()
-        return self
+    pass
 
-    def result(self):
-        if self.exc:
-            raise (self.exc)
 
-        self._worker.join()
-        return self._result
+# Upper bound on the number of shell_command() subprocesses with a timeout
+# running at once, system statistics are collected with many of them
+# concurrently.
+SHELL_COMMAND_MAX_PROCESSES = 8
+_shell_command_slots = threading.BoundedSemaphore(SHELL_COMMAND_MAX_PROCESSES)
 
 
-def shell_command(command):
+def shell_command(command, timeout=None):
     """
     command is a list of ['cmd','arg1','arg2',...]
+    With a timeout at most SHELL_COMMAND_MAX_PROCESSES commands run at once,
+    and a command which runs longer than timeout seconds is killed, together
+    with any processes it started, and the error says so.
     """
     command = pipes.quote(" ".join(command))
     command = ["bash", "-c", "'%s'" % (command)]
+
+    if timeout is not None:
+        with _shell_command_slots:
+            return _shell_command_with_timeout(command, timeout)
+
     try:
         p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
@@ -96,6 +90,37 @@ def shell_command(command):
         return bytes_to_str(out), bytes_to_str(err)
 
 
+def _shell_command_with_timeout(command, timeout):
+    try:
+        # In its own process group, so the processes it starts can be killed.
+        p = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+    except Exception:
+        return "", "error"
+
+    try:
+        out, err = p.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(p.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+        out, err = p.communicate()
+        err = bytes_to_str(err) + "Timed out after %s seconds" % (timeout)
+        return bytes_to_str(out), err
+    except Exception:
+        p.kill()
+        p.wait()
+        return "", "error"
+
+    return bytes_to_str(out), bytes_to_str(err)
+
+
 def capture_stdout(func, line=""):
     """
     Redirecting the stdout to use the output elsewhere
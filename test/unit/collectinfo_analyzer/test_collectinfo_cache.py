@@ -0,0 +1,131 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest2 as unittest
+from mock import patch
+
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_cache import (
+    CollectinfoCache,
+)
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_log import (
+    CollectinfoLog,
+)
+
+
+class CollectinfoCacheTest(unittest.TestCase):
+    data = {"2021-01-01 00:00:00 UTC": {"null": {"node1": {"as_stat": {"a": 1}}}}}
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.cache_dir = os.path.join(self.dir, "cache")
+        self.cache = CollectinfoCache("2.0.0", cache_dir=self.cache_dir)
+        self.files = [self.write("ascollectinfo.log", "content")]
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        return path
+
+    def test_get_key(self):
+        key = self.cache.get_key(self.files)
+
+        self.assertEqual(key, self.cache.get_key(self.files))
+        self.assertNotEqual(
+            key, CollectinfoCache("2.0.1", self.cache_dir).get_key(self.files)
+        )
+
+        self.write("ascollectinfo.log", "changed")
+        self.assertNotEqual(key, self.cache.get_key(self.files))
+        self.assertIsNone(self.cache.get_key([os.path.join(self.dir, "missing")]))
+
+    def test_store_and_load(self):
+        key = self.cache.get_key(self.files)
+
+        self.assertIsNone(self.cache.load(key))
+
+        self.cache.store(key, self.data)
+
+        self.assertEqual(self.cache.load(key), self.data)
+        self.assertEqual(os.listdir(self.cache_dir), [key + ".pickle"])
+
+    def test_load_corrupted(self):
+        key = self.cache.get_key(self.files)
+        self.cache.store(key, self.data)
+
+        with open(os.path.join(self.cache_dir, key + ".pickle"), "wb") as f:
+            f.write(b"garbage")
+
+        self.assertIsNone(self.cache.load(key))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_cache_dir_mode(self):
+        self.cache.store(self.cache.get_key(self.files), self.data)
+
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+
+    def test_load_untrusted(self):
+        key = self.cache.get_key(self.files)
+        path = os.path.join(self.cache_dir, key + ".pickle")
+        self.cache.store(key, self.data)
+
+        os.chmod(path, 0o666)
+        self.assertIsNone(self.cache.load(key))
+        self.assertTrue(os.path.exists(path))
+
+        os.chmod(path, 0o600)
+        self.assertEqual(self.cache.load(key), self.data)
+
+        with patch("os.getuid", return_value=os.getuid() + 1):
+            self.assertIsNone(self.cache.load(key))
+
+    def test_evict(self):
+        cache = CollectinfoCache("2.0.0", cache_dir=self.cache_dir, max_entries=2)
+
+        for i in range(3):
+            cache.store("key%d" % (i), self.data)
+            os.utime(os.path.join(self.cache_dir, "key%d.pickle" % (i)), (i, i))
+
+        cache.store("key3", self.data)
+
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir)), ["key2.pickle", "key3.pickle"]
+        )
+
+    @patch(
+        "lib.collectinfo_analyzer.collectinfo_handler.collectinfo_log."
+        "full_parser.parse_info_all"
+    )
+    def test_collectinfo_log_uses_cache(self, parse_info_all_mock):
+        def parse_info_all(files, parsed_map, ignore_exception, lazy=False):
+            parsed_map.update(copy.deepcopy(self.data))
+
+        parse_info_all_mock.side_effect = parse_info_all
+
+        CollectinfoLog(self.dir, self.files, None, self.cache).destroy()
+        cinfo_log = CollectinfoLog(self.dir, self.files, None, self.cache)
+
+        self.assertEqual(parse_info_all_mock.call_count, 1)
+        self.assertEqual(list(cinfo_log.snapshots.keys()), list(self.data.keys()))
+        self.assertEqual(
+            cinfo_log.snapshots["2021-01-01 00:00:00 UTC"].get_data("a"),
+            {"node1": 1},
+        )
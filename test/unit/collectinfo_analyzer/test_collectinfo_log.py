@@ -0,0 +1,183 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest2 as unittest
+from mock import Mock
+
+from lib.collectinfo_analyzer.collectinfo_handler import collectinfo_log
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_cache import (
+    CollectinfoCache,
+)
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_parser import (
+    full_parser,
+)
+
+
+def _network_record(node_id, ip):
+    return {
+        "Node ID": {"raw": node_id, "converted": node_id},
+        "Build": {"converted": "5.2.0.4"},
+        "IP": {"converted": ip},
+    }
+
+
+class CollectinfoSnapshotTest(unittest.TestCase):
+    timestamp = "2021-01-01 00:00:00 UTC"
+    network = {
+        "groups": [
+            {
+                "records": [
+                    _network_record("BB9000000000001", "10.0.0.1:3000"),
+                    _network_record("BB9000000000002", "10.0.0.2:3000"),
+                ]
+            }
+        ]
+    }
+    # Only the first node has statistics.
+    content = (
+        "2021-01-01 00:00:00 UTC\n"
+        "====ASCOLLECTINFO====\n"
+        "['network']\n" + json.dumps(network) + "\n"
+        "====ASCOLLECTINFO====\n"
+        "['config']\n"
+        "~~~~Service Configuration~~~~\n"
+        "NODE          :   BB9000000000001   BB9000000000002\n"
+        "proto-fd-max  :   15000             15000\n"
+        "====ASCOLLECTINFO====\n"
+        "['statistics']\n"
+        "~~~~Service Statistics~~~~\n"
+        "NODE          :   BB9000000000001\n"
+        "uptime        :   100\n"
+        "~~~~test Namespace Statistics~~~~\n"
+        "NODE          :   BB9000000000001\n"
+        "objects       :   10\n"
+    )
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "ascollectinfo.log")
+
+        with open(self.path, "w") as f:
+            f.write(self.content)
+
+        self.parsed_map = self.parse(lazy=True)
+        self.snapshot = self.create_snapshot(self.parsed_map)
+        self.nodes = self.parsed_map[self.timestamp]["null"]
+
+    def parse(self, lazy):
+        parsed_map = {}
+        full_parser.parse_info_all([self.path], parsed_map, True, lazy=lazy)
+        return parsed_map
+
+    def create_snapshot(self, parsed_map):
+        return collectinfo_log._CollectinfoSnapshot(
+            "null", self.timestamp, parsed_map[self.timestamp]["null"], self.path
+        )
+
+    def test_statistics_are_parsed_on_first_use(self):
+        node1 = self.nodes["BB9000000000001"]["as_stat"]
+
+        self.assertEqual(
+            self.snapshot.nodes["BB9000000000001"].ip, "10.0.0.1:3000"
+        )
+        self.assertIsInstance(node1["config"], dict)
+        self.assertIsInstance(node1["statistics"], full_parser.LazySection)
+
+        self.assertEqual(
+            self.snapshot.get_statistics("namespace"),
+            {
+                "BB9000000000001": {"test": {"objects": "10", "set_count": 0}},
+                "BB9000000000002": {},
+            },
+        )
+        self.assertEqual(node1["statistics"]["service"]["uptime"], "100")
+        self.assertIsNone(node1["statistics"].get("latency"))
+
+    def test_lazy_matches_eager(self):
+        self.snapshot.get_statistics("service")
+
+        self.assertEqual(self.parsed_map, self.parse(lazy=False))
+
+    def test_load_after_pickle(self):
+        # The collectinfo cache stores parsed maps with unparsed sections.
+        parsed_map = pickle.loads(pickle.dumps(self.parsed_map))
+        snapshot = self.create_snapshot(parsed_map)
+
+        self.assertEqual(
+            snapshot.get_statistics("service"),
+            {
+                "BB9000000000001": {"uptime": "100", "ns_count": 1},
+                "BB9000000000002": {},
+            },
+        )
+
+    def test_cache_stores_parsed_sections(self):
+        cache = CollectinfoCache("2.0.0", cache_dir=os.path.join(self.dir, "cache"))
+        cinfo_log = collectinfo_log.CollectinfoLog(
+            self.dir, [self.path], None, cache
+        )
+
+        self.assertIsNone(cache.load(cache.get_key([self.path])))
+
+        cinfo_log.destroy()
+
+        self.assertEqual(
+            cache.load(cache.get_key([self.path])), self.parse(lazy=False)
+        )
+
+    def test_missing_node_section(self):
+        parser = Mock()
+        parser.parse.return_value = {"BB9000000000001": {"a": 1}}
+        cinfo_data = {
+            "BB9000000000001": {"as_stat": {"latency": {}}},
+            "BB9000000000002": {"as_stat": {"latency": {}}},
+        }
+
+        for node_data in cinfo_data.values():
+            node_data["as_stat"]["latency"] = full_parser.LazySection(
+                parser, "latency"
+            )
+
+        snapshot = collectinfo_log._CollectinfoSnapshot(
+            "null", self.timestamp, cinfo_data, self.path
+        )
+
+        self.assertEqual(
+            snapshot.get_data("latency"), {"BB9000000000001": {"a": 1}}
+        )
+        self.assertNotIn("latency", cinfo_data["BB9000000000002"]["as_stat"])
+        parser.parse.assert_called_with("latency")
+
+    def test_ns_name_fault_check_after_load(self):
+        parser = Mock()
+        parser.parse.return_value = {
+            "node1": {"namespace": {"test": {"objects": "1"}, "bad ns": {}}}
+        }
+        statistics = full_parser.LazySection(parser, "statistics")
+        cinfo_data = {"node1": {"as_stat": {"statistics": statistics}}}
+        snapshot = collectinfo_log._CollectinfoSnapshot(
+            "null", self.timestamp, cinfo_data, self.path
+        )
+
+        snapshot.get_statistics("namespace")
+
+        self.assertEqual(
+            list(cinfo_data["node1"]["as_stat"]["statistics"]["namespace"]), ["test"]
+        )
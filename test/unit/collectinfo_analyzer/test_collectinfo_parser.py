@@ -0,0 +1,219 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import shutil
+import tempfile
+import unittest2 as unittest
+
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_parser import (
+    collectinfo_parser,
+)
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_reader import (
+    CollectinfoReader,
+)
+
+FILTER_LIST = collectinfo_parser.FILTER_LIST
+
+
+class SectionMatcherTest(unittest.TestCase):
+    lines = [
+        "Node\n",
+        "Node list\n",
+        "['namespace']\n",
+        "~~~~~~ ['config', 'xdr'] ~~~~~~\n",
+        "asinfo -v objsz\n",
+        "running shell command: top -n3 -b\n",
+        "running shell command: tail -n 1000 /var/log/aerospike/aerospike.log\n",
+        "running shell command: sudo lsof -n\n",
+        "running shell command: sudo lsof | grep asd\n",
+        "iostat -x 1 10\n",
+        "hist-dump:ns=test;hist=ttl\n",
+        "nothing to see here\n",
+    ]
+
+    @staticmethod
+    def search_sections(line, regex):
+        for section_id, section in FILTER_LIST.items():
+            if regex in section and re.search(section[regex], line):
+                return section_id
+
+        return None
+
+    def test_match(self):
+        for regex in ("regex_new", "regex_old"):
+            matcher = collectinfo_parser._get_section_matcher(FILTER_LIST, regex)
+
+            for line in self.lines:
+                self.assertEqual(
+                    matcher.match(line),
+                    self.search_sections(line, regex),
+                    "%s: %r" % (regex, line),
+                )
+
+    def test_declared_literals(self):
+        # Declared literals must be literal parts of the regex, a stale
+        # declaration would hide lines from the regex.
+        for section_id, section in FILTER_LIST.items():
+            for regex, literals in (
+                ("regex_new", "literals_new"),
+                ("regex_old", "literals_old"),
+            ):
+                if regex not in section:
+                    continue
+
+                # Unescape, including one character classes like "[|]".
+                pattern = re.sub(r"\[([^]^\\])\]", r"\1", section[regex])
+                pattern = re.sub(
+                    r"\\(.)",
+                    lambda m: "\n" if m.group(1) == "n" else m.group(1),
+                    pattern,
+                )
+
+                self.assertTrue(section[literals], "%s: %s" % (section_id, regex))
+
+                for literal in section[literals]:
+                    self.assertIn(literal, pattern, "%s: %s" % (section_id, regex))
+
+    def test_match_without_literals(self):
+        section_list = {
+            "ID_1": {"regex_new": r"^Node\n"},
+            "ID_2": {"regex_new": r"\['namespace'\]"},
+        }
+        matcher = collectinfo_parser.SectionMatcher(section_list, "regex_new")
+
+        self.assertEqual(matcher.match("Node\n"), "ID_1")
+        self.assertEqual(matcher.match("['namespace']\n"), "ID_2")
+        self.assertIsNone(matcher.match("nothing\n"))
+
+
+class CollectinfoFileIndexTest(unittest.TestCase):
+    content = (
+        "2021-01-01 00:00:00 UTC\n"
+        "====ASCOLLECTINFO====\n"
+        "Node\n"
+        "node1\n"
+        "node2\n"
+        "====ASCOLLECTINFO====\n"
+        "unknown\n"
+        "\n"
+        "dropped\n"
+        "====ASCOLLECTINFO====\n"
+        "['namespace']\n"
+        "Namespace Information\n"
+        "Configuration (2021-01-01 00:00:00)~~~\n"
+    )
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "ascinfo.txt")
+
+        with open(self.path, "w") as f:
+            f.write(self.content)
+
+    def test_index(self):
+        index = collectinfo_parser.get_file_index(self.path)
+        matcher = collectinfo_parser._get_section_matcher(FILTER_LIST, "regex_new")
+
+        self.assertIs(index, collectinfo_parser.get_file_index(self.path))
+        self.assertEqual(index.timestamp, "2021-01-01 00:00:00 UTC")
+        self.assertEqual(index.n_section, 3)
+        self.assertEqual(
+            [section_id for section_id, _, _ in index.sections],
+            [matcher.match("Node\n"), None, matcher.match("['namespace']\n")],
+        )
+        self.assertTrue(index.head_contains("=ASCOLLECTINFO"))
+        self.assertTrue(index.contains("node2"))
+        self.assertTrue(index.search(r"Configuration \(.*\)~"))
+
+    def test_release_file_indexes(self):
+        index = collectinfo_parser.get_file_index(self.path)
+
+        collectinfo_parser.release_file_indexes()
+
+        self.assertIsNot(index, collectinfo_parser.get_file_index(self.path))
+        collectinfo_parser.release_file_indexes()
+        self.assertEqual(collectinfo_parser._file_indexes, {})
+        self.assertFalse(index.search(r"Statistics~"))
+
+    def test_parse_collectinfo_to_imap(self):
+        imap = {}
+
+        n_section = collectinfo_parser._parse_collectinfo_to_imap(
+            self.path, imap, True
+        )
+
+        self.assertEqual(n_section, 3)
+        self.assertEqual(imap["Node"], [["node1\n", "node2\n"]])
+        self.assertEqual(len(imap["section_ids"]), 2)
+        self.assertRaises(
+            Exception,
+            collectinfo_parser._parse_collectinfo_to_imap,
+            self.path,
+            {},
+            False,
+        )
+
+    def test_empty_file(self):
+        open(self.path, "w").close()
+        index = collectinfo_parser.CollectinfoFileIndex(self.path)
+
+        self.assertEqual(index.head, [])
+        self.assertEqual(index.timestamp, "")
+        self.assertEqual(index.sections, [])
+        self.assertFalse(index.contains("ASCOLLECTINFO"))
+
+
+class CollectinfoReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.reader = CollectinfoReader()
+
+    def write(self, content):
+        path = os.path.join(self.dir, "file%d.txt" % len(os.listdir(self.dir)))
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        return path
+
+    def test_is_cinfo_log_file(self):
+        self.assertTrue(
+            self.reader.is_cinfo_log_file(
+                self.write("=ASCOLLECTINFO\nConfiguration~~~\nStatistics (x)~\n")
+            )
+        )
+        self.assertFalse(
+            self.reader.is_cinfo_log_file(
+                self.write("=ASCOLLECTINFO\nConfiguration~~~\n")
+            )
+        )
+        self.assertFalse(
+            self.reader.is_cinfo_log_file(self.write("Configuration~~~\nStatistics~\n"))
+        )
+        self.assertFalse(self.reader.is_cinfo_log_file(""))
+        self.assertFalse(
+            self.reader.is_cinfo_log_file(os.path.join(self.dir, "missing"))
+        )
+
+    def test_is_system_log_file(self):
+        self.assertTrue(
+            self.reader.is_system_log_file(self.write("=ASCOLLECTINFO\nuname -a\n"))
+        )
+        self.assertFalse(
+            self.reader.is_system_log_file(self.write("=ASCOLLECTINFO\nnothing\n"))
+        )
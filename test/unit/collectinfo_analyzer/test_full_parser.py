@@ -0,0 +1,147 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest2 as unittest
+from mock import patch
+
+from lib.collectinfo_analyzer.collectinfo_handler.collectinfo_parser import (
+    collectinfo_parser,
+    full_parser,
+)
+
+
+class ParseInfoAllTest(unittest.TestCase):
+    files = {
+        "ascollectinfo.log": (
+            "2021-01-01 00:00:00 UTC\n"
+            "====ASCOLLECTINFO====\n"
+            "uname -a\n"
+            "Linux host1 5.4.0-42-generic #46-Ubuntu SMP x86_64 GNU/Linux\n"
+        ),
+        "sysinfo.log": (
+            "2021-01-01 00:00:10 UTC\n"
+            "====ASCOLLECTINFO====\n"
+            "hostname -I\n"
+            "10.0.0.1 10.0.0.2\n"
+        ),
+    }
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.paths = []
+
+        for name, content in sorted(self.files.items()):
+            path = os.path.join(self.dir, name)
+
+            with open(path, "w") as f:
+                f.write(content)
+
+            self.paths.append(path)
+
+    def parse(self):
+        parsed_map = {}
+        full_parser.parse_info_all(self.paths, parsed_map, True)
+        return parsed_map
+
+    def test_parallel_matches_serial(self):
+        serial_map = self.parse()
+
+        self.assertIn("2021-01-01 00:00:00 UTC", serial_map)
+
+        with patch.object(full_parser, "PARALLEL_PARSE_MIN_SIZE", 0), patch(
+            "os.cpu_count", return_value=2
+        ):
+            self.assertEqual(self.parse(), serial_map)
+
+    def test_run_tasks(self):
+        tasks = [(full_parser._extract_file_imap, (path, True)) for path in self.paths]
+        serial_imaps = full_parser._run_tasks(None, tasks)
+
+        with patch.object(full_parser, "PARALLEL_PARSE_MIN_SIZE", 0), patch(
+            "os.cpu_count", return_value=2
+        ):
+            executor = full_parser._create_executor(self.paths)
+
+        self.assertIsNotNone(executor)
+
+        try:
+            self.assertEqual(full_parser._run_tasks(executor, tasks), serial_imaps)
+
+            imap = {}
+
+            for _, file_imap in serial_imaps:
+                collectinfo_parser.merge_imap(imap, file_imap, True)
+
+            sys_maps = full_parser._run_tasks(
+                executor, [(full_parser._get_sys_map, (imap, True))]
+            )
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(sys_maps, [full_parser._get_sys_map(imap, True)])
+        self.assertEqual(sys_maps[0]["uname"]["nodename"], "host1")
+        self.assertEqual(sys_maps[0]["hostname"]["hosts"], ["10.0.0.1", "10.0.0.2"])
+
+    def test_create_executor(self):
+        self.assertIsNone(full_parser._create_executor(self.paths))
+        self.assertIsNone(
+            full_parser._create_executor([os.path.join(self.dir, "missing")])
+        )
+
+    def test_repeated_section_count(self):
+        # A section already extracted from an earlier file used to be left out
+        # of the section count of the next file, which then failed validation.
+        # Each file is now counted on its own.
+        paths = [self.paths[0], os.path.join(self.dir, "ascollectinfo2.log")]
+        shutil.copy(paths[0], paths[1])
+        imap = {}
+
+        collectinfo_parser.extract_validate_filter_section_from_file(
+            paths[0], imap, False
+        )
+
+        with self.assertRaises(Exception):
+            collectinfo_parser.extract_validate_filter_section_from_file(
+                paths[1], imap, False
+            )
+
+        merged_imap = {}
+
+        for path in paths:
+            collectinfo_parser.merge_imap(
+                merged_imap, full_parser._extract_file_imap(path, False)[1], False
+            )
+
+        self.assertEqual(len(merged_imap["uname -a"]), 2)
+
+    def test_merge_imap(self):
+        imap = {}
+
+        for path in self.paths:
+            collectinfo_parser.extract_validate_filter_section_from_file(
+                path, imap, True
+            )
+
+        merged_imap = {}
+
+        for path in self.paths:
+            collectinfo_parser.merge_imap(
+                merged_imap, full_parser._extract_file_imap(path, True)[1], True
+            )
+
+        self.assertEqual(merged_imap, imap)
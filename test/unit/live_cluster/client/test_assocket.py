@@ -1,8 +1,11 @@
+import os
 import socket
+import time
 import unittest2 as unittest
 from mock import Mock, patch
 from socket import error as SocketError
 
+from lib.live_cluster.client import assocket
 from lib.live_cluster.client.assocket import ASSocket
 from lib.live_cluster.client.info import ASProtocolError, ASResponse
 from lib.utils.constants import AuthMode
@@ -32,6 +35,7 @@ class ASSocketTestConnect(unittest.TestCase):
         )
 
         socket_module_mock = patch("socket.socket").start()
+        self.addCleanup(patch.stopall)
         self.socket_mock = socket_module_mock.return_value
         self.as_socket.sock = self.socket_mock
 
@@ -88,6 +92,58 @@ class ASSocketTestConnect(unittest.TestCase):
 
         self.assertFalse(self.as_socket.is_connected())
 
+    @patch("lib.live_cluster.client.assocket._is_readable")
+    def test_is_alive(self, is_readable_mock):
+        is_readable_mock.return_value = False
+        self.as_socket.last_used = time.time()
+        self.as_socket.validated_at = time.time()
+
+        self.assertTrue(self.as_socket.is_alive())
+        is_readable_mock.assert_not_called()
+
+        self.as_socket.validated_at = 0
+
+        self.assertTrue(self.as_socket.is_alive())
+        is_readable_mock.assert_called_with(self.socket_mock.fileno.return_value)
+        self.assertGreater(self.as_socket.validated_at, 0)
+
+        self.as_socket.validated_at = 0
+        is_readable_mock.return_value = True
+
+        self.assertFalse(self.as_socket.is_alive())
+
+        self.as_socket.validated_at = 0
+        is_readable_mock.side_effect = ValueError()
+
+        self.assertFalse(self.as_socket.is_alive())
+
+    def test_is_alive_returns_false_when_idle(self):
+        self.as_socket.last_used = time.time() - assocket.MAX_IDLE_TIME - 1
+        self.as_socket.validated_at = time.time()
+
+        self.assertFalse(self.as_socket.is_alive())
+
+        self.as_socket.sock = None
+        self.as_socket.last_used = time.time()
+
+        self.assertFalse(self.as_socket.is_alive())
+
+    def test_is_readable(self):
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+
+        self.assertFalse(assocket._is_readable(r))
+
+        os.write(w, b"x")
+
+        self.assertTrue(assocket._is_readable(r))
+
+        os.read(r, 1)
+        os.close(w)
+
+        # EOF
+        self.assertTrue(assocket._is_readable(r))
+
     @patch("lib.live_cluster.client.assocket.login")
     def test_login_returns_true(self, login_mock):
         login_mock.return_value = ASResponse.OK, "token", "expiration"
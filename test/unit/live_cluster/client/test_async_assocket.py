@@ -0,0 +1,132 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest2 as unittest
+
+from lib.live_cluster.client import async_assocket
+from lib.live_cluster.client.async_assocket import AsyncASSocket
+from lib.live_cluster.client.info import (
+    ASResponse,
+    _ADMIN_MSG_TYPE,
+    _PROTOCOL_HEADER_SIZE,
+    _TOTAL_HEADER_SIZE,
+    _create_admin_header,
+    _unpack_protocol_header,
+)
+from lib.utils.constants import AuthMode
+
+
+class FakeInfoServer(object):
+    """
+    Answers info requests with "<name>\t<name>-value" lines and admin requests
+    with a bare admin header carrying result_code.
+    """
+
+    def __init__(self, result_code=ASResponse.OK):
+        self.result_code = result_code
+        self.requests = []
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                header = await reader.readexactly(_PROTOCOL_HEADER_SIZE)
+                _, msg_type, data_size, _ = _unpack_protocol_header(header)
+                data = await reader.readexactly(data_size)
+
+                if msg_type == _ADMIN_MSG_TYPE:
+                    self.requests.append("admin")
+                    buf, _ = _create_admin_header(0, ASResponse.OK, 0)
+                    buf = bytearray(bytes(buf))
+                    buf[_PROTOCOL_HEADER_SIZE + 1] = self.result_code
+                    writer.write(bytes(buf[:_TOTAL_HEADER_SIZE]))
+                    continue
+
+                names = data.decode("utf-8").strip("\n").split("\n")
+                self.requests.append(names)
+                rsp = "".join("%s\t%s-value\n" % (name, name) for name in names)
+                rsp = rsp.encode("utf-8")
+                header = bytearray(header)
+                header[2:] = len(rsp).to_bytes(6, "big")
+                writer.write(bytes(header) + rsp)
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+
+class AsyncASSocketTest(unittest.TestCase):
+    def run_with_server(self, func, server, user=None):
+        async def runner():
+            srv = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+            port = srv.sockets[0].getsockname()[1]
+            sock = AsyncASSocket("127.0.0.1", port, user, "pass", AuthMode.INTERNAL)
+
+            try:
+                return await func(sock)
+            finally:
+                sock.close()
+                # Let the handler see EOF before the server goes away.
+                await asyncio.sleep(0.01)
+                srv.close()
+                await srv.wait_closed()
+
+        return asyncio.run(runner())
+
+    def test_info(self):
+        server = FakeInfoServer()
+
+        async def func(sock):
+            self.assertTrue(await sock.connect())
+            self.assertTrue(sock.is_alive())
+            single = await sock.info("build")
+            multiple = await sock.info(["build", "node"])
+            return single, multiple
+
+        single, multiple = self.run_with_server(func, server)
+
+        self.assertEqual(single, "build-value")
+        self.assertDictEqual(multiple, {"build": "build-value", "node": "node-value"})
+        self.assertEqual(server.requests, [["build"], ["build", "node"]])
+
+    def test_authenticate(self):
+        server = FakeInfoServer()
+
+        async def func(sock):
+            await sock.connect()
+            return await sock.authenticate(b"token")
+
+        self.assertTrue(self.run_with_server(func, server, user="admin"))
+        self.assertEqual(server.requests, ["admin"])
+
+    def test_authenticate_fails(self):
+        server = FakeInfoServer(result_code=ASResponse.NOT_AUTHENTICATED)
+
+        async def func(sock):
+            await sock.connect()
+            result = await sock.authenticate(b"token")
+            return result, sock.is_alive()
+
+        self.assertEqual(
+            self.run_with_server(func, server, user="admin"), (False, False)
+        )
+
+    def test_connect_fails(self):
+        sock = AsyncASSocket("127.0.0.1", 1, None, None, AuthMode.INTERNAL, timeout=1)
+
+        self.assertFalse(asyncio.run(sock.connect()))
+
+    def test_run_coroutine(self):
+        async def func(value):
+            return value * 2
+
+        self.assertEqual(async_assocket.run_coroutine(func(2), timeout=5), 4)
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from mock import patch, Mock
+from mock import AsyncMock, patch, Mock
 import socket
+import threading
+import time
 import unittest
 
 import lib
-from lib.live_cluster.client.cluster import Cluster
+from lib.live_cluster.client import cluster
+from lib.live_cluster.client.cluster import Cluster, ClusterRefresher
 from lib.live_cluster.client.node import Node
 
 
@@ -236,6 +239,28 @@ class ClusterTest(unittest.TestCase):
         )
         cl.aliases = aliases
 
+    def test_find_new_nodes(self):
+        cl = self.get_cluster_mock(2)
+        aliases = cl.aliases
+        saved_aliases = dict(aliases)
+        self.addCleanup(aliases.update, saved_aliases)
+        self.addCleanup(aliases.clear)
+        aliases["10.0.0.1:3000"] = "stale-node"
+
+        for n in cl.nodes.values():
+            n.refresh_topology = Mock(return_value=False)
+            n.peers = [("172.17.9.9", 3000, None)]
+
+        nodes_to_add = cl.find_new_nodes()
+
+        for n in cl.nodes.values():
+            n.refresh_topology.assert_called_once()
+
+        self.assertIs(cl.aliases, aliases)
+        self.assertNotIn("10.0.0.1:3000", cl.aliases)
+        self.assertEqual(cl.aliases["127.0.0.1:3000"], "127.0.0.1:3000")
+        self.assertEqual(nodes_to_add, [("172.17.9.9", 3000, None)])
+
     def test_call_node_method(self):
         cl = self.get_cluster_mock(2)
 
@@ -248,6 +273,117 @@ class ClusterTest(unittest.TestCase):
         n = cl.get_node(key)[0]
         n._info_cinfo.assert_called_with("build", n.ip)
 
+    def test_call_node_method_async(self):
+        cl = self.get_cluster_mock(2)
+        info_cinfo_async = patch(
+            "lib.live_cluster.client.node.Node._info_cinfo_async",
+            new_callable=AsyncMock,
+        ).start()
+        info_cinfo_async.side_effect = ["foo", IOError("bar")]
+        patch.object(Cluster, "use_async_info", True).start()
+
+        actual = cl.call_node_method(nodes="all", method_name="info", command="build")
+
+        self.assertEqual(info_cinfo_async.await_count, 2)
+        self.assertEqual(set(actual.keys()), set(cl.nodes.keys()))
+        values = list(actual.values())
+        self.assertIn("foo", values)
+        self.assertEqual(len([v for v in values if isinstance(v, IOError)]), 1)
+
+    def test_background_refresh(self):
+        cl = self.get_cluster_mock(2)
+        crawl = patch.object(cl, "_crawl").start()
+        self.addCleanup(patch.stopall)
+        self.addCleanup(cl.stop_background_refresh)
+        self.restore_refresh_state(cl)
+        cl.last_cluster_refresh_time = 0
+
+        cl.start_background_refresh(0.01)
+        refresher = cl._refresher
+
+        for _ in range(500):
+            if crawl.called:
+                break
+            time.sleep(0.01)
+
+        self.assertTrue(crawl.called)
+        cl.last_cluster_refresh_time = 0
+        self.assertFalse(cl.need_to_refresh_cluster())
+
+        cl.stop_background_refresh()
+        refresher.join(5)
+
+        self.assertFalse(refresher.is_alive())
+        cl.last_cluster_refresh_time = 0
+        self.assertTrue(cl.need_to_refresh_cluster())
+
+    def restore_refresh_state(self, cl):
+        # Cluster state is shared between instances.
+        live_nodes = set(cl._live_nodes)
+        last_cluster_refresh_time = cl.last_cluster_refresh_time
+
+        def restore():
+            cl._live_nodes.clear()
+            cl._live_nodes.update(live_nodes)
+            cl.last_cluster_refresh_time = last_cluster_refresh_time
+
+        self.addCleanup(restore)
+
+    def test_background_refresh_without_new_peers(self):
+        cl = self.get_cluster_mock(2)
+        self.addCleanup(patch.stopall)
+        self.restore_refresh_state(cl)
+        cl._refresh_node_liveliness()
+        self.assertTrue(cl._live_nodes)
+
+        def find_new_nodes():
+            for node in cl.nodes.values():
+                node.alive = False
+
+            return []
+
+        patch.object(cl, "find_new_nodes", side_effect=find_new_nodes).start()
+
+        self.assertFalse(cl._background_refresh())
+        self.assertFalse(cl._live_nodes)
+
+    def test_background_refresh_waits_for_node_calls(self):
+        cl = self.get_cluster_mock(2)
+        events = []
+        crawled = threading.Event()
+
+        def crawl():
+            events.append("crawl")
+            crawled.set()
+
+        patch.object(cl, "_crawl", side_effect=crawl).start()
+        self.addCleanup(patch.stopall)
+        self.restore_refresh_state(cl)
+
+        with cl._node_access.use():
+            refresher = threading.Thread(target=cl._background_refresh)
+            refresher.start()
+            self.assertFalse(crawled.wait(0.1))
+            events.append("call")
+
+        refresher.join(5)
+
+        self.assertEqual(events, ["call", "crawl"])
+
+    def test_refresher_next_delay(self):
+        refresher = ClusterRefresher(None, 2)
+
+        self.assertTrue(1.6 <= refresher.next_delay() <= 2.4)
+
+        refresher.failures = 3
+        self.assertTrue(12.8 <= refresher.next_delay() <= 19.2)
+
+        refresher.failures = 100
+        self.assertTrue(
+            refresher.next_delay()
+            <= cluster.REFRESH_MAX_BACKOFF * (1 + cluster.REFRESH_JITTER)
+        )
+
     def test_is_XDR_enabled(self):
         cl = self.get_cluster_mock(
             2,
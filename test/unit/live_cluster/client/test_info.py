@@ -16,6 +16,7 @@ from lib.live_cluster.client.info import (
     delete_whitelist,
     drop_user,
     grant_roles,
+    info,
     login,
     query_roles,
     query_users,
@@ -77,7 +78,8 @@ refactoring that they have made had not broken anything.
 
 class SecurityTest(unittest.TestCase):
     def setUp(self) -> None:
-        self.socket_mock = Mock()
+        # Sockets without recv_into, e.g. older PyOpenSSL connections.
+        self.socket_mock = Mock(spec=["recv", "send", "sendall"])
 
     def test_login_ok(self):
         expected_send_buf = b"\x00\x02\x00\x00\x00\x00\x00[\x00\x00\x14\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00admin\x00\x00\x00=\x03$2a$10$7EqJtq98hPqEX7fNZaFWoO1mVO/4MLpGzsqojz6E9Gef6iXDjXdDa"
@@ -805,3 +807,54 @@ class SecurityTest(unittest.TestCase):
         self.socket_mock.sendall.side_effect = SocketError("message")
 
         self.assertRaises(IOError, query_roles, self.socket_mock)
+
+
+class InfoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.socket_mock = Mock(spec=["recv", "recv_into", "send", "sendall"])
+
+    def _set_response(self, response, max_chunk=7):
+        # Simulate a socket which returns the response in small chunks.
+        response = b"\x02\x01\x00\x00" + len(response).to_bytes(4, "big") + response
+        state = {"pos": 0}
+
+        def recv_into(view, nbytes):
+            n = min(nbytes, max_chunk, len(response) - state["pos"])
+            view[:n] = response[state["pos"] : state["pos"] + n]
+            state["pos"] += n
+            return n
+
+        self.socket_mock.recv_into.side_effect = recv_into
+
+    def test_info_single(self):
+        self._set_response(b"build\t5.6.0.0\n")
+
+        actual = info(self.socket_mock, "build")
+
+        self.socket_mock.send.assert_called_with(
+            b"\x02\x01\x00\x00\x00\x00\x00\x06build\n"
+        )
+        self.socket_mock.recv.assert_not_called()
+        self.assertEqual(actual, "5.6.0.0")
+
+    def test_info_single_wrong_name(self):
+        self._set_response(b"node\tBB9\n")
+
+        self.assertEqual(info(self.socket_mock, "build"), -1)
+
+    def test_info_multiple(self):
+        self._set_response(b"build\t5.6.0.0\nnode\tBB9\nfeatures\t\n")
+
+        actual = info(self.socket_mock, ("build", "node", "features"))
+
+        self.socket_mock.send.assert_called_with(
+            b"\x02\x01\x00\x00\x00\x00\x00\x14build\nnode\nfeatures\n"
+        )
+        self.assertDictEqual(
+            actual, {"build": "5.6.0.0", "node": "BB9", "features": ""}
+        )
+
+    def test_info_connection_closed(self):
+        self.socket_mock.recv_into.return_value = 0
+
+        self.assertRaises(IOError, info, self.socket_mock, "build")
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from mock import patch
+from mock import AsyncMock, Mock, call, patch
+import asyncio
 import socket
+import subprocess
+import threading
+import time
 import unittest
 
 import lib
 from lib.live_cluster.client.assocket import ASSocket
+from lib.live_cluster.client import node as node_module
 from lib.live_cluster.client.node import Node
+from lib.live_cluster.client.node_profile import NodeProfile
 
 
 @patch("lib.live_cluster.client.node.Node._info_cinfo")
@@ -51,6 +57,7 @@ class NodeTest(unittest.TestCase):
         socket.getaddrinfo.return_value = [(2, 1, 6, "", ("192.1.1.1", 3000))]
 
         self.node = Node(self.ip)
+        self.node.profile = NodeProfile(build="5.0.0.11")
 
     def test_init_node(self, info_cinfo):
         """
@@ -67,6 +74,34 @@ class NodeTest(unittest.TestCase):
         self.assertEqual(n.fqdn, "host.domain.local", "FQDN is not correct")
         self.assertEqual(n.port, 3000, "Port is not correct")
         self.assertEqual(n.node_id, "A00000000000000", "Node Id is not correct")
+        self.assertEqual(n.get_profile().build, "5.0.0.11")
+        self.assertEqual(n.get_profile().edition, "A00000000000000")
+        self.assertEqual(n.get_profile().features, "A00000000000000")
+
+    def test_get_connection_reuses_pooled_socket(self, info_mock):
+        sock = Mock()
+        sock.created_at = sock.last_used = time.time()
+        sock.is_alive.return_value = True
+
+        self.node._put_connection(sock, self.node.port)
+        actual = self.node._get_connection(self.ip, self.node.port)
+
+        self.assertIs(actual, sock)
+        sock.settimeout.assert_called_with(self.node._timeout)
+        stats = self.node.get_socket_pool_statistics()[self.node.port]
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["idle"], 0)
+
+    def test_close_keeps_socket_pool_statistics(self, info_mock):
+        sock = Mock()
+        sock.created_at = sock.last_used = time.time()
+        self.node._put_connection(sock, self.node.port)
+
+        self.node.close()
+
+        sock.close.assert_called_once()
+        stats = self.node.get_socket_pool_statistics()[self.node.port]
+        self.assertEqual(stats["idle"], 0)
 
     ###### Services ######
 
@@ -433,6 +468,17 @@ class NodeTest(unittest.TestCase):
             "info_statistics error:\n_expected:\t%s\n_found:\t%s" % (expected, stats),
         )
 
+    @patch("lib.live_cluster.client.node.time.time")
+    def test_info_timed_statistics(self, time_mock, info_mock):
+        info_mock.return_value = "cs=2;ck=71"
+        time_mock.return_value = 1600000000.5
+
+        collection_time, stats = self.node.info_timed_statistics()
+
+        info_mock.assert_called_with("statistics", self.ip)
+        self.assertEqual(collection_time, 1600000000.5)
+        self.assertEqual(stats, {"cs": "2", "ck": "71"})
+
     def test_info_namespaces(self, info_mock):
         info_mock.return_value = "test;bar"
         expected = ["test", "bar"]
@@ -477,8 +523,10 @@ class NodeTest(unittest.TestCase):
     def test_info_all_namespace_statistics(self, info_mock):
         info_mock.side_effect = [
             "foo;bar",
-            "asdf=1;b=b;c=!@#$%^&*()",
-            "cdef=2;c=c;d=)(*&^%$#@!",
+            {
+                "namespace/foo": "asdf=1;b=b;c=!@#$%^&*()",
+                "namespace/bar": "cdef=2;c=c;d=)(*&^%$#@!",
+            },
         ]
         expected = {
             "foo": {"asdf": "1", "b": "b", "c": "!@#$%^&*()"},
@@ -487,12 +535,94 @@ class NodeTest(unittest.TestCase):
 
         actual = self.node.info_all_namespace_statistics()
 
-        self.assertEqual(info_mock.call_count, 3)
+        self.assertEqual(info_mock.call_count, 2)
         info_mock.assert_any_call("namespaces", self.ip)
-        info_mock.assert_any_call("namespace/foo", self.ip)
-        info_mock.assert_any_call("namespace/bar", self.ip)
+        info_mock.assert_any_call(("namespace/foo", "namespace/bar"), self.ip)
         self.assertEqual(actual, expected)
 
+    def test_info_batch(self, info_mock):
+        info_mock.return_value = {"a": "1", "b": "2"}
+
+        actual = self.node.info_batch(["a", "b", "a", "c"])
+
+        info_mock.assert_called_once_with(("a", "b", "c"), self.ip)
+        self.assertEqual(actual["a"], "1")
+        self.assertEqual(actual["b"], "2")
+        self.assertIsInstance(actual["c"], IOError)
+
+        info_mock.reset_mock()
+        info_mock.return_value = "1"
+
+        actual = self.node.info_batch(["a"], port=self.node.xdr_port)
+
+        info_mock.assert_called_once_with("a", self.ip, self.node.xdr_port)
+        self.assertDictEqual(actual, {"a": "1"})
+
+    @patch("lib.live_cluster.client.node.Node.refresh_connection")
+    def test_refresh_topology(self, refresh_connection_mock, info_mock):
+        self.node.alive = True
+        self.node.use_peers_list = True
+        self.node.node_id = "A00000000000000"
+        self.node.peers_generation = "5"
+        info_mock.return_value = {"node": "A00000000000000", "peers-generation": "5"}
+
+        self.assertFalse(self.node.refresh_topology())
+        info_mock.assert_called_with(("node", "peers-generation"), self.ip)
+        refresh_connection_mock.assert_not_called()
+
+        info_mock.return_value = {"node": "A00000000000000", "peers-generation": "6"}
+
+        self.assertTrue(self.node.refresh_topology())
+        refresh_connection_mock.assert_called_once()
+
+        refresh_connection_mock.reset_mock()
+        info_mock.reset_mock()
+        self.node.alive = False
+
+        self.assertTrue(self.node.refresh_topology())
+        info_mock.assert_not_called()
+        refresh_connection_mock.assert_called_once()
+
+    @patch("lib.live_cluster.client.node.INFO_BATCH_MAX_SIZE", 2)
+    def test_info_batch_splits_requests(self, info_mock):
+        info_mock.side_effect = lambda cmd, ip: (
+            {"a": "1", "b": "2"} if cmd == ("a", "b") else "3"
+        )
+
+        actual = self.node.info_batch(["a", "b", "c"])
+
+        self.assertEqual(info_mock.call_count, 2)
+        info_mock.assert_any_call(("a", "b"), self.ip)
+        info_mock.assert_any_call("c", self.ip)
+        self.assertDictEqual(actual, {"a": "1", "b": "2", "c": "3"})
+
+    @patch("lib.live_cluster.client.node.INFO_BATCH_MAX_SIZE", 1)
+    def test_info_batch_respects_socket_pool_size(self, info_mock):
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def info_side_effect(cmd, ip):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+
+            time.sleep(0.01)
+
+            with lock:
+                running[0] -= 1
+
+            return cmd.upper()
+
+        info_mock.side_effect = info_side_effect
+        self.node._get_socket_pool(self.node.port).max_size = 2
+
+        actual = self.node.info_batch(["a", "b", "c", "d", "e"])
+
+        self.assertEqual(info_mock.call_count, 5)
+        self.assertLessEqual(max_running[0], 2)
+        self.assertDictEqual(actual, {c: c.upper() for c in "abcde"})
+
     def info_all_namespace_statistics(self, info_mock):
         info_mock.return_value = (
             "ns=test:set=jar-set:objects=1:tombstones=2:"
@@ -574,7 +704,7 @@ class NodeTest(unittest.TestCase):
         self.assertDictEqual(actual, expected)
 
     def test_info_XDR_statistics_with_server_before_5(self, info_mock):
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "4.9"
+        self.node.profile = NodeProfile(build="4.9")
         info_mock.side_effect = ["a=b;c=1;2=z"]
         expected = {"a": "b", "c": "1", "2": "z"}
         actual = self.node.info_XDR_statistics()
@@ -584,9 +714,8 @@ class NodeTest(unittest.TestCase):
         self.assertDictEqual(actual, expected)
 
         info_mock.reset_mock()
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "2.5.6"
         info_mock.side_effect = ["a=b;c=1;2=z"]
-        self.node.features = "xdr"
+        self.node.profile = NodeProfile(build="2.5.6", features="xdr")
         expected = {"a": "b", "c": "1", "2": "z"}
 
         actual = self.node.info_XDR_statistics()
@@ -604,9 +733,7 @@ class NodeTest(unittest.TestCase):
 
         actual = self.node.info_XDR_statistics()
 
-        self.assertEqual(
-            lib.live_cluster.client.node.Node.info_build_version.call_count, 1
-        )
+        lib.live_cluster.client.node.Node.info_build_version.assert_not_called()
         self.assertEqual(info_all_dc_statistics_mock.call_count, 1)
         self.assertEqual(actual, expected)
 
@@ -643,14 +770,22 @@ class NodeTest(unittest.TestCase):
         info_mock.assert_any_call("get-config:", self.ip)
 
     def test_info_get_config_xdr(self, info_mock):
-        info_mock.side_effect = [
-            "dcs=DC1,DC2;src-id=0;trace-sample=0",
-            "namespaces=bar,foo;a=1;b=2;c=3",
-            "d=4;e=5;f=6",
-            "d=7;e=8;f=9",
-            "namespaces=jar;a=10;b=11;c=12",
-            "d=13;e=14;f=15",
-        ]
+        responses = {
+            "get-config:context=xdr": "dcs=DC1,DC2;src-id=0;trace-sample=0",
+            "get-config:context=xdr;dc=DC1": "namespaces=bar,foo;a=1;b=2;c=3",
+            "get-config:context=xdr;dc=DC1;namespace=bar": "d=4;e=5;f=6",
+            "get-config:context=xdr;dc=DC1;namespace=foo": "d=7;e=8;f=9",
+            "get-config:context=xdr;dc=DC2": "namespaces=jar;a=10;b=11;c=12",
+            "get-config:context=xdr;dc=DC2;namespace=jar": "d=13;e=14;f=15",
+        }
+
+        def info_side_effect(cmd, ip):
+            if isinstance(cmd, tuple):
+                return {c: responses[c] for c in cmd}
+
+            return responses[cmd]
+
+        info_mock.side_effect = info_side_effect
         expected = {
             "dc_configs": {
                 "DC1": {"namespaces": "bar,foo", "a": "1", "b": "2", "c": "3",},
@@ -668,18 +803,19 @@ class NodeTest(unittest.TestCase):
 
         actual = self.node.info_get_config("xdr")
 
-        self.assertEqual(info_mock.call_count, 6)
+        self.assertEqual(info_mock.call_count, 3)
         info_mock.assert_any_call("get-config:context=xdr", self.ip)
-        info_mock.assert_any_call("get-config:context=xdr;dc=DC1", self.ip)
-        info_mock.assert_any_call(
-            "get-config:context=xdr;dc=DC1;namespace=bar", self.ip
-        )
         info_mock.assert_any_call(
-            "get-config:context=xdr;dc=DC1;namespace=foo", self.ip
+            ("get-config:context=xdr;dc=DC1", "get-config:context=xdr;dc=DC2"),
+            self.ip,
         )
-        info_mock.assert_any_call("get-config:context=xdr;dc=DC2", self.ip)
         info_mock.assert_any_call(
-            "get-config:context=xdr;dc=DC2;namespace=jar", self.ip
+            (
+                "get-config:context=xdr;dc=DC1;namespace=bar",
+                "get-config:context=xdr;dc=DC1;namespace=foo",
+                "get-config:context=xdr;dc=DC2;namespace=jar",
+            ),
+            self.ip,
         )
         self.assertDictEqual(actual, expected)
 
@@ -916,20 +1052,24 @@ class NodeTest(unittest.TestCase):
 
     def test_info_latencies_verbose(self, info_mock):
         raw = ""
-        info_mock.side_effect = ["test", raw, raw, raw, raw, raw, raw, raw, raw, raw]
+        commands = (
+            "latencies:",
+            "latencies:hist={test}-proxy",
+            "latencies:hist={test}-benchmark-fabric",
+            "latencies:hist={test}-benchmarks-ops-sub",
+            "latencies:hist={test}-benchmarks-read",
+            "latencies:hist={test}-benchmarks-write",
+            "latencies:hist={test}-benchmarks-udf",
+            "latencies:hist={test}-benchmarks-udf-sub",
+            "latencies:hist={test}-benchmarks-batch-sub",
+        )
+        info_mock.side_effect = ["test", {command: raw for command in commands}]
 
         _ = self.node.info_latencies(verbose=True)
 
-        self.assertEqual(info_mock.call_count, 10)
-        info_mock.assert_any_call("latencies:", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-proxy", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmark-fabric", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-ops-sub", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-read", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-write", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-udf", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-udf-sub", self.ip)
-        info_mock.assert_any_call("latencies:hist={test}-benchmarks-batch-sub", self.ip)
+        self.assertEqual(info_mock.call_count, 2)
+        info_mock.assert_any_call("namespaces", self.ip)
+        info_mock.assert_any_call(commands, self.ip)
 
     def test_info_dcs(self, info_mock):
         info_mock.return_value = "a=b;c=d;e=f;dcs=DC1,DC2,DC3"
@@ -943,7 +1083,7 @@ class NodeTest(unittest.TestCase):
         self.assertListEqual(actual, expected)
 
         info_mock.return_value = "a=b;c=d;e=f;dcs=DC1,DC2,DC3"
-        self.node.features = "xdr"
+        self.node.profile = NodeProfile(build="5.0.0.11", features="xdr")
 
         actual = self.node.info_dcs()
 
@@ -952,7 +1092,7 @@ class NodeTest(unittest.TestCase):
 
         info_mock.return_value = "DC3;DC4;DC5"
         expected = ["DC3", "DC4", "DC5"]
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "4.9"
+        self.node.profile = NodeProfile(build="4.9", features="xdr")
 
         actual = self.node.info_dcs()
 
@@ -961,8 +1101,7 @@ class NodeTest(unittest.TestCase):
 
         info_mock.return_value = "DC3;DC4;DC5"
         expected = ["DC3", "DC4", "DC5"]
-        self.node.features = ""
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "4.9"
+        self.node.profile = NodeProfile(build="4.9")
 
         actual = self.node.info_dcs()
 
@@ -982,14 +1121,14 @@ class NodeTest(unittest.TestCase):
         self.assertDictEqual(actual, expected)
 
         info_mock.return_value = "a=b;c=d;e=f"
-        self.node.features = "xdr"
+        self.node.profile = NodeProfile(build="5.0.0.11", features="xdr")
 
         actual = self.node.info_dc_statistics(dc=dc)
 
         info_mock.assert_called_with("get-stats:context=xdr;dc={}".format(dc), self.ip)
         self.assertDictEqual(actual, expected)
 
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "4.9"
+        self.node.profile = NodeProfile(build="4.9", features="xdr")
         info_mock.return_value = "a=b;c=d;e=f"
 
         actual = self.node.info_dc_statistics(dc=dc)
@@ -997,9 +1136,8 @@ class NodeTest(unittest.TestCase):
         info_mock.assert_called_with("dc/{}".format(dc), self.ip)
         self.assertDictEqual(actual, expected)
 
-        lib.live_cluster.client.node.Node.info_build_version.return_value = "4.9"
         info_mock.return_value = "a=b;c=d;e=f"
-        self.node.features = ""
+        self.node.profile = NodeProfile(build="4.9")
 
         actual = self.node.info_dc_statistics(dc=dc)
 
@@ -1131,7 +1269,7 @@ class NodeTest(unittest.TestCase):
         )
         info_mock.assert_called_with("get-dc-config", self.ip, self.node.xdr_port)
 
-        self.node.features = ["xdr"]
+        self.node.profile = NodeProfile(build="5.0.0.11", features=["xdr"])
 
         xdr_dc_confg = self.node.info_dc_get_config()
 
@@ -1153,7 +1291,7 @@ class NodeTest(unittest.TestCase):
         self.assertDictEqual(actual, expected)
 
         info_get_config.return_value = {"a": "1", "b": "2", "c": "3"}
-        self.node.features = "xdr"
+        self.node.profile = NodeProfile(build="5.0.0.11", features="xdr")
         expected = {
             "a": "1",
             "b": "2",
@@ -1194,7 +1332,7 @@ class NodeTest(unittest.TestCase):
 
         # nraw, {'namespaces':'test'})
         info_mock.side_effect = ["test", raw]
-        self.node.new_histogram_version = True
+        self.node.profile = NodeProfile(build="4.2.0")
         expected = {
             "test": {
                 # 'units': 'bytes',
@@ -2260,7 +2398,7 @@ class NodeTest(unittest.TestCase):
         self.node.info_histogram("ttl", logarithmic=True, raw_output=True)
         info_mock.assert_called_with("histogram:namespace=test;type=ttl", self.ip)
 
-        self.node.new_histogram_version = False
+        self.node.profile = NodeProfile(build="4.1.0")
         info_mock.side_effect = ["test", raw]
         self.node.info_histogram("objsz", logarithmic=True, raw_output=True)
         info_mock.assert_called_with("hist-dump:ns=test;hist=objsz", self.ip)
@@ -2286,6 +2424,17 @@ class NodeTest(unittest.TestCase):
         info_mock.assert_called_with("sindex/{}/{}".format("foo", "bar"), self.ip)
         self.assertDictEqual(actual, expected)
 
+    def test_info_all_sindex_statistics(self, info_mock):
+        info_mock.return_value = {"sindex/foo/bar": "a=b", "sindex/foo/baz": "c=d"}
+        expected = {("foo", "bar"): {"a": "b"}, ("foo", "baz"): {"c": "d"}}
+
+        actual = self.node.info_all_sindex_statistics([("foo", "bar"), ("foo", "baz")])
+
+        info_mock.assert_called_once_with(
+            ("sindex/foo/bar", "sindex/foo/baz"), self.ip
+        )
+        self.assertDictEqual(actual, expected)
+
     def test_info_sindex_create_success(self, info_mock):
         info_mock.return_value = "OK"
         expected_call = "sindex-create:indexname={};ns={};indexdata={},{}".format(
@@ -2385,5 +2534,363 @@ class NodeTest(unittest.TestCase):
         )
 
 
+class NodeInfoRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.ip = "192.1.1.1"
+        patch("lib.live_cluster.client.node.Node.info_build_version").start()
+        patch(
+            "lib.live_cluster.client.node.get_fully_qualified_domain_name",
+            return_value="host.domain.local",
+        ).start()
+        patch(
+            "socket.getaddrinfo", return_value=[(2, 1, 6, "", ("192.1.1.1", 3000))]
+        ).start()
+        self.addCleanup(patch.stopall)
+
+        info_cinfo = patch("lib.live_cluster.client.node.Node._info_cinfo")
+        info_cinfo.start().return_value = "A00000000000000"
+        self.node = Node(self.ip)
+        self.node.ip = self.ip
+        info_cinfo.stop()
+        self.addCleanup(self.node.clear_info_cache)
+
+        self.sock = Mock()
+        patch.object(self.node, "_get_connection", return_value=self.sock).start()
+        patch.object(self.node, "_put_connection").start()
+
+    def test_info_cinfo_single_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def info_side_effect(command):
+            started.set()
+            release.wait(5)
+            return "value"
+
+        self.sock.info.side_effect = info_side_effect
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda args: results.append(self.node._info_cinfo(*args)),
+                args=(args,),
+            )
+            for args in [
+                ("statistics",),
+                ("statistics", self.ip),
+                ("statistics", self.ip, self.node.port),
+            ]
+        ]
+
+        threads[0].start()
+        started.wait(5)
+
+        for t in threads[1:]:
+            t.start()
+
+        time.sleep(0.05)
+        release.set()
+
+        for t in threads:
+            t.join()
+
+        self.sock.info.assert_called_once_with("statistics")
+        self.assertEqual(results, ["value"] * 3)
+
+    def test_info_cinfo_async_single_flight(self):
+        async def info(command):
+            await asyncio.sleep(0.01)
+            return "value"
+
+        get_async_connection = patch.object(
+            self.node, "_get_async_connection", new_callable=AsyncMock
+        ).start()
+        get_async_connection.return_value.info.side_effect = info
+
+        async def run():
+            return await asyncio.gather(
+                self.node._info_cinfo_async("statistics"),
+                self.node._info_cinfo_async("statistics", self.ip, self.node.port),
+                self.node._info_cinfo_async("build"),
+            )
+
+        self.assertEqual(asyncio.run(run()), ["value"] * 3)
+        self.assertEqual(get_async_connection.await_count, 2)
+
+
+
+class NodeInfoCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.ip = "192.1.1.1"
+        patch(
+            "lib.live_cluster.client.node.get_fully_qualified_domain_name",
+            return_value="host.domain.local",
+        ).start()
+        patch(
+            "socket.getaddrinfo", return_value=[(2, 1, 6, "", ("192.1.1.1", 3000))]
+        ).start()
+        self.addCleanup(patch.stopall)
+
+        self.responses = {
+            "node": "A00000000000000",
+            "build": "4.9.0.3",
+            "edition": "Aerospike Enterprise Edition",
+            "features": "peers;cdt-list",
+            "peers-generation": "1",
+        }
+        self.sock = Mock()
+        self.sock.info.side_effect = lambda command: self.responses.get(command, "")
+        patch.object(Node, "_get_connection", return_value=self.sock).start()
+        patch.object(Node, "_put_connection").start()
+
+        self.node = Node(self.ip)
+        self.addCleanup(self.node.clear_info_cache)
+
+    def test_connect_clears_info_cache(self):
+        self.assertEqual(self.node.info("build"), "4.9.0.3")
+
+        self.responses["build"] = "5.2.0.4"
+
+        # Static commands are cached until the node reconnects.
+        self.assertEqual(self.node.info("build"), "4.9.0.3")
+        self.assertGreater(self.node.get_info_cache_statistics()["hits"], 0)
+
+        self.node.refresh_connection()
+
+        self.assertEqual(self.node.info("build"), "5.2.0.4")
+
+    def test_connect_refreshes_profile(self):
+        self.assertEqual(self.node.get_profile().build, "4.9.0.3")
+        self.assertFalse(self.node.get_profile().xdr5)
+
+        self.responses["build"] = "5.2.0.4"
+        self.node.refresh_connection()
+
+        self.assertEqual(self.node.get_profile().build, "5.2.0.4")
+        self.assertTrue(self.node.get_profile().xdr5)
+
+    def test_get_info_cache_statistics(self):
+        other = Node(self.ip, port=4000)
+        self.addCleanup(other.clear_info_cache)
+        other.clear_info_cache()
+        self.node.info("build")
+
+        self.assertEqual(other.get_info_cache_statistics()["entries"], 0)
+        self.assertGreater(self.node.get_info_cache_statistics()["entries"], 0)
+
+    def _patch_async_connection(self, responses):
+        def new_sock(ip, port):
+            sock = AsyncMock()
+            sock.info.side_effect = lambda command: responses.get(command, "")
+            return sock
+
+        return patch.object(
+            self.node,
+            "_get_async_connection",
+            new_callable=AsyncMock,
+            side_effect=new_sock,
+        ).start()
+
+    def test_info_cinfo_async_shares_cache(self):
+        get_async_connection = self._patch_async_connection({"build": "5.2.0.4"})
+        self.node.clear_info_cache()
+        self.sock.info.reset_mock()
+
+        self.assertEqual(asyncio.run(self.node._info_cinfo_async("build")), "5.2.0.4")
+        # Served from the response cached by the async request.
+        self.assertEqual(self.node.info("build"), "5.2.0.4")
+        self.assertNotIn(call("build"), self.sock.info.call_args_list)
+
+        self.assertEqual(self.node.info("edition"), "Aerospike Enterprise Edition")
+        self.assertEqual(
+            asyncio.run(self.node._info_cinfo_async("edition")),
+            "Aerospike Enterprise Edition",
+        )
+        self.assertEqual(get_async_connection.await_count, 1)
+
+    def test_info_cinfo_async_respects_pool_size(self):
+        self._patch_async_connection({"statistics": "a", "namespaces": "b"})
+        self.node._get_socket_pool(self.node.port).max_size = 1
+
+        async def run():
+            return await asyncio.gather(
+                self.node._info_cinfo_async("statistics"),
+                self.node._info_cinfo_async("namespaces"),
+            )
+
+        self.assertEqual(asyncio.run(run()), ["a", "b"])
+        self.assertEqual(len(self.node.async_socket_pool[self.node.port]), 1)
+
+    def test_supports_async_info(self):
+        self.assertTrue(self.node.supports_async_info())
+
+        self.node.ssl_context = Mock()
+
+        self.assertFalse(self.node.supports_async_info())
+
+
+def run_system_script(conn, lines, timeout):
+    out = subprocess.run(
+        ["sh"], input="\n".join(lines), stdout=subprocess.PIPE, text=True
+    ).stdout
+    return True, out
+
+
+class NodeSystemStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self.ip = "192.1.1.1"
+        patch("lib.live_cluster.client.node.Node.info_build_version").start()
+        patch(
+            "lib.live_cluster.client.node.get_fully_qualified_domain_name",
+            return_value="host.domain.local",
+        ).start()
+        patch(
+            "socket.getaddrinfo", return_value=[(2, 1, 6, "", ("192.1.1.1", 3000))]
+        ).start()
+        patch(
+            "lib.live_cluster.client.node.PEXPECT_VERSION", node_module.NEW_MODULE
+        ).start()
+        self.addCleanup(patch.stopall)
+
+        info_cinfo = patch("lib.live_cluster.client.node.Node._info_cinfo")
+        info_cinfo.start().return_value = "A00000000000000"
+        self.node = Node(self.ip)
+        self.node.ip = self.ip
+        info_cinfo.stop()
+
+        self.node.sys_default_user_id = "user"
+        self.node.sys_cmds = [
+            ("hostname", False, ["false", "echo host1 host2"]),
+            ("uname", False, ["", "echo Linux host"]),
+            ("df", False, ["false"]),
+        ]
+        self.conn = Mock()
+        self.conn.isalive.return_value = True
+        self.create_ssh_connection = patch.object(
+            self.node, "_create_ssh_connection", return_value=self.conn
+        ).start()
+        self.execute_script = patch.object(
+            self.node, "_execute_remote_system_script", side_effect=run_system_script
+        ).start()
+        self.parse = patch(
+            "lib.live_cluster.client.node.full_parser.parse_system_live_command"
+        ).start()
+
+    def test_system_script(self):
+        lines = node_module._build_system_script(
+            self.node.sys_cmds, ["hostname", "uname", "df"], "ASADM_0123"
+        )
+
+        _, out = run_system_script(None, lines, 1)
+
+        self.assertNotIn("ASADM_0123", "\n".join(lines))
+        self.assertEqual(
+            node_module._parse_system_script_output(out, "ASADM_0123"),
+            {"hostname": (1, "host1 host2"), "uname": (1, "Linux host")},
+        )
+
+    def test_system_script_stdin(self):
+        # The script is fed to the shell on stdin, commands must not read it.
+        sys_cmds = [("hostname", False, ["cat", "echo host1"])] + self.node.sys_cmds[1:]
+        lines = node_module._build_system_script(
+            sys_cmds, ["hostname", "uname"], "ASADM_0123"
+        )
+
+        _, out = run_system_script(None, lines, 1)
+
+        self.assertEqual(
+            node_module._parse_system_script_output(out, "ASADM_0123"),
+            {"hostname": (1, "host1"), "uname": (1, "Linux host")},
+        )
+
+    def test_get_remote_host_system_statistics(self):
+        self.node._get_remote_host_system_statistics(["hostname", "df"])
+
+        self.execute_script.assert_called_once()
+        self.parse.assert_called_once_with(
+            "hostname", "echo host1 host2\r\nhost1 host2\r\n", {}
+        )
+
+    def test_ssh_session_reused(self):
+        self.node._get_remote_host_system_statistics(["hostname"])
+        self.node._get_remote_host_system_statistics(["uname"])
+
+        self.create_ssh_connection.assert_called_once()
+        self.assertEqual(self.execute_script.call_count, 2)
+        self.parse.assert_called_with(
+            "uname", "echo Linux host\r\nLinux host\r\n", {}
+        )
+
+    def test_ssh_session_not_reused(self):
+        self.node._get_remote_host_system_statistics(["hostname"])
+        self.conn.isalive.return_value = False
+        self.node._get_remote_host_system_statistics(["hostname"])
+
+        self.assertEqual(self.create_ssh_connection.call_count, 2)
+
+        self.conn.isalive.return_value = True
+        self.node.sys_default_user_id = "other"
+        self.node._get_remote_host_system_statistics(["hostname"])
+
+        self.assertEqual(self.create_ssh_connection.call_count, 3)
+
+    def test_stale_ssh_session_retried(self):
+        self.node._get_remote_host_system_statistics(["hostname"])
+        self.execute_script.side_effect = iter(
+            [EOFError(), run_system_script(None, [], 1)]
+        )
+        self.node._get_remote_host_system_statistics(["hostname"])
+
+        self.assertEqual(self.create_ssh_connection.call_count, 2)
+        self.assertEqual(self.execute_script.call_count, 3)
+
+    @patch("lib.live_cluster.client.node.util.shell_command")
+    def test_get_localhost_system_statistics(self, shell_command):
+        outputs = {
+            "false": ("", "error"),
+            "echo host1 host2": ("host1 host2\n", ""),
+            "echo Linux host": ("Linux host\n", ""),
+        }
+        shell_command.side_effect = lambda cmd, timeout=None: outputs[cmd[0]]
+
+        self.node._get_localhost_system_statistics(["uname", "df", "hostname"])
+
+        self.assertEqual(
+            self.parse.call_args_list,
+            [
+                call("hostname", "host1 host2\n", {}),
+                call("uname", "Linux host\n", {}),
+            ],
+        )
+        self.assertNotIn(
+            call([""], timeout=node_module.SYS_CMD_TIMEOUT),
+            shell_command.call_args_list,
+        )
+
+    def test_reconnect_keeps_ssh_session(self):
+        self.node._get_remote_host_system_statistics(["hostname"])
+        close_connections = patch.object(
+            self.node, "_close_connections", wraps=self.node._close_connections
+        ).start()
+
+        Node.info_build_version.return_value = "5.2.0.4"
+
+        with patch.object(Node, "_info_cinfo", return_value="A00000000000000"):
+            self.node.refresh_connection()
+
+        self.assertTrue(self.node.alive)
+
+        close_connections.assert_called_once()
+        self.conn.logout.assert_not_called()
+        self.assertIs(self.node._ssh_session, self.conn)
+
+    def test_close_stops_ssh_session(self):
+        self.node._get_remote_host_system_statistics(["hostname"])
+
+        self.node.close()
+
+        self.conn.logout.assert_called_once()
+        self.assertIsNone(self.node._ssh_session)
+
+
 if __name__ == "__main__":
     unittest.main()
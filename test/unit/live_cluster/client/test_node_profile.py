@@ -0,0 +1,41 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2 as unittest
+
+from lib.live_cluster.client.node_profile import NodeProfile
+
+
+class NodeProfileTest(unittest.TestCase):
+    def test_empty_profile(self):
+        profile = NodeProfile(build=IOError("boom"), features=None)
+
+        self.assertEqual(profile.build, "")
+        self.assertEqual(profile.features, "")
+        self.assertFalse(profile.xdr5)
+        self.assertFalse(profile.new_histogram_version)
+        self.assertFalse(profile.new_latencies_version)
+        self.assertFalse(profile.has_feature("peers"))
+
+    def test_version_flags(self):
+        profile = NodeProfile(build="4.9.0.3", edition="Aerospike Enterprise Edition")
+
+        self.assertFalse(profile.xdr5)
+        self.assertTrue(profile.new_histogram_version)
+        self.assertFalse(profile.new_latencies_version)
+
+        profile = NodeProfile(build="10.0.0.1")
+
+        self.assertTrue(profile.xdr5)
+        self.assertTrue(profile.new_latencies_version)
@@ -0,0 +1,128 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2 as unittest
+from mock import Mock, patch
+
+from lib.live_cluster.client.socket_pool import SocketPool
+
+
+class SocketPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.time_mock = patch(
+            "lib.live_cluster.client.socket_pool.time", return_value=100.0
+        ).start()
+        self.pool = SocketPool(
+            max_size=2, min_size=0, idle_timeout=10.0, max_lifetime=60.0
+        )
+        self.addCleanup(patch.stopall)
+
+    def get_socket(self, created_at=95.0, last_used=95.0, alive=True):
+        sock = Mock()
+        sock.created_at = created_at
+        sock.last_used = last_used
+        sock.is_alive.return_value = alive
+        return sock
+
+    def test_get_empty(self):
+        self.assertIsNone(self.pool.get())
+        self.assertEqual(self.pool.misses, 1)
+
+    def test_put_and_get(self):
+        sock1 = self.get_socket()
+        sock2 = self.get_socket()
+
+        self.pool.put(sock1)
+        self.pool.put(sock2)
+
+        self.assertEqual(len(self.pool), 2)
+        self.assertIs(self.pool.get(), sock2)
+        self.assertIs(self.pool.get(), sock1)
+        self.assertEqual(self.pool.hits, 2)
+
+    def test_put_closes_when_full(self):
+        socks = [self.get_socket() for _ in range(3)]
+
+        for sock in socks:
+            self.pool.put(sock)
+
+        self.assertEqual(len(self.pool), 2)
+        socks[2].close.assert_called_once()
+        self.assertEqual(self.pool.evictions, 1)
+
+    def test_put_closes_expired(self):
+        sock = self.get_socket(created_at=10.0)
+
+        self.pool.put(sock)
+
+        self.assertEqual(len(self.pool), 0)
+        sock.close.assert_called_once()
+
+    def test_get_skips_dead_connection(self):
+        alive = self.get_socket()
+        dead = self.get_socket(alive=False)
+        self.pool.put(alive)
+        self.pool.put(dead)
+
+        self.assertIs(self.pool.get(), alive)
+        dead.close.assert_called_once()
+        self.assertEqual(self.pool.evictions, 1)
+
+    def test_idle_eviction(self):
+        idle = self.get_socket(last_used=80.0)
+        self.pool.put(idle)
+
+        self.assertIsNone(self.pool.get())
+        idle.close.assert_called_once()
+        self.assertEqual(self.pool.evictions, 1)
+
+    def test_idle_eviction_respects_min_size(self):
+        self.pool.min_size = 1
+        idle = self.get_socket(last_used=80.0)
+        self.pool.put(idle)
+
+        self.assertIs(self.pool.get(), idle)
+        idle.close.assert_not_called()
+
+    def test_close(self):
+        sock = self.get_socket()
+        self.pool.put(sock)
+
+        self.pool.close()
+
+        self.assertEqual(len(self.pool), 0)
+        sock.close.assert_called_once()
+
+    def test_get_statistics(self):
+        self.pool.record_connect(0.002)
+        self.pool.record_connect(0.004)
+        self.pool.record_connect(1.0, success=False)
+        self.pool.put(self.get_socket())
+        self.pool.get()
+        self.pool.get()
+
+        expected = {
+            "idle": 0,
+            "max-size": 2,
+            "min-size": 0,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "connects": 2,
+            "connect-failures": 1,
+            "avg-connect-ms": 3.0,
+            "max-connect-ms": 4.0,
+        }
+
+        self.assertDictEqual(self.pool.get_statistics(), expected)
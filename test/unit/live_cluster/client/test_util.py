@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import threading
 import unittest
 import time
+import weakref
 
 from lib.utils import timeout
 from lib.live_cluster.client import client_util
@@ -46,6 +49,26 @@ class UtilTest(unittest.TestCase):
             result, expected, "info_to_dict did not return the expected result"
         )
 
+    def test_info_to_dict_duplicate_keys(self):
+        value = "a=2;a=1;b=x=y;c;d=1;c=3;d=2;d=0;a=3;e=1;e"
+        expected = {"a": "3", "b": "x", "c": "3", "d": "0,2"}
+
+        result = client_util.info_to_dict(value)
+
+        self.assertEqual(
+            result, expected, "info_to_dict did not return the expected result"
+        )
+
+    def test_info_to_dict_large_response(self):
+        # Shaped like a namespace/<ns> response.
+        value = ";".join("stat-%d=%d" % (i, i * 7919) for i in range(2000))
+
+        result = client_util.info_to_dict(value)
+
+        self.assertEqual(len(result), 2000)
+        self.assertEqual(result["stat-0"], "0")
+        self.assertEqual(result["stat-1999"], str(1999 * 7919))
+
     def test_info_to_dict_multi_level(self):
         value = "ns=test:rack_1=BCD10DFA9290C00,BB910DFA9290C00:rack_2=BD710DFA9290C00,BC310DFA9290C00;ns=bar:rack_1=BD710DFA9290C00,BB910DFA9290C00:rack_2=BC310DFA9290C00,BCD10DFA9290C00"
         expected = {
@@ -203,6 +226,11 @@ class UtilTest(unittest.TestCase):
             result, expected, "concurrent_map did not return the expected result"
         )
 
+        result = client_util.concurrent_map(lambda v: 1 // v, [1, 0])
+        self.assertEqual(
+            result, [1, None], "concurrent_map did not return the expected result"
+        )
+
     def test_cached(self):
         def tester(arg1, arg2, sleep):
             time.sleep(sleep)
@@ -220,6 +248,178 @@ class UtilTest(unittest.TestCase):
         self.assertEqual(5, tester(3, 2, 0.2))
         self.assertRaises(timeout.TimeoutException, tester, 1, 2, 5)
 
+    def test_cached_lru(self):
+        calls = []
+
+        def tester(arg):
+            calls.append(arg)
+            return "x" * arg
+
+        tester = client_util.cached(tester, ttl=5.0, max_entries=2, max_bytes=10)
+
+        tester(1)
+        tester(2)
+        tester(1)
+        tester(3)  # evicts 2, the least recently used entry
+        tester(1)
+        tester(2)
+
+        self.assertEqual(calls, [1, 2, 3, 2])
+        tester(8)  # over max_bytes, evicts until the size fits
+        self.assertLessEqual(tester.size, 10)
+
+        stats = tester.get_statistics()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 5)
+        self.assertEqual(stats["evictions"], 3)
+
+    def test_cached_ttl_policy(self):
+        calls = []
+
+        def tester(arg):
+            calls.append(arg)
+            return arg
+
+        tester = client_util.cached(
+            tester, ttl_policy=lambda arg: 5.0 if arg == "static" else 0
+        )
+
+        tester("static")
+        tester("static")
+        tester("counter")
+        tester("counter")
+
+        self.assertEqual(calls, ["static", "counter", "counter"])
+
+    def test_cached_single_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def tester(arg):
+            calls.append(arg)
+            started.set()
+            release.wait(5)
+            return arg * 2
+
+        tester = client_util.cached(tester, ttl=5.0)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(tester(2)))
+            for _ in range(5)
+        ]
+
+        threads[0].start()
+        started.wait(5)
+
+        for t in threads[1:]:
+            t.start()
+
+        while tester.get_statistics()["coalesced"] < 4:
+            time.sleep(0.001)
+
+        release.set()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(calls, [2])
+        self.assertEqual(results, [4] * 5)
+
+    def test_cached_single_flight_exception(self):
+        def tester(arg):
+            raise IOError("test-message")
+
+        tester = client_util.cached(tester, ttl=5.0)
+
+        self.assertRaises(IOError, tester, 1)
+        self.assertRaises(IOError, tester, 1)
+        self.assertEqual(tester.get_statistics()["misses"], 2)
+
+    def test_cached_owner(self):
+        calls = []
+
+        def tester(owner, arg):
+            calls.append((owner, arg))
+            return arg
+
+        class Owner(object):
+            pass
+
+        tester = client_util.cached(tester, ttl=5.0)
+        owner1 = Owner()
+        owner2 = Owner()
+
+        tester(owner1, 1)
+        tester(owner1, 1)
+        tester(owner2, 1)
+
+        self.assertEqual(tester.get_statistics(owner1)["hits"], 1)
+        self.assertEqual(tester.get_statistics(owner1)["entries"], 1)
+        self.assertEqual(tester.get_statistics(owner2)["misses"], 1)
+        self.assertEqual(tester.get_statistics()["entries"], 2)
+
+        tester.clear(owner1)
+        tester(owner1, 1)
+        tester(owner2, 1)
+
+        self.assertEqual(calls, [(owner1, 1), (owner2, 1), (owner1, 1)])
+        self.assertEqual(tester.get_statistics(owner1)["misses"], 2)
+        self.assertEqual(tester.get_statistics(Owner())["entries"], 0)
+        self.assertEqual(tester.get_statistics(Owner())["hits"], 0)
+
+    def test_cached_owner_counters_go_away_with_owner(self):
+        class Owner(object):
+            pass
+
+        tester = client_util.cached(lambda owner, arg: arg, ttl=5.0)
+        owner = Owner()
+        owner_ref = weakref.ref(owner)
+        tester(owner, 1)
+        tester.clear(owner)
+
+        self.assertEqual(tester.get_statistics(owner)["misses"], 1)
+
+        del owner
+        gc.collect()
+
+        self.assertIsNone(owner_ref())
+        # Owners without attributes are only counted in the totals.
+        tester("owner", 1)
+        self.assertEqual(tester.get_statistics("owner")["misses"], 0)
+        self.assertEqual(tester.get_statistics()["misses"], 2)
+
+    def test_cached_clear_owner_with_changed_hash(self):
+        class Owner(object):
+            def __init__(self, key):
+                self.key = key
+
+            def __hash__(self):
+                return hash(self.key)
+
+            def __eq__(self, other):
+                return self.key == other.key
+
+        tester = client_util.cached(lambda owner, arg: arg, ttl=5.0)
+        owner = Owner("a")
+        tester(owner, 1)
+        owner.key = "b"
+
+        tester.clear(Owner("b"))
+
+        self.assertEqual(tester.get_statistics()["entries"], 0)
+        self.assertEqual(tester.size, 0)
+
+    def test_cached_peek(self):
+        tester = client_util.cached(lambda arg: arg * 2, ttl=5.0)
+
+        self.assertEqual(tester.peek((2,)), (False, None))
+
+        tester[(2,)] = 5
+
+        self.assertEqual(tester.peek((2,)), (True, 5))
+        self.assertEqual(tester(2), 5)
+
     def test_flatten(self):
         value = [
             (("172.17.0.1", 3000, None),),
@@ -17,6 +17,7 @@ import unittest
 from mock import patch
 
 from lib.live_cluster.show_controller import (
+    ShowSocketsController,
     ShowStatisticsController,
     ShowUsersController,
 )
@@ -378,3 +379,57 @@ class ShowUsersControllerTest(unittest.TestCase):
         self.getter_mock.get_users.assert_called_with(nodes=["test-principal"])
         self.view_mock.assert_not_called()
 
+
+
+class ShowSocketsControllerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patch("lib.live_cluster.live_cluster_root_controller.Cluster").start()
+        self.root_controller = LiveClusterRootController()
+        self.controller = ShowSocketsController()
+        self.cluster_mock = patch(
+            "lib.live_cluster.show_controller.ShowSocketsController.cluster"
+        ).start()
+        self.view_mock = patch(
+            "lib.base_controller.BaseController.view.show_stats"
+        ).start()
+
+        self.addCleanup(patch.stopall)
+
+    def test_default(self):
+        self.cluster_mock.get_socket_pool_statistics.return_value = {
+            "1.1.1.1": {3000: {"hits": 1}, 3004: {"hits": 2}},
+            "2.2.2.2": {3000: {"hits": 3}},
+            "3.3.3.3": IOError("test-message"),
+        }
+        self.cluster_mock.get_info_cache_statistics.return_value = {
+            "1.1.1.1": {"hits": 4, "entries": 1},
+            "3.3.3.3": IOError("test-message"),
+        }
+
+        self.controller.execute(["with", "1.1.1.1", "-flip"])
+
+        self.cluster_mock.get_socket_pool_statistics.assert_called_with(
+            nodes=["1.1.1.1"]
+        )
+        self.cluster_mock.get_info_cache_statistics.assert_called_with(
+            nodes=["1.1.1.1"]
+        )
+        self.assertEqual(self.view_mock.call_count, 3)
+        self.view_mock.assert_any_call(
+            "Info Cache Statistics",
+            {"1.1.1.1": {"hits": 4, "entries": 1}},
+            self.cluster_mock,
+            flip_output=True,
+            like=[],
+            line=[],
+            **{"with": ["1.1.1.1"]},
+        )
+        self.view_mock.assert_any_call(
+            "Port 3000 Socket Pool Statistics",
+            {"1.1.1.1": {"hits": 1}, "2.2.2.2": {"hits": 3}},
+            self.cluster_mock,
+            flip_output=True,
+            like=[],
+            line=[],
+            **{"with": ["1.1.1.1"]},
+        )
@@ -1,7 +1,11 @@
 import unittest
 from mock import Mock, patch
 
-from lib.get_controller import GetPmapController
+from lib.get_controller import (
+    GetPmapController,
+    GetStatisticsController,
+    get_sindex_stats,
+)
 
 
 class GetPmapControllerTest(unittest.TestCase):
@@ -91,3 +95,78 @@ class GetPmapControllerTest(unittest.TestCase):
         expected_output["10.71.71.169:3000"]["test"]["unavailable_partitions"] = "0"
         actual_output = self.controller.get_pmap()
         self.assertEqual(expected_output, actual_output)
+
+    def test_get_pmap_data_ignores_illegal_partition_ids(self):
+        self.partition_info = {
+            "10.71.71.169:3000": "namespace:partition:state:replica:n_dupl:working_master:emigrates:immigrates:records:tombstones:version:final_version;"
+            "test:0:S:0:0:BB93039BC7AC40C:0:0:0:0:0:0;test:4096:S:0:0:BB93039BC7AC40C:0:0:0:0:0:0;"
+            "bar:1:S:1:0:BB93039BC7AC40D:0:0:0:0:0:0"
+        }
+        expected_output = {
+            "10.71.71.169:3000": {
+                "test": {
+                    "cluster_key": "ck",
+                    "master_partition_count": 1,
+                    "prole_partition_count": 0,
+                    "dead_partitions": "2000",
+                    "unavailable_partitions": "0",
+                },
+                "bar": {
+                    "cluster_key": "ck",
+                    "master_partition_count": 0,
+                    "prole_partition_count": 1,
+                },
+            }
+        }
+
+        with patch("builtins.print") as print_mock:
+            actual_output = self.controller.get_pmap()
+
+        print_mock.assert_called_once()
+        self.assertEqual(expected_output, actual_output)
+
+
+class GetSindexStatsTest(unittest.TestCase):
+    def test_get_sindex_stats(self):
+        cluster = Mock()
+        sindex = {"ns": "test", "set": "demo", "indexname": "idx", "bin": "a"}
+        other = {"ns": "bar", "set": "NULL", "indexname": "idx2", "bin": "b"}
+        cluster.info_sindex.return_value = {
+            "1.1.1.1:3000": [sindex, other],
+            "2.2.2.2:3000": [sindex],
+        }
+        cluster.info_all_sindex_statistics.return_value = {
+            "1.1.1.1:3000": {("test", "idx"): {"keys": "1"}, ("bar", "idx2"): {}},
+            "2.2.2.2:3000": IOError("timeout"),
+        }
+
+        actual = get_sindex_stats(cluster, for_mods=["test"])
+
+        cluster.info_all_sindex_statistics.assert_called_once_with(
+            [("test", "idx")], nodes="all"
+        )
+        self.assertEqual(list(actual.keys()), ["test demo idx"])
+        self.assertDictEqual(
+            actual["test demo idx"]["1.1.1.1:3000"],
+            {"keys": "1", "ns": "test", "set": "demo", "indexname": "idx", "bin": "a"},
+        )
+        self.assertIsInstance(actual["test demo idx"]["2.2.2.2:3000"], IOError)
+
+
+class GetStatisticsControllerTest(unittest.TestCase):
+    def test_get_service_with_collection_times(self):
+        cluster = Mock()
+        cluster.info_timed_statistics.return_value = {
+            "1.1.1.1:3000": (1600000000.5, {"cs": "2"}),
+            "2.2.2.2:3000": IOError("timeout"),
+        }
+        collection_times = {}
+
+        actual = GetStatisticsController(cluster).get_service(
+            collection_times=collection_times
+        )
+
+        cluster.info_statistics.assert_not_called()
+        self.assertEqual(actual["1.1.1.1:3000"], {"cs": "2"})
+        self.assertIsInstance(actual["2.2.2.2:3000"], IOError)
+        self.assertEqual(collection_times, {"1.1.1.1:3000": 1600000000.5})
@@ -0,0 +1,103 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest2 as unittest
+from mock import call, patch
+
+from lib.utils import common
+
+
+class CollectinfoJsonWriterTest(unittest.TestCase):
+    snapshots = [
+        ("2021-01-01 00:00:00 UTC", {"cluster": {"node1": {"as_stat": {"a": 1}}}}),
+        ("2021-01-01 00:00:05 UTC", {"cluster": {"node1": {"as_stat": {"a": 2}}}}),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "ascinfo.json")
+
+    def write_snapshots(self, **kwargs):
+        with common.CollectinfoJsonWriter(self.path, **kwargs) as writer:
+            for timestamp, snapshot in self.snapshots:
+                writer.write(timestamp, snapshot)
+
+        self.assertEqual(writer.snapshot_count, len(self.snapshots))
+        return writer.path
+
+    def test_write(self):
+        path = self.write_snapshots()
+
+        self.assertEqual(path, self.path)
+
+        with open(path) as f:
+            content = f.read()
+
+        self.assertEqual(json.loads(content), dict(self.snapshots))
+        self.assertIn("\n    ", content)
+
+    def test_write_compact(self):
+        path = self.write_snapshots(compact=True)
+
+        with open(path) as f:
+            content = f.read()
+
+        self.assertEqual(json.loads(content), dict(self.snapshots))
+        self.assertNotIn("\n", content)
+
+    def test_write_compressed(self):
+        path = self.write_snapshots(compress=True)
+
+        self.assertEqual(path, self.path + ".gz")
+
+        with gzip.open(path, "rt") as f:
+            self.assertEqual(json.load(f), dict(self.snapshots))
+
+    def test_write_nothing(self):
+        with common.CollectinfoJsonWriter(self.path):
+            pass
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {})
+
+
+class CollectinfoContentTest(unittest.TestCase):
+    def test_without_timeout(self):
+        def func(cmd):
+            return "out", None
+
+        o, failed_cmds = common._collectinfo_content(func)
+
+        self.assertIn("out", o)
+        self.assertEqual(failed_cmds, [])
+
+    @patch("lib.utils.util.shell_command")
+    def test_timeout_is_passed_to_alternatives(self, shell_command):
+        shell_command.side_effect = [(None, "failed"), ("alt out", None)]
+
+        o, failed_cmds = common._collectinfo_content(
+            shell_command, ["cmd"], ["alt"], timeout=5
+        )
+
+        self.assertEqual(
+            shell_command.call_args_list,
+            [call(["cmd"], timeout=5), call(["alt"], timeout=5)],
+        )
+        self.assertIn("alt out", o)
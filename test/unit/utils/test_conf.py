@@ -0,0 +1,43 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2 as unittest
+from mock import Mock
+
+from lib.utils import conf
+
+
+class ValidatePoolOptionsTest(unittest.TestCase):
+    def validate(self, **options):
+        asadm_dict = conf._flatten(conf._getdefault(None))
+        asadm_dict.update(options)
+        logger = Mock()
+
+        conf._validate_pool_options(asadm_dict, logger)
+
+        return logger.critical.call_args_list
+
+    def test_defaults(self):
+        self.assertEqual(self.validate(), [])
+
+    def test_invalid_values(self):
+        for options in (
+            {"pool_max_size": 0},
+            {"pool_min_size": -1},
+            {"thread_pool_size": 0},
+            {"pool_idle_timeout": 0},
+            {"pool_max_lifetime": -5},
+            {"pool_min_size": 4, "pool_max_size": 3},
+        ):
+            self.assertEqual(len(self.validate(**options)), 1, options)
@@ -0,0 +1,110 @@
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest2 as unittest
+
+from lib.utils import thread_pool
+
+
+class ThreadPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.max_workers = thread_pool.get_max_workers()
+        self.addCleanup(thread_pool.set_max_workers, self.max_workers)
+
+    def test_task_result(self):
+        task = thread_pool.Task(lambda a, b=0: a + b, 1, b=2).start()
+
+        self.assertEqual(task.result(), 3)
+        self.assertTrue(task.done())
+
+    def test_task_raises(self):
+        def func():
+            raise IOError("test-message")
+
+        task = thread_pool.Task(func).start()
+
+        self.assertRaises(IOError, task.result)
+
+    def test_task_runs_in_caller_if_not_started(self):
+        task = thread_pool.Task(threading.current_thread)
+
+        self.assertIs(task.result(), threading.current_thread())
+
+    def test_task_result_timeout(self):
+        started = threading.Event()
+        event = threading.Event()
+
+        def func():
+            started.set()
+            return event.wait(5)
+
+        task = thread_pool.Task(func).start()
+        started.wait(5)
+
+        self.assertRaises(thread_pool.TaskTimeoutError, task.result, 0.01)
+        event.set()
+        self.assertTrue(task.result())
+
+    def test_task_cancel(self):
+        task = thread_pool.Task(lambda: 1)
+
+        self.assertTrue(task.cancel())
+        self.assertTrue(task.cancelled())
+        self.assertRaises(thread_pool.CancelledError, task.result)
+
+    def test_task_deadline(self):
+        task = thread_pool.Task(lambda: 1, deadline=time.time() - 1)
+
+        self.assertRaises(thread_pool.TaskTimeoutError, task.result)
+
+    def test_nested_tasks_do_not_deadlock(self):
+        thread_pool.set_max_workers(2)
+
+        def outer(value):
+            return sum(thread_pool.concurrent_map(lambda v: v * value, range(10)))
+
+        result = thread_pool.concurrent_map(outer, list(range(10)))
+
+        self.assertEqual(result, [45 * v for v in range(10)])
+
+    def test_nested_tasks_with_timeout(self):
+        thread_pool.set_max_workers(2)
+
+        def outer(value):
+            return sum(
+                thread_pool.concurrent_map(lambda v: v * value, range(10), timeout=5)
+            )
+
+        result = thread_pool.concurrent_map(outer, list(range(10)), timeout=5)
+
+        self.assertEqual(result, [45 * v for v in range(10)])
+
+    def test_concurrent_map_timeout(self):
+        # Calls which run in the caller are bounded by the timeout too.
+        self.assertRaises(
+            thread_pool.TaskTimeoutError,
+            thread_pool.concurrent_map,
+            time.sleep,
+            [0.2, 0.2],
+            timeout=0.01,
+        )
+
+    def test_set_max_workers(self):
+        thread_pool.set_max_workers(3)
+
+        self.assertEqual(thread_pool.get_max_workers(), 3)
+        self.assertEqual(thread_pool.get_executor()._max_workers, 3)
+        self.assertRaises(ValueError, thread_pool.set_max_workers, 0)
@@ -1,4 +1,6 @@
+import time
 import unittest2 as unittest
+from mock import MagicMock, patch
 
 from lib.utils import util
 
@@ -36,3 +38,28 @@ class UtilTest(unittest.TestCase):
             "8.9",
             "get_value_from_dict did not return the expected result",
         )
+
+    def test_shell_command(self):
+        out, err = util.shell_command(["echo out; echo err >&2"])
+
+        self.assertEqual(out, "out\n")
+        self.assertEqual(err, "err\n")
+
+    def test_shell_command_limit(self):
+        slots = MagicMock()
+
+        with patch.object(util, "_shell_command_slots", slots):
+            util.shell_command(["true"])
+            slots.__enter__.assert_not_called()
+
+            util.shell_command(["true"], timeout=5)
+            slots.__enter__.assert_called_once()
+
+    def test_shell_command_timeout(self):
+        start = time.time()
+
+        out, err = util.shell_command(["echo partial; sleep 10 | cat"], timeout=0.5)
+
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(out, "partial\n")
+        self.assertIn("Timed out after 0.5 seconds", err)